@@ -29,6 +29,7 @@ from PySide6.QtWidgets import (
 
 from core.models import CreatorInputs
 from core.package_builder import build_content_package
+from ui.tasks import CancelToken, Progress, TaskRunner
 from utils.io import load_json, save_json
 from utils.logger import info
 from utils.paths import (
@@ -37,20 +38,30 @@ from utils.paths import (
     get_outputs_dir,
     get_repo_schema_path
 )
-from utils.validators import validate_blog_url, validate_content_package, validate_slug
-from utils.blog_index import load_latest_blog_themes
+from utils.validators import validate_blog_url, validate_content_package, validate_slug, warm_validator_cache
+from utils.blog_index import BlogCorpusIndex, BlogTheme, load_blog_corpus_index
+from utils.blog_watcher import BlogIndexWatcher
+from utils.journal import load_journaled, save_journaled
+from utils.save_service import SaveService
 
 
 class MainWindow(QWidget):
+    blog_index_changed = Signal()
+    theme_draft_saved = Signal(str, bool, str, bool)
+
     def __init__(self) -> None:
         super().__init__()
         self.setWindowTitle("creator-app")
         self.resize(1000, 800)
 
         self.schema_path = get_repo_schema_path()
+        warm_validator_cache(self.schema_path)
         ensure_app_dirs()
 
         self._latest_themes: list[dict] = []
+        self._blog_index: BlogCorpusIndex | None = None
+        self._blog_watcher: BlogIndexWatcher | None = None
+        self.blog_index_changed.connect(self._handle_blog_index_changed)
         self._theme_state = {
             "niche_context": "tech career skills that pay",
             "target_audience": "international audience in English; developers and career changers",
@@ -62,10 +73,14 @@ class MainWindow(QWidget):
             "suggested_themes": []
         }
         self._theme_draft_path: Path | None = None
+        self._save_service = SaveService()
+        self.theme_draft_saved.connect(self._handle_theme_draft_saved)
         self._theme_autosave_timer = QTimer(self)
         self._theme_autosave_timer.setSingleShot(True)
         self._theme_autosave_timer.timeout.connect(self._autosave_theme_draft)
         self._theme_dialog: ThemeGeneratorDialog | None = None
+        self._tasks = TaskRunner(self)
+        self._tasks.busy_changed.connect(self._handle_busy_changed)
 
         self.theme_input = QLineEdit()
         self.theme_input.setPlaceholderText("e.g., 'Top Tech Skills That Pay in 2026'")
@@ -82,6 +97,9 @@ class MainWindow(QWidget):
         self.theme_load_draft_button = QPushButton("Load Draft")
         self.theme_load_draft_button.clicked.connect(self._load_theme_draft)
 
+        self.latest_category = QComboBox()
+        self.latest_category.addItem("All categories")
+        self.latest_category.currentIndexChanged.connect(self._handle_latest_category_changed)
         self.latest_themes_list = QListWidget()
         self.latest_themes_list.itemClicked.connect(self._handle_latest_theme_clicked)
         self.copy_latest_themes_button = QPushButton("Copy list")
@@ -180,6 +198,11 @@ class MainWindow(QWidget):
         layout.addLayout(buttons)
 
         layout.addWidget(QLabel("Latest blog themes (EN)"))
+        filter_row = QHBoxLayout()
+        filter_row.addWidget(QLabel("Category"))
+        filter_row.addWidget(self.latest_category)
+        filter_row.addStretch(1)
+        layout.addLayout(filter_row)
         self.latest_themes_list.setMinimumHeight(200)
         layout.addWidget(self.latest_themes_list)
         copy_row = QHBoxLayout()
@@ -190,6 +213,9 @@ class MainWindow(QWidget):
         layout.addStretch(1)
         return container
 
+    def _show_error(self, title: str, message: str) -> None:
+        QMessageBox.critical(self, title, message)
+
     def _handle_theme_next(self) -> None:
         theme = self.theme_input.text().strip()
         if not theme:
@@ -217,15 +243,92 @@ class MainWindow(QWidget):
         self._set_step(1)
 
     def _handle_import_latest_themes(self) -> None:
-        themes = load_latest_blog_themes(limit=20)
+        # Scanning the blog posts can take a while on a cold cache; it runs off the GUI thread.
+        def work(token: CancelToken, report: Progress) -> BlogCorpusIndex:
+            report(0, "Loading blog index")
+            return load_blog_corpus_index()
+
+        self._tasks.start(
+            "latest-themes",
+            work,
+            self._apply_blog_index,
+            on_error=lambda message: QMessageBox.critical(
+                self, "Blog index error", f"Failed to load blog themes: {message}"
+            ),
+            on_cancelled=lambda: info("Blog theme import cancelled.")
+        )
+
+    def _apply_blog_index(self, blog_index: BlogCorpusIndex) -> None:
+        self._blog_index = blog_index
+        self._watch_blog_index()
+        self._set_latest_categories(self._blog_index.categories(locale="en"))
+        themes = self._query_latest_themes()
         if not themes:
             QMessageBox.warning(self, "No themes", "No recent themes were found.")
             return
+        self._apply_latest_themes(themes)
+
+    def _handle_busy_changed(self, busy: bool) -> None:
+        self.theme_import_button.setEnabled(not busy)
+        if self._theme_dialog is not None:
+            self._theme_dialog.import_latest_button.setEnabled(not busy)
+
+    def _watch_blog_index(self) -> None:
+        if self._blog_watcher:
+            self._blog_watcher.stop()
+            self._blog_watcher = None
+        if self._blog_index is None or self._blog_index.posts_root is None:
+            return
+        # The watcher calls back from its own thread; the signal hands the update to the GUI thread.
+        self._blog_watcher = BlogIndexWatcher(self._blog_index, on_change=lambda _: self.blog_index_changed.emit())
+        self._blog_watcher.start()
+
+    def _handle_blog_index_changed(self) -> None:
+        if self._blog_index is None:
+            return
+        self._set_latest_categories(self._blog_index.categories(locale="en"))
+        self._apply_latest_themes(self._query_latest_themes(), apply_to_avoid=False)
+
+    def closeEvent(self, event) -> None:
+        if self._theme_autosave_timer.isActive():
+            self._theme_autosave_timer.stop()
+            self._autosave_theme_draft()
+        self._save_service.close()
+        self._tasks.cancel()
+        self._tasks.wait()
+        if self._blog_watcher:
+            self._blog_watcher.stop()
+            self._blog_watcher = None
+        super().closeEvent(event)
+
+    def _query_latest_themes(self) -> list[BlogTheme]:
+        if self._blog_index is None:
+            return []
+        category = self.latest_category.currentText() if self.latest_category.currentIndex() > 0 else None
+        return self._blog_index.latest(20, locale="en", category=category)
+
+    def _set_latest_categories(self, categories: list[str]) -> None:
+        current = self.latest_category.currentText()
+        self.latest_category.blockSignals(True)
+        self.latest_category.clear()
+        self.latest_category.addItem("All categories")
+        self.latest_category.addItems(categories)
+        if current in categories:
+            self.latest_category.setCurrentText(current)
+        self.latest_category.blockSignals(False)
+
+    def _handle_latest_category_changed(self) -> None:
+        if self._blog_index is None:
+            return
+        self._apply_latest_themes(self._query_latest_themes())
+
+    def _apply_latest_themes(self, themes: list[BlogTheme], apply_to_avoid: bool = True) -> None:
         self._latest_themes = [theme.__dict__ for theme in themes]
         self._set_latest_themes(self._latest_themes)
         if self._theme_dialog:
             self._theme_dialog.update_latest_themes(self._latest_themes)
-            self._theme_dialog._apply_latest_to_avoid()
+            if apply_to_avoid:
+                self._theme_dialog._apply_latest_to_avoid()
         self._schedule_theme_autosave()
 
     def _set_latest_themes(self, themes: list[dict]) -> None:
@@ -273,7 +376,7 @@ class MainWindow(QWidget):
     def _theme_draft_payload(self) -> dict:
         return {
             "theme": self.theme_input.text().strip(),
-            "latest_themes": self._latest_themes,
+            "latest_themes": list(self._latest_themes),
             "niche_context": self._theme_state.get("niche_context", ""),
             "target_audience": self._theme_state.get("target_audience", ""),
             "monetization_constraints": self._theme_state.get("monetization_constraints", ""),
@@ -281,7 +384,7 @@ class MainWindow(QWidget):
             "avoid_topics": self._theme_state.get("avoid_topics", ""),
             "prompt": self._theme_state.get("prompt", ""),
             "pasted_results": self._theme_state.get("pasted_results", ""),
-            "suggested_themes": self._theme_state.get("suggested_themes", [])
+            "suggested_themes": list(self._theme_state.get("suggested_themes", []) or [])
         }
 
     def _save_theme_draft(self, silent: bool = False) -> None:
@@ -291,9 +394,20 @@ class MainWindow(QWidget):
         if not self._theme_draft_path:
             stamp = translation_key or time.strftime("%Y%m%d-%H%M%S")
             self._theme_draft_path = draft_dir / f"{stamp}-theme.json"
-        if save_json(self._theme_draft_path, self._theme_draft_payload()):
-            if not silent:
-                QMessageBox.information(self, "Saved", f"Draft saved to {self._theme_draft_path}")
+        # Written off the GUI thread as a journal delta; rapid autosaves collapse into the latest one.
+        path = self._theme_draft_path
+        self._save_service.submit(
+            path,
+            self._theme_draft_payload(),
+            on_done=lambda ok, message: self.theme_draft_saved.emit(str(path), ok, message, silent),
+            write=save_journaled
+        )
+
+    def _handle_theme_draft_saved(self, path: str, ok: bool, message: str, silent: bool) -> None:
+        if not ok:
+            self._show_error("Save error", message)
+        elif not silent:
+            QMessageBox.information(self, "Saved", f"Draft saved to {path}")
 
     def _load_theme_draft(self) -> None:
         draft_dir = get_data_dir() / "drafts"
@@ -302,7 +416,7 @@ class MainWindow(QWidget):
         )
         if not file_name:
             return
-        data = load_json(file_name)
+        data = load_journaled(file_name, on_error=self._show_error)
         if not data:
             return
         self.theme_input.setText(data.get("theme", ""))
@@ -468,7 +582,7 @@ class MainWindow(QWidget):
 
         export_dir = get_outputs_dir() / "content-packages"
         path = export_dir / f"{inputs.translation_key}-creator.json"
-        if save_json(path, payload):
+        if save_json(path, payload, on_error=self._show_error):
             QMessageBox.information(self, "Exported", f"Saved to {path}")
             info(f"Exported creator package to {path}")
 
@@ -479,7 +593,7 @@ class MainWindow(QWidget):
             return
         draft_dir = get_data_dir() / "drafts"
         path = draft_dir / f"{inputs.translation_key}-creator.json"
-        save_json(path, build_content_package(inputs))
+        save_json(path, build_content_package(inputs), on_error=self._show_error)
 
     def handle_load_draft(self) -> None:
         draft_dir = get_data_dir() / "drafts"
@@ -488,7 +602,7 @@ class MainWindow(QWidget):
         )
         if not file_name:
             return
-        data = load_json(file_name)
+        data = load_json(file_name, on_error=self._show_error)
         if not data:
             return
         self.translation_key.setText(data.get("meta", {}).get("translationKey", ""))
@@ -1,12 +1,22 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
 from datetime import datetime
+import os
 from pathlib import Path
-from typing import List, Dict, Any
+import threading
+from typing import Any, Dict, Iterable, List, Set, Tuple
 
+from utils.json_backend import dumps, loads
 from utils.logger import warn
-from utils.paths import find_repo_root
+from utils.paths import find_repo_root, get_data_dir
+
+LOCALES = ["en", "pt", "es", "it"]
+INDEX_VERSION = 2
+BLOG_INDEX_WORKERS = min(16, (os.cpu_count() or 1) + 4)
+FRONTMATTER_CHUNK_SIZE = 1024
+FRONTMATTER_MAX_BYTES = 64 * 1024
 
 
 @dataclass
@@ -17,6 +27,8 @@ class BlogTheme:
     category: str
     tags: List[str]
     file_mtime: float
+    locale: str = "en"
+    path: str = ""
 
 
 def _parse_frontmatter(text: str) -> Dict[str, Any]:
@@ -53,6 +65,24 @@ def _parse_frontmatter(text: str) -> Dict[str, Any]:
     return data
 
 
+def read_frontmatter(file_path: Path, max_bytes: int = FRONTMATTER_MAX_BYTES) -> Tuple[str, int]:
+    # Reads the file in small chunks and stops at the closing delimiter, so post bodies are never loaded.
+    buffer = bytearray()
+    with open(file_path, "rb", buffering=0) as handle:
+        while len(buffer) < max_bytes:
+            chunk = handle.read(min(FRONTMATTER_CHUNK_SIZE, max_bytes - len(buffer)))
+            if not chunk:
+                break
+            search_from = max(3, len(buffer) - 2)
+            buffer += chunk
+            if len(buffer) >= 3 and not buffer.startswith(b"---"):
+                return "", len(buffer)
+            end = buffer.find(b"---", search_from)
+            if end != -1:
+                return buffer[:end + 3].decode("utf-8"), len(buffer)
+    return "", len(buffer)
+
+
 def _parse_date(value: str) -> datetime | None:
     for fmt in ("%Y-%m-%d", "%Y-%m-%d %H:%M:%S", "%Y-%m-%dT%H:%M:%S"):
         try:
@@ -62,47 +92,256 @@ def _parse_date(value: str) -> datetime | None:
     return None
 
 
-def load_latest_blog_themes(limit: int = 20) -> List[BlogTheme]:
-    repo_root = find_repo_root()
-    if repo_root is None:
-        warn("Repo root not found. Cannot load latest blog themes.")
-        return []
-    posts_dir = repo_root / "content" / "posts" / "en"
-    if not posts_dir.exists():
-        warn(f"Posts directory not found: {posts_dir}")
-        return []
-
-    themes: List[BlogTheme] = []
-    for file_path in sorted(posts_dir.glob("*.mdx")):
-        try:
-            text = file_path.read_text(encoding="utf-8")
-        except Exception as exc:
-            warn(f"Failed to read {file_path}: {exc}")
-            continue
-        meta = _parse_frontmatter(text)
-        title = str(meta.get("title", "")).strip()
-        if not title:
+def get_blog_index_path() -> Path:
+    return get_data_dir() / "blog-index.json"
+
+
+def _load_index(index_path: Path, posts_root: Path) -> Dict[str, Dict[str, Any]]:
+    if not index_path.exists():
+        return {}
+    try:
+        data = loads(index_path.read_bytes())
+    except Exception as exc:
+        warn(f"Failed to read blog index {index_path}: {exc}")
+        return {}
+    if not isinstance(data, dict) or data.get("version") != INDEX_VERSION or data.get("postsRoot") != str(posts_root):
+        return {}
+    entries = data.get("entries", {})
+    return entries if isinstance(entries, dict) else {}
+
+
+def _save_index(index_path: Path, posts_root: Path, entries: Dict[str, Dict[str, Any]]) -> None:
+    payload = {"version": INDEX_VERSION, "postsRoot": str(posts_root), "entries": entries}
+    temp_path = index_path.with_name(f"{index_path.name}.tmp")
+    try:
+        index_path.parent.mkdir(parents=True, exist_ok=True)
+        with temp_path.open("wb") as handle:
+            handle.write(dumps(payload, compact=True))
+        os.replace(temp_path, index_path)
+    except Exception as exc:
+        warn(f"Failed to save blog index {index_path}: {exc}")
+
+
+def _scan_post(file_path: Path, mtime: float, locale: str, key: str) -> Dict[str, Any] | None:
+    header, _ = read_frontmatter(file_path)
+    meta = _parse_frontmatter(header)
+    title = str(meta.get("title", "")).strip()
+    if not title:
+        return None
+    tags = meta.get("tags", []) if isinstance(meta.get("tags", []), list) else []
+    return asdict(
+        BlogTheme(
+            title=title,
+            translation_key=str(meta.get("translationKey", "")).strip(),
+            date=str(meta.get("date", "")).strip(),
+            category=str(meta.get("category", "")).strip(),
+            tags=tags,
+            file_mtime=mtime,
+            locale=locale,
+            path=key
+        )
+    )
+
+
+def _index_post(post: Tuple[str, str, str, os.stat_result]) -> Dict[str, Any] | None:
+    path, locale, key, stat = post
+    try:
+        theme = _scan_post(Path(path), stat.st_mtime, locale, key)
+    except Exception as exc:
+        warn(f"Failed to read {path}: {exc}")
+        return None
+    return {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size, "theme": theme}
+
+
+def refresh_blog_index(
+    posts_root: Path,
+    index_path: Path | None = None,
+    locales: Iterable[str] = LOCALES,
+    workers: int = BLOG_INDEX_WORKERS
+) -> Dict[str, BlogTheme]:
+    # Warm refresh costs one stat per post: only new or changed files are re-parsed.
+    index_path = index_path or get_blog_index_path()
+    entries = _load_index(index_path, posts_root)
+    fresh: Dict[str, Dict[str, Any]] = {}
+    pending: List[Tuple[str, str, str, os.stat_result]] = []
+
+    for locale in locales:
+        locale_dir = posts_root / locale
+        if not locale_dir.is_dir():
             continue
-        translation_key = str(meta.get("translationKey", "")).strip()
-        date_value = str(meta.get("date", "")).strip()
-        category = str(meta.get("category", "")).strip()
-        tags = meta.get("tags", []) if isinstance(meta.get("tags", []), list) else []
-        themes.append(
-            BlogTheme(
-                title=title,
-                translation_key=translation_key,
-                date=date_value,
-                category=category,
-                tags=tags,
-                file_mtime=file_path.stat().st_mtime
-            )
+        with os.scandir(locale_dir) as scanner:
+            for item in scanner:
+                if not item.name.endswith(".mdx") or not item.is_file():
+                    continue
+                key = f"{locale}/{item.name}"
+                stat = item.stat()
+                cached = entries.get(key)
+                if cached and cached.get("mtime_ns") == stat.st_mtime_ns and cached.get("size") == stat.st_size:
+                    fresh[key] = cached
+                else:
+                    pending.append((item.path, locale, key, stat))
+
+    # Header reads for new or changed posts run on a bounded pool; map() keeps them in path order.
+    pending.sort(key=lambda post: post[2])
+    if workers > 1 and len(pending) > 1:
+        with ThreadPoolExecutor(max_workers=min(workers, len(pending))) as executor:
+            results = list(executor.map(_index_post, pending))
+    else:
+        results = [_index_post(post) for post in pending]
+    for post, entry in zip(pending, results):
+        if entry is not None:
+            fresh[post[2]] = entry
+
+    if pending or len(fresh) != len(entries):
+        _save_index(index_path, posts_root, fresh)
+
+    return {
+        key: BlogTheme(**fresh[key]["theme"])
+        for key in sorted(fresh)
+        if fresh[key].get("theme")
+    }
+
+
+def _theme_sort_key(item: BlogTheme) -> datetime:
+    parsed = _parse_date(item.date)
+    if parsed:
+        return parsed
+    return datetime.fromtimestamp(item.file_mtime)
+
+
+def _norm(value: str) -> str:
+    return value.strip().casefold()
+
+
+class BlogCorpusIndex:
+    def __init__(self, themes: Dict[str, BlogTheme] | None = None, posts_root: Path | None = None) -> None:
+        self.posts_root = posts_root
+        self._lock = threading.RLock()
+        self._themes: Dict[str, BlogTheme] = {}
+        self._by_tag: Dict[str, Set[str]] = {}
+        self._by_category: Dict[str, Set[str]] = {}
+        self._by_translation_key: Dict[str, Dict[str, str]] = {}
+        self._sorted: Dict[Tuple[str, ...], List[BlogTheme]] = {}
+        for key in sorted(themes or {}):
+            self.add(key, themes[key])
+
+    def __len__(self) -> int:
+        return len(self._themes)
+
+    def add(self, key: str, theme: BlogTheme) -> None:
+        with self._lock:
+            if key in self._themes:
+                self.remove(key)
+            self._themes[key] = theme
+            for tag in theme.tags:
+                self._by_tag.setdefault(_norm(tag), set()).add(key)
+            if theme.category:
+                self._by_category.setdefault(_norm(theme.category), set()).add(key)
+            if theme.translation_key:
+                self._by_translation_key.setdefault(theme.translation_key, {})[theme.locale] = key
+            self._sorted.clear()
+
+    def remove(self, key: str) -> None:
+        with self._lock:
+            theme = self._themes.pop(key, None)
+            if theme is None:
+                return
+            for tag in theme.tags:
+                _discard(self._by_tag, _norm(tag), key)
+            if theme.category:
+                _discard(self._by_category, _norm(theme.category), key)
+            locales = self._by_translation_key.get(theme.translation_key)
+            if locales and locales.get(theme.locale) == key:
+                del locales[theme.locale]
+                if not locales:
+                    del self._by_translation_key[theme.translation_key]
+            self._sorted.clear()
+
+    def get(self, key: str) -> BlogTheme | None:
+        return self._themes.get(key)
+
+    def keys(self) -> List[str]:
+        with self._lock:
+            return list(self._themes)
+
+    def latest(self, limit: int = 20, locale: str | None = "en", category: str | None = None) -> List[BlogTheme]:
+        with self._lock:
+            if category:
+                keys = self._by_category.get(_norm(category), set())
+                return self._sorted_view(("category", _norm(category), locale or ""), keys, locale)[:limit]
+            return self._sorted_view(("all", "", locale or ""), self._themes.keys(), locale)[:limit]
+
+    def tagged(self, tag: str, locale: str | None = None) -> List[BlogTheme]:
+        with self._lock:
+            keys = self._by_tag.get(_norm(tag), set())
+            return list(self._sorted_view(("tag", _norm(tag), locale or ""), keys, locale))
+
+    def locales_for_key(self, translation_key: str) -> List[str]:
+        with self._lock:
+            locales = dict(self._by_translation_key.get(translation_key.strip(), {}))
+        return [locale for locale in LOCALES if locale in locales] + sorted(
+            locale for locale in locales if locale not in LOCALES
         )
 
-    def sort_key(item: BlogTheme) -> datetime:
-        parsed = _parse_date(item.date)
-        if parsed:
-            return parsed
-        return datetime.fromtimestamp(item.file_mtime)
+    def categories(self, locale: str | None = "en") -> List[str]:
+        with self._lock:
+            names = {
+                theme.category
+                for theme in self._themes.values()
+                if theme.category and (not locale or theme.locale == locale)
+            }
+        return sorted(names, key=_norm)
 
-    themes.sort(key=sort_key, reverse=True)
-    return themes[:limit]
+    def _sorted_view(self, cache_key: Tuple[str, ...], keys: Iterable[str], locale: str | None) -> List[BlogTheme]:
+        # Sorted views are built once per query shape and reused until the index changes.
+        cached = self._sorted.get(cache_key)
+        if cached is None:
+            themes = [
+                self._themes[key]
+                for key in sorted(keys)
+                if not locale or self._themes[key].locale == locale
+            ]
+            themes.sort(key=_theme_sort_key, reverse=True)
+            self._sorted[cache_key] = themes
+            cached = themes
+        return cached
+
+
+def _discard(index: Dict[str, Set[str]], name: str, key: str) -> None:
+    keys = index.get(name)
+    if keys is None:
+        return
+    keys.discard(key)
+    if not keys:
+        del index[name]
+
+
+def get_posts_root() -> Path | None:
+    repo_root = find_repo_root()
+    if repo_root is None:
+        warn("Repo root not found. Cannot load blog posts.")
+        return None
+    posts_root = repo_root / "content" / "posts"
+    if not posts_root.exists():
+        warn(f"Posts directory not found: {posts_root}")
+        return None
+    return posts_root
+
+
+def scan_blog_post(posts_root: Path, key: str) -> BlogTheme | None:
+    locale = key.split("/", 1)[0]
+    path = posts_root / key
+    stat = path.stat()
+    theme = _scan_post(path, stat.st_mtime, locale, key)
+    return BlogTheme(**theme) if theme else None
+
+
+def load_blog_corpus_index() -> BlogCorpusIndex:
+    posts_root = get_posts_root()
+    if posts_root is None:
+        return BlogCorpusIndex()
+    return BlogCorpusIndex(refresh_blog_index(posts_root), posts_root=posts_root)
+
+
+def load_latest_blog_themes(limit: int = 20) -> List[BlogTheme]:
+    return load_blog_corpus_index().latest(limit, locale="en")
@@ -0,0 +1,201 @@
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import os
+from pathlib import Path
+import select
+import struct
+import sys
+import threading
+from typing import Callable, Dict, Iterable, List, Set, Tuple
+
+from utils.blog_index import LOCALES, BlogCorpusIndex, scan_blog_post
+from utils.logger import info, warn
+
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ISDIR = 0x40000000
+
+POSTS_MASK = IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_DELETE | IN_DELETE_SELF | IN_MOVE_SELF
+ROOT_MASK = IN_CREATE | IN_MOVED_TO
+
+_EVENT_HEADER = struct.Struct("iIII")
+
+
+def _load_inotify():
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        libc.inotify_init1.argtypes = [ctypes.c_int]
+        libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+    except (OSError, AttributeError):
+        return None
+    return libc
+
+
+class BlogIndexWatcher:
+    def __init__(
+        self,
+        index: BlogCorpusIndex,
+        on_change: Callable[[List[str]], None] | None = None,
+        poll_interval: float = 2.0,
+        locales: Iterable[str] = LOCALES,
+        use_inotify: bool = True
+    ) -> None:
+        if index.posts_root is None:
+            raise ValueError("Blog index has no posts root to watch.")
+        self.index = index
+        self.posts_root: Path = index.posts_root
+        self.on_change = on_change
+        self.poll_interval = poll_interval
+        self.locales = list(locales)
+        self.mode = "stopped"
+        self._use_inotify = use_inotify
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        libc = _load_inotify() if self._use_inotify else None
+        fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC) if libc else -1
+        if fd >= 0:
+            self.mode = "inotify"
+            self._thread = threading.Thread(target=self._run_inotify, args=(libc, fd), daemon=True)
+        else:
+            self.mode = "polling"
+            self._thread = threading.Thread(target=self._run_polling, daemon=True)
+        self._thread.start()
+        info(f"Watching {self.posts_root} for blog post changes ({self.mode}).")
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=2.0)
+            self._thread = None
+        self.mode = "stopped"
+
+    def _apply(self, changed: Set[str]) -> None:
+        applied: List[str] = []
+        for key in sorted(changed):
+            theme = None
+            if (self.posts_root / key).is_file():
+                try:
+                    theme = scan_blog_post(self.posts_root, key)
+                except Exception as exc:
+                    warn(f"Failed to read {self.posts_root / key}: {exc}")
+            if theme is not None:
+                self.index.add(key, theme)
+            elif self.index.get(key) is not None:
+                self.index.remove(key)
+            else:
+                continue
+            applied.append(key)
+        if applied and self.on_change:
+            self.on_change(applied)
+
+    def _snapshot(self) -> Dict[str, Tuple[int, int]]:
+        snapshot: Dict[str, Tuple[int, int]] = {}
+        for locale in self.locales:
+            locale_dir = self.posts_root / locale
+            if not locale_dir.is_dir():
+                continue
+            try:
+                with os.scandir(locale_dir) as scanner:
+                    for item in scanner:
+                        if item.name.endswith(".mdx") and item.is_file():
+                            stat = item.stat()
+                            snapshot[f"{locale}/{item.name}"] = (stat.st_mtime_ns, stat.st_size)
+            except OSError as exc:
+                warn(f"Failed to scan {locale_dir}: {exc}")
+        return snapshot
+
+    def _run_polling(self) -> None:
+        previous = self._snapshot()
+        while not self._stop.wait(self.poll_interval):
+            current = self._snapshot()
+            changed = {key for key in previous.keys() | current.keys() if previous.get(key) != current.get(key)}
+            previous = current
+            if changed:
+                self._apply(changed)
+
+    def _add_watch(self, libc, fd: int, path: Path, mask: int) -> int:
+        wd = libc.inotify_add_watch(fd, os.fsencode(str(path)), mask)
+        if wd < 0:
+            warn(f"inotify_add_watch failed for {path}: {os.strerror(ctypes.get_errno())}")
+        return wd
+
+    def _run_inotify(self, libc, fd: int) -> None:
+        watches: Dict[int, str] = {}
+        try:
+            root_wd = self._add_watch(libc, fd, self.posts_root, ROOT_MASK)
+            for locale in self.locales:
+                if (self.posts_root / locale).is_dir():
+                    wd = self._add_watch(libc, fd, self.posts_root / locale, POSTS_MASK)
+                    if wd >= 0:
+                        watches[wd] = locale
+            if root_wd < 0:
+                self.mode = "polling"
+                os.close(fd)
+                fd = -1
+                self._run_polling()
+                return
+
+            while not self._stop.is_set():
+                ready, _, _ = select.select([fd], [], [], 0.5)
+                if not ready:
+                    continue
+                try:
+                    data = os.read(fd, 64 * 1024)
+                except BlockingIOError:
+                    continue
+                changed: Set[str] = set()
+                offset = 0
+                while offset + _EVENT_HEADER.size <= len(data):
+                    wd, mask, _, name_len = _EVENT_HEADER.unpack_from(data, offset)
+                    offset += _EVENT_HEADER.size
+                    name = os.fsdecode(data[offset:offset + name_len].rstrip(b"\0"))
+                    offset += name_len
+                    if mask & IN_Q_OVERFLOW:
+                        # The kernel queue overflowed (wd is -1) and events were lost: rescan every watched locale.
+                        changed.update(self.index.keys())
+                        for locale in watches.values():
+                            changed.update(f"{locale}/{item.name}" for item in (self.posts_root / locale).glob("*.mdx"))
+                        continue
+                    if wd == root_wd:
+                        if mask & IN_ISDIR and name in self.locales and name not in watches.values():
+                            new_wd = self._add_watch(libc, fd, self.posts_root / name, POSTS_MASK)
+                            if new_wd >= 0:
+                                watches[new_wd] = name
+                            changed.update(
+                                f"{name}/{item.name}"
+                                for item in (self.posts_root / name).glob("*.mdx")
+                            )
+                        continue
+                    locale = watches.get(wd)
+                    if locale is None:
+                        continue
+                    if mask & IN_IGNORED:
+                        del watches[wd]
+                        changed.update(key for key in self.index.keys() if key.startswith(f"{locale}/"))
+                        continue
+                    if name.endswith(".mdx"):
+                        changed.add(f"{locale}/{name}")
+                if changed:
+                    self._apply(changed)
+        except Exception as exc:
+            warn(f"Blog watcher stopped: {exc}")
+        finally:
+            if fd >= 0:
+                os.close(fd)
@@ -1,39 +1,45 @@
 from __future__ import annotations
 
-import json
-from typing import Dict, List
+from typing import Callable, Dict, List
 from pathlib import Path
 
-from PySide6.QtWidgets import QMessageBox
-
+from utils.json_backend import dump, loads
 from utils.logger import error as log_error
 from utils.logger import info as log_info
 
+ErrorHandler = Callable[[str, str], None]
+
 
 def ensure_dir(path: Path) -> None:
     path.mkdir(parents=True, exist_ok=True)
 
 
-def save_json(path: str | Path, payload: Dict[str, object]) -> bool:
+def save_json(
+    path: str | Path,
+    payload: Dict[str, object],
+    on_error: ErrorHandler | None = None,
+    compact: bool = False
+) -> bool:
     target = Path(path)
     ensure_dir(target.parent)
     try:
-        with target.open("w", encoding="utf-8") as handle:
-            json.dump(payload, handle, indent=2)
+        with target.open("wb") as handle:
+            dump(payload, handle, compact=compact)
         log_info(f"Saved JSON to {target}")
         return True
     except Exception as exc:
         log_error(f"Failed to save JSON to {target}: {exc}")
-        QMessageBox.critical(None, "Save error", f"Failed to save JSON to {target}: {exc}")
+        if on_error:
+            on_error("Save error", f"Failed to save JSON to {target}: {exc}")
         return False
 
 
-def load_json(path: str | Path) -> Dict[str, object] | None:
+def load_json(path: str | Path, on_error: ErrorHandler | None = None) -> Dict[str, object] | None:
     target = Path(path)
     try:
-        with target.open("r", encoding="utf-8") as handle:
-            return json.load(handle)
+        return loads(target.read_bytes())
     except Exception as exc:
         log_error(f"Failed to load JSON from {target}: {exc}")
-        QMessageBox.critical(None, "Load error", f"Failed to load JSON from {target}: {exc}")
+        if on_error:
+            on_error("Load error", f"Failed to load JSON from {target}: {exc}")
         return None
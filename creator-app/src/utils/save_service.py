@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+import tempfile
+import threading
+from typing import Callable, Dict, List, Tuple
+
+from utils.json_backend import dumps
+from utils.logger import error as log_error
+from utils.logger import info as log_info
+
+DoneCallback = Callable[[bool, str], None]
+Writer = Callable[[str, object], None]
+
+
+def json_bytes(payload: object, compact: bool = False) -> bytes:
+    return dumps(payload, compact=compact)
+
+
+def atomic_write(path: str | Path, data: bytes) -> None:
+    target = Path(path)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(prefix=f".{target.name}.", suffix=".tmp", dir=target.parent)
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            handle.write(data)
+            handle.flush()
+            os.fsync(handle.fileno())
+        os.replace(tmp_name, target)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
+
+
+def write_json(path: str | Path, payload: object) -> None:
+    atomic_write(path, json_bytes(payload))
+
+
+class SaveService:
+    def __init__(self) -> None:
+        self._pending: Dict[str, Tuple[object, Writer, List[DoneCallback]]] = {}
+        self._order: List[str] = []
+        self._writing: str | None = None
+        self._condition = threading.Condition()
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="save-service", daemon=True)
+        self._thread.start()
+
+    def submit(
+        self,
+        path: str | Path,
+        payload: object,
+        on_done: DoneCallback | None = None,
+        write: Writer = write_json
+    ) -> None:
+        # Callers pass a snapshot; a newer submit for the same path replaces one not yet written.
+        key = str(path)
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("Save service is closed.")
+            callbacks = self._pending[key][2] if key in self._pending else []
+            if on_done:
+                callbacks.append(on_done)
+            if key not in self._pending:
+                self._order.append(key)
+            self._pending[key] = (payload, write, callbacks)
+            self._condition.notify_all()
+
+    def pending(self) -> int:
+        with self._condition:
+            return len(self._pending) + (1 if self._writing else 0)
+
+    def flush(self, timeout: float | None = None) -> bool:
+        with self._condition:
+            return self._condition.wait_for(lambda: not self._pending and self._writing is None, timeout)
+
+    def close(self, timeout: float | None = 5.0) -> bool:
+        flushed = self.flush(timeout)
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        self._thread.join(timeout)
+        return flushed
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: self._pending or self._closed)
+                if not self._pending:
+                    return
+                key = self._order.pop(0)
+                payload, write, callbacks = self._pending.pop(key)
+                self._writing = key
+            ok, message = True, ""
+            try:
+                write(key, payload)
+                log_info(f"Saved JSON to {key}")
+            except Exception as exc:
+                ok, message = False, f"Failed to save JSON to {key}: {exc}"
+                log_error(message)
+            for callback in callbacks:
+                try:
+                    callback(ok, message)
+                except Exception as exc:
+                    log_error(f"Save callback failed for {key}: {exc}")
+            with self._condition:
+                self._writing = None
+                self._condition.notify_all()
@@ -0,0 +1,308 @@
+from __future__ import annotations
+
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain
+import os
+from pathlib import Path
+import sys
+import time
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+from core.channel_rules import CHANNEL_RULES
+from core.models import GlobalInputs, LocaleContent, PromptResult
+from core.package_inputs import DEFAULT_OPTIONS, package_to_inputs
+from core.prompt_generator import PROMPT_LAYOUTS, iter_prompts
+from profile_kit.bio_loader import load_bio_kit
+from profile_kit.bio_models import BioKit
+from utils.json_backend import dumps, loads
+from utils.io import save_prompt_stream, save_results_templates
+from utils.logger import error as log_error
+from utils.paths import get_data_dir, get_outputs_dir, get_repo_schema_path
+from utils.validators import (
+    validate_blog_url,
+    validate_content_package,
+    validate_inputs,
+    validate_slug,
+    warm_validator_cache
+)
+
+
+LAYOUTS = ["all", "per-channel", "both"]
+
+_WORKER: Dict[str, object] = {}
+
+
+def check_inputs(
+    global_inputs: GlobalInputs,
+    locale_contents: Dict[str, LocaleContent],
+    channels: List[str]
+) -> List[str]:
+    # Mirrors the checks MainWindow.handle_generate runs before generating.
+    issues = validate_inputs(global_inputs, list(locale_contents.values()), channels)
+    if issues:
+        return issues
+    if not validate_blog_url(global_inputs.blog_url):
+        return ["Blog URL is invalid."]
+    slugs = {
+        "EN": global_inputs.post_slug_en,
+        "PT": global_inputs.post_slug_pt or global_inputs.post_slug_en,
+        "ES": global_inputs.post_slug_es or global_inputs.post_slug_en,
+        "IT": global_inputs.post_slug_it or global_inputs.post_slug_en
+    }
+    invalid_slugs = [label for label, slug in slugs.items() if not slug or not validate_slug(slug)]
+    if invalid_slugs:
+        return [f"Invalid slug(s): {', '.join(invalid_slugs)}"]
+    if global_inputs.distribution_mode == "separate":
+        missing = [locale.upper() for locale, item in locale_contents.items() if not item.content.strip()]
+        if missing:
+            return ["Separate accounts mode expects all locales. Missing content: " + ", ".join(missing)]
+        missing = [locale.upper() for locale, item in locale_contents.items() if not item.description.strip()]
+        if missing:
+            return ["Descriptions are required for all locales: " + ", ".join(missing)]
+    return []
+
+
+def generate_for_package(
+    payload: Dict[str, object],
+    bio_kit: BioKit,
+    channels: List[str],
+    options: Dict[str, object] | None = None,
+    articles: Dict[str, str] | None = None
+) -> Tuple[GlobalInputs, Iterator[PromptResult], List[str]]:
+    # Prompts come back as a lazy stream; the first one is generated up front to report empty runs.
+    # In reference content mode, articles fills up with the bodies the prompts point to.
+    global_inputs, locale_contents, affiliate_links = package_to_inputs(payload, options)
+    issues = check_inputs(global_inputs, locale_contents, channels)
+    if issues:
+        return global_inputs, iter(()), issues
+    prompts = iter_prompts(
+        global_inputs,
+        locale_contents,
+        affiliate_links,
+        channels,
+        bio_kit,
+        articles=articles
+    )
+    first = next(prompts, None)
+    if first is None:
+        return global_inputs, iter(()), ["No prompts were generated. Check content fields."]
+    return global_inputs, chain([first], prompts), []
+
+
+def save_outputs(
+    outputs_dir: Path,
+    results_dir: Path,
+    global_inputs: GlobalInputs,
+    prompts: Iterable[PromptResult],
+    channels: List[str],
+    layout: str,
+    articles: Dict[str, str] | None = None
+) -> Tuple[List[str], int]:
+    # Same files as the "Save all" and "Save to file (per channel)" buttons, streamed as prompts are generated.
+    key = global_inputs.translation_key
+    paths, count = save_prompt_stream(
+        outputs_dir,
+        key,
+        prompts,
+        separate=global_inputs.distribution_mode == "separate",
+        all_prompts=layout in ("all", "both"),
+        per_channel=layout in ("per-channel", "both"),
+        articles=articles
+    )
+    save_results_templates(results_dir, key, channels)
+    return paths, count
+
+
+def _init_worker(settings: Dict[str, object]) -> None:
+    # Runs once per worker process: load the bio kit and compile the schema up front.
+    _WORKER.clear()
+    _WORKER.update(settings)
+    _WORKER["bio_kit"] = load_bio_kit(str(settings["bio_kit_path"]))
+    warm_validator_cache(str(settings["schema_path"]))
+
+
+def process_package(file_path: str) -> Dict[str, object]:
+    # Every line has the same keys; a failure is recorded for its own package and never stops the batch.
+    start = time.perf_counter()
+    result: Dict[str, object] = {
+        "file": file_path,
+        "translationKey": "",
+        "ok": False,
+        "errors": [],
+        "files": [],
+        "prompts": 0
+    }
+    try:
+        _process_package(file_path, result)
+    except Exception as exc:
+        log_error(f"Batch processing failed for {file_path}: {exc}")
+        result["ok"] = False
+        result["errors"] = [f"Processing crashed: {exc}"]
+    result["ms"] = round((time.perf_counter() - start) * 1000, 3)
+    return result
+
+
+def _process_package(file_path: str, result: Dict[str, object]) -> None:
+    try:
+        payload = loads(Path(file_path).read_bytes())
+    except (OSError, ValueError) as exc:
+        result["errors"] = [f"Failed to read content package: {exc}"]
+        return
+    errors = validate_content_package(payload, str(_WORKER["schema_path"]))
+    if errors:
+        result["errors"] = errors
+        return
+    channels = list(_WORKER["channels"])
+    articles: Dict[str, str] = {}
+    global_inputs, prompts, issues = generate_for_package(
+        payload,
+        _WORKER["bio_kit"],
+        channels,
+        _WORKER["options"],
+        articles
+    )
+    result["translationKey"] = global_inputs.translation_key
+    result["errors"] = issues
+    if issues:
+        return
+    result["files"], result["prompts"] = save_outputs(
+        Path(str(_WORKER["outputs_dir"])),
+        Path(str(_WORKER["results_dir"])),
+        global_inputs,
+        prompts,
+        channels,
+        str(_WORKER["layout"]),
+        articles
+    )
+    result["ok"] = bool(result["files"])
+    if not result["ok"]:
+        result["errors"] = ["Failed to save prompts."]
+
+
+def run_batch(
+    files: Iterable[str | Path],
+    channels: List[str],
+    bio_kit_path: str | Path | None = None,
+    schema_path: str | Path | None = None,
+    outputs_dir: str | Path | None = None,
+    results_dir: str | Path | None = None,
+    options: Dict[str, object] | None = None,
+    layout: str = "both",
+    workers: int | None = None,
+    chunksize: int = 4
+) -> Iterator[Dict[str, object]]:
+    # Yields one result per package, in input order, as workers finish them.
+    unknown = [channel for channel in channels if channel not in CHANNEL_RULES]
+    if unknown:
+        raise ValueError(f"Unknown channel(s): {', '.join(unknown)}")
+    if layout not in LAYOUTS:
+        raise ValueError(f"Unknown layout: {layout}")
+    settings: Dict[str, object] = {
+        # Streamed outputs are grouped by channel, so each channel is generated once.
+        "channels": list(dict.fromkeys(channels)),
+        "bio_kit_path": str(bio_kit_path or get_data_dir() / "profiles.json"),
+        "schema_path": str(schema_path or get_repo_schema_path()),
+        "outputs_dir": str(outputs_dir or get_outputs_dir() / "distribution-prompts"),
+        "results_dir": str(results_dir or get_outputs_dir() / "distribution-results"),
+        "options": {**DEFAULT_OPTIONS, **(options or {})},
+        "layout": layout
+    }
+    paths = [str(item) for item in files]
+    workers = max(1, min(workers or os.cpu_count() or 1, len(paths) or 1))
+    if workers == 1:
+        _init_worker(settings)
+        yield from map(process_package, paths)
+        return
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(settings,)) as pool:
+        yield from pool.map(process_package, paths, chunksize=max(1, chunksize))
+
+
+def collect_packages(targets: Iterable[Path]) -> List[str]:
+    files: List[str] = []
+    for target in targets:
+        if target.is_dir():
+            files.extend(str(item) for item in sorted(target.rglob("*.json")) if item.is_file())
+        elif target.is_file():
+            files.append(str(target))
+        else:
+            print(f"Skipping missing path: {target}", file=sys.stderr)
+    return files
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Generate distribution prompts for many content packages; prints one JSON line per package."
+    )
+    parser.add_argument("paths", nargs="+", type=Path, help="Content package files or directories.")
+    parser.add_argument("--channels", nargs="+", default=list(CHANNEL_RULES.keys()), choices=list(CHANNEL_RULES.keys()))
+    parser.add_argument("--bio-kit", type=Path, default=None, help="profiles.json (default: the app's runtime copy).")
+    parser.add_argument("--schema", type=Path, default=None)
+    parser.add_argument("--outputs", type=Path, default=None, help="Default: outputs/distribution-prompts.")
+    parser.add_argument("--results", type=Path, default=None, help="Default: outputs/distribution-results.")
+    parser.add_argument("--layout", choices=LAYOUTS, default="both")
+    parser.add_argument("--mode", choices=["separate", "single"], default=DEFAULT_OPTIONS["distribution_mode"])
+    parser.add_argument("--length", choices=["short", "standard", "long"], default=DEFAULT_OPTIONS["length"])
+    parser.add_argument("--no-variants", action="store_true")
+    parser.add_argument("--no-comments", action="store_true")
+    parser.add_argument(
+        "--content-mode",
+        choices=["inline", "reference"],
+        default=DEFAULT_OPTIONS["content_mode"],
+        help="reference: save each article body once in <key>-articles.json and point to it from the prompts."
+    )
+    parser.add_argument(
+        "--token-budget",
+        type=int,
+        default=DEFAULT_OPTIONS["token_budget"],
+        help="Shorten article content so each prompt fits this many tokens (0 = off)."
+    )
+    parser.add_argument(
+        "--prompt-layout",
+        choices=PROMPT_LAYOUTS,
+        default=DEFAULT_OPTIONS["prompt_layout"],
+        help="prefix-cache: shared instructions and article first, channel rules last."
+    )
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--chunksize", type=int, default=4)
+    args = parser.parse_args()
+
+    files = collect_packages(args.paths)
+    if not files:
+        print("No content package files found.", file=sys.stderr)
+        return 0
+    options = {
+        "distribution_mode": args.mode,
+        "length": args.length,
+        "generate_variants": not args.no_variants,
+        "include_comment_templates": not args.no_comments,
+        "token_budget": args.token_budget,
+        "content_mode": args.content_mode,
+        "prompt_layout": args.prompt_layout
+    }
+
+    start = time.perf_counter()
+    failures = 0
+    for result in run_batch(
+        files,
+        args.channels,
+        bio_kit_path=args.bio_kit,
+        schema_path=args.schema,
+        outputs_dir=args.outputs,
+        results_dir=args.results,
+        options=options,
+        layout=args.layout,
+        workers=args.workers,
+        chunksize=args.chunksize
+    ):
+        failures += not result["ok"]
+        print(dumps(result, compact=True).decode("utf-8"), flush=True)
+    print(
+        f"{len(files)} packages, {failures} failed, {time.perf_counter() - start:.2f}s",
+        file=sys.stderr
+    )
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
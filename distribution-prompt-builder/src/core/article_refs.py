@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+import re
+from typing import Dict
+
+from .tokens import count_tokens
+
+# Reference mode puts this marker where the article body goes; the body itself is stored once per run.
+_REF = re.compile(r"\[\[article:([a-z]{2}(?:-\d+)?)\]\]")
+
+
+def article_ref(name: str) -> str:
+    return f"[[article:{name}]]"
+
+
+def escape_refs(text: str) -> str:
+    # User text that looks like a marker gets a zero-width space, so only markers placed by the builder expand.
+    return text.replace("[[article:", "[[article\u200b:") if "[[article:" in text else text
+
+
+def expand_articles(text: str, articles: Dict[str, str]) -> str:
+    # Bodies are inserted in one pass and never rescanned; unknown names stay as they are.
+    if not articles:
+        return text
+    return _REF.sub(lambda match: articles.get(match.group(1), match.group(0)), text)
+
+
+def expanded_tokens(text: str, articles: Dict[str, str]) -> int:
+    # Token count of the expanded prompt without building it.
+    if not articles:
+        return count_tokens(text)
+    tokens = count_tokens(_REF.sub("", text))
+    for match in _REF.finditer(text):
+        body = articles.get(match.group(1))
+        tokens += count_tokens(body) if body is not None else count_tokens(match.group(0))
+    return tokens
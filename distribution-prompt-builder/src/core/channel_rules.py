@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from typing import Dict
 
-from .models import ChannelConfig
+from .models import ChannelConfig, VariantStrategy
 
 
 CHANNEL_RULES: Dict[str, ChannelConfig] = {
@@ -55,3 +55,17 @@ CHANNEL_RULES: Dict[str, ChannelConfig] = {
         style_rules="Editorial tone, no marketing, blog link discreet at end."
     )
 }
+
+# With variants on, each per-locale prompt is sent once per strategy, in this order.
+VARIANT_STRATEGIES: Dict[str, VariantStrategy] = {
+    "A": VariantStrategy(
+        name="A",
+        hook="Open with a concrete problem the reader already has, in one sentence.",
+        structure="Short paragraphs that go from the problem to the practical steps, then the CTA."
+    ),
+    "B": VariantStrategy(
+        name="B",
+        hook="Open with a counterintuitive insight or a specific result from the article.",
+        structure="A short numbered list of takeaways, then one closing sentence with the CTA."
+    )
+}
@@ -1,7 +1,13 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from .article_refs import expand_articles, expanded_tokens
+
+# Fixed lines of the bundle output structure (prompts/bundle*.txt, bundle-output.v1.txt).
+RETURN_MARKER = "Return exactly this structure and nothing else:"
+LOCALE_MARKER = "=== LOCALE: "
 
 
 @dataclass
@@ -25,6 +31,12 @@ class GlobalInputs:
     distribution_mode: str
     linkedin_generate_comment: bool
     linkedin_cta_policy: str
+    # 0 = no limit; otherwise article content is shortened so each prompt fits this many tokens.
+    token_budget: int = 0
+    # "inline" embeds article bodies in every prompt; "reference" stores each body once (see core/article_refs.py).
+    content_mode: str = "inline"
+    # "standard", or "prefix-cache": sections ordered from most to least shared (see prompts/*-prefix.v1.txt).
+    prompt_layout: str = "standard"
 
 
 @dataclass
@@ -56,9 +68,125 @@ class ChannelConfig:
     style_rules: str
 
 
+@dataclass
+class VariantStrategy:
+    name: str
+    hook: str
+    structure: str
+
+
+@dataclass
+class BundleIndex:
+    # Offsets into a channel bundle, found once when the bundle is built.
+    # header_end: end of the instructions and inputs; blocks: locale -> span of its "=== LOCALE: XX ===" output block.
+    header_end: int
+    blocks: Dict[str, Tuple[int, int]]
+
+
 @dataclass
 class PromptResult:
     channel: str
     locale: str
     variant: str
     prompt_text: str
+    # Separate mode only: where the locale views start and end in prompt_text.
+    sections: BundleIndex | None = None
+    # Tokens of fixed prompt text when that alone is over the token budget; 0 when the budget is met.
+    budget_floor: int = 0
+
+
+@dataclass
+class PromptSet:
+    # Results in generation order, indexed by channel and locale as they are added.
+    separate: bool = False
+    results: List[PromptResult] = field(default_factory=list)
+    by_channel: Dict[str, List[PromptResult]] = field(default_factory=dict)
+    by_locale: Dict[Tuple[str, str], List[PromptResult]] = field(default_factory=dict)
+    # Reference content mode: article bodies by name, expanded into prompts on copy and save.
+    articles: Dict[str, str] = field(default_factory=dict)
+    _bundles: Dict[str, str] = field(default_factory=dict, repr=False)
+    _views: Dict[Tuple[str, str], str] = field(default_factory=dict, repr=False)
+
+    def add(self, result: PromptResult) -> None:
+        self.results.append(result)
+        self.by_channel.setdefault(result.channel, []).append(result)
+        self.by_locale.setdefault((result.channel, result.locale), []).append(result)
+        self._bundles.pop(result.channel, None)
+        self._views.clear()
+
+    def __iter__(self) -> Iterator[PromptResult]:
+        return iter(self.results)
+
+    def __len__(self) -> int:
+        return len(self.results)
+
+    @property
+    def channels(self) -> List[str]:
+        return list(self.by_channel)
+
+    def get(self, channel: str, locale: str) -> List[PromptResult]:
+        return self.by_locale.get((channel, locale), [])
+
+    def text(self, channel: str, locale: str) -> str:
+        return "\n\n".join([item.prompt_text for item in self.get(channel, locale)])
+
+    def bundle(self, channel: str) -> str:
+        if channel not in self._bundles:
+            self._bundles[channel] = bundle_text(self.by_channel.get(channel, []), self.separate)
+        return self._bundles[channel]
+
+    def view(self, channel: str, locale: str) -> str:
+        # What the (channel, locale) output tab shows; built once per prompt set.
+        key = (channel, locale)
+        if key not in self._views:
+            if self.separate:
+                results = self.by_channel.get(channel, [])
+                self._views[key] = locale_view(results[0], locale) if results else ""
+            else:
+                self._views[key] = self.text(channel, locale)
+        return self._views[key]
+
+    def bundles(self) -> Dict[str, str]:
+        return {channel: self.bundle(channel) for channel in self.by_channel}
+
+    def expand(self, text: str) -> str:
+        return expand_articles(text, self.articles)
+
+    def token_count(self, text: str) -> int:
+        return expanded_tokens(text, self.articles)
+
+
+def bundle_text(results: List[PromptResult], separate: bool) -> str:
+    # Separate mode repeats one channel bundle per locale; otherwise the bundle is every prompt of the channel.
+    if separate:
+        return results[0].prompt_text if results else ""
+    return "\n\n".join([item.prompt_text for item in results])
+
+
+def index_bundle(text: str) -> BundleIndex | None:
+    # The output structure closes the bundle, so the searches run backwards over that short tail only.
+    position = text.rfind(RETURN_MARKER)
+    if position == -1:
+        return None
+    header_end = position
+    while header_end and text[header_end - 1].isspace():
+        header_end -= 1
+    blocks: Dict[str, Tuple[int, int]] = {}
+    end = len(text)
+    start = text.rfind(LOCALE_MARKER, position, end)
+    while start != -1:
+        close = text.find(" ===", start + len(LOCALE_MARKER), end)
+        if close != -1:
+            blocks[text[start + len(LOCALE_MARKER):close].lower()] = (start, end)
+        end = start
+        start = text.rfind(LOCALE_MARKER, position, end)
+    return BundleIndex(header_end, dict(reversed(list(blocks.items()))))
+
+
+def locale_view(result: PromptResult, locale: str) -> str:
+    # The bundle's instructions and inputs with only this locale's output block; the whole bundle if it has none.
+    span = result.sections.blocks.get(locale) if result.sections else None
+    if span is None:
+        return result.prompt_text
+    text = result.prompt_text
+    return f"{text[:result.sections.header_end]}\n{RETURN_MARKER}\nCHANNEL: {result.channel}\n{text[span[0]:span[1]]}"
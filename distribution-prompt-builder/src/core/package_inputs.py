@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+from typing import Dict, Tuple
+
+from .models import AffiliateLinks, GlobalInputs, LocaleContent
+from utils.validators import infer_title_from_content
+
+
+LOCALES = ["en", "pt", "es", "it"]
+
+LINK_POLICY_LABELS = {
+    "no-links": "No links",
+    "blog-only": "Blog link only",
+    "blog-and-affiliate": "Blog link + optional affiliate link (non-Reddit/Quora only)"
+}
+
+# Same defaults as the Distribution tab widgets.
+DEFAULT_OPTIONS: Dict[str, object] = {
+    "main_call_to_action": "Reputation only (no selling)",
+    "tone": "professional, direct, helpful, not hypey",
+    "persona": "experienced tech mentor",
+    "length": "short",
+    "generate_variants": True,
+    "include_comment_templates": True,
+    "allow_affiliate_override": False,
+    "distribution_mode": "separate",
+    "linkedin_generate_comment": True,
+    "linkedin_cta_policy": "No links",
+    "token_budget": 0,
+    "content_mode": "inline",
+    "prompt_layout": "standard"
+}
+
+
+def package_to_inputs(
+    payload: Dict[str, object],
+    options: Dict[str, object] | None = None
+) -> Tuple[GlobalInputs, Dict[str, LocaleContent], AffiliateLinks]:
+    settings = {**DEFAULT_OPTIONS, **(options or {})}
+    meta = payload.get("meta", {})
+    global_data = payload.get("global", {})
+    locales = payload.get("locales", {})
+
+    slugs: Dict[str, str] = {}
+    affiliate: Dict[str, str] = {}
+    contents: Dict[str, LocaleContent] = {}
+    for locale in LOCALES:
+        loc = locales.get(locale, {}) or {}
+        slugs[locale] = str(loc.get("slug", "") or "").strip()
+        affiliate[locale] = str((loc.get("affiliate", {}) or {}).get("url", "") or "").strip()
+        content = str(loc.get("content", "") or "").strip()
+        title = str(loc.get("title", "") or "").strip()
+        if not title and content:
+            title = infer_title_from_content(content)
+        contents[locale] = LocaleContent(
+            locale=locale,
+            title=title,
+            description=str(loc.get("description", "") or "").strip(),
+            content=content,
+            tags=list(loc.get("tags", []) or []),
+            category=str(loc.get("category", "") or ""),
+            keywords=list(loc.get("keywords", []) or [])
+        )
+
+    global_inputs = GlobalInputs(
+        translation_key=str(meta.get("translationKey", "")).strip(),
+        author=str(global_data.get("author", "")).strip(),
+        affiliate_disclosure=bool(global_data.get("defaultAffiliateDisclosure", False)),
+        blog_url=str(global_data.get("blogUrl", "")).strip(),
+        post_slug_en=slugs["en"],
+        post_slug_pt=slugs["pt"],
+        post_slug_es=slugs["es"],
+        post_slug_it=slugs["it"],
+        main_call_to_action=str(settings["main_call_to_action"]),
+        link_policy=LINK_POLICY_LABELS.get(str(global_data.get("linkPolicy", "no-links")), "No links"),
+        tone=str(settings["tone"]),
+        persona=str(settings["persona"]),
+        length=str(settings["length"]).lower(),
+        generate_variants=bool(settings["generate_variants"]),
+        include_comment_templates=bool(settings["include_comment_templates"]),
+        allow_affiliate_override=bool(settings["allow_affiliate_override"]),
+        distribution_mode=str(settings["distribution_mode"]),
+        linkedin_generate_comment=bool(settings["linkedin_generate_comment"]),
+        linkedin_cta_policy=str(settings["linkedin_cta_policy"]),
+        token_budget=int(settings["token_budget"] or 0),
+        content_mode=str(settings["content_mode"]),
+        prompt_layout=str(settings["prompt_layout"])
+    )
+    return global_inputs, contents, AffiliateLinks(**affiliate)
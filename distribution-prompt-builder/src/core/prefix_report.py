@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Iterable, Iterator, List, Tuple
+
+from .models import PromptSet
+from .tokens import count_tokens
+
+# Characters compared per slice before narrowing down to the first difference.
+_CHUNK = 4096
+
+
+@dataclass
+class PrefixStep:
+    label: str
+    tokens: int
+    # Leading part identical to the prompt sent just before; providers can serve it from their prompt cache.
+    shared_chars: int
+    shared_tokens: int
+
+
+@dataclass
+class PrefixReport:
+    steps: List[PrefixStep] = field(default_factory=list)
+
+    @property
+    def total_tokens(self) -> int:
+        return sum(step.tokens for step in self.steps)
+
+    @property
+    def shared_tokens(self) -> int:
+        return sum(step.shared_tokens for step in self.steps)
+
+    @property
+    def shared_ratio(self) -> float:
+        return self.shared_tokens / self.total_tokens if self.total_tokens else 0.0
+
+
+def shared_prefix(first: str, second: str) -> int:
+    # Whole slices are compared in C; only the first slice that differs is searched.
+    limit = min(len(first), len(second))
+    start = 0
+    while start < limit and first[start:start + _CHUNK] == second[start:start + _CHUNK]:
+        start += _CHUNK
+    if start >= limit:
+        return limit
+    low, high = start, min(start + _CHUNK, limit)
+    while low < high:
+        middle = (low + high + 1) // 2
+        if first[start:middle] == second[start:middle]:
+            low = middle
+        else:
+            high = middle - 1
+    return low
+
+
+def send_order(prompt_set: PromptSet) -> Iterator[Tuple[str, str]]:
+    # (label, full prompt text) in the order that keeps shared prefixes adjacent:
+    # one bundle per channel in separate mode, otherwise locale by locale across channels.
+    if prompt_set.separate:
+        for channel in prompt_set.channels:
+            yield channel, prompt_set.expand(prompt_set.bundle(channel))
+        return
+    locales = list(dict.fromkeys(result.locale for result in prompt_set))
+    for locale in locales:
+        for channel in prompt_set.channels:
+            for result in prompt_set.get(channel, locale):
+                label = f"{channel} {locale.upper()} {result.variant}"
+                yield label, prompt_set.expand(result.prompt_text)
+
+
+def prefix_report(prompts: Iterable[Tuple[str, str]]) -> PrefixReport:
+    # Only the previous prompt is kept, so prompts can be expanded one at a time.
+    report = PrefixReport()
+    previous = ""
+    for label, text in prompts:
+        shared = shared_prefix(previous, text)
+        report.steps.append(PrefixStep(label, count_tokens(text), shared, count_tokens(text[:shared])))
+        previous = text
+    return report
+
+
+def format_prefix_report(report: PrefixReport) -> str:
+    lines = [
+        f"{step.label}: {step.shared_tokens} of {step.tokens} tokens shared with the previous prompt"
+        for step in report.steps
+    ]
+    lines.append(
+        f"Total: {report.shared_tokens} of {report.total_tokens} tokens ({report.shared_ratio:.0%}) in shared prefixes"
+    )
+    return "\n".join(lines)
@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+import hashlib
+from itertools import chain
+from typing import Callable, Dict, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+def digest(*parts: object) -> str:
+    # Length-prefixed so that ("ab", "c") and ("a", "bc") never collide.
+    hasher = hashlib.sha1()
+    for part in parts:
+        data = str(part).encode("utf-8", "surrogatepass")
+        hasher.update(f"{len(data)}:".encode("ascii"))
+        hasher.update(data)
+    return hasher.hexdigest()
+
+
+class PromptCache:
+    # Built prompts keyed by a digest of everything that went into them; least recently used entries go first.
+    def __init__(self, max_entries: int = 256) -> None:
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[str, object] = OrderedDict()
+        self._locales: Dict[str, Tuple[Dict[str, str], str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def fetch(self, key: str, build: Callable[[], T]) -> T:
+        value = self._entries.get(key)
+        if value is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+        self.misses += 1
+        value = build()
+        self._entries[key] = value
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return value
+
+    def locale_key(self, locale: str, values: Dict[str, str]) -> str:
+        # Comparing with the previous run's fields is much cheaper than hashing a long article again.
+        previous = self._locales.get(locale)
+        if previous and previous[0] == values:
+            return previous[1]
+        key = digest(*chain.from_iterable(values.items()))
+        self._locales[locale] = (values, key)
+        return key
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._locales.clear()
+        self.hits = 0
+        self.misses = 0
@@ -1,10 +1,52 @@
 from __future__ import annotations
 
-from typing import Dict, List, Tuple
-
-from .channel_rules import CHANNEL_RULES
-from .models import AffiliateLinks, GlobalInputs, LocaleContent, PromptResult
+from dataclasses import astuple, fields, replace
+from functools import partial
+from itertools import chain
+from typing import Callable, Dict, Iterator, List, Tuple
+
+from .article_refs import article_ref, escape_refs
+from .channel_rules import CHANNEL_RULES, VARIANT_STRATEGIES
+from .models import AffiliateLinks, BundleIndex, GlobalInputs, LocaleContent, PromptResult, PromptSet, index_bundle
+from .prompt_cache import PromptCache, digest
+from .prompt_templates import TEMPLATE_VERSION, PromptTemplate, load_template, skeleton
+from .tokens import count_tokens, fit_text, split_budget, tokenizer_name
 from profile_kit.bio_models import BioKit
+from utils.logger import warn
+
+# GlobalInputs fields that reach the prompt text directly; links and bios are keyed per locale.
+_POST_FIELDS = [
+    "tone",
+    "persona",
+    "length",
+    "main_call_to_action",
+    "link_policy",
+    "affiliate_disclosure",
+    "include_comment_templates",
+    "linkedin_generate_comment",
+    "linkedin_cta_policy",
+    "token_budget",
+    "prompt_layout"
+]
+_BUNDLE_FIELDS = [
+    "tone",
+    "persona",
+    "length",
+    "main_call_to_action",
+    "link_policy",
+    "affiliate_disclosure",
+    "linkedin_generate_comment",
+    "linkedin_cta_policy",
+    "token_budget",
+    "prompt_layout"
+]
+
+PROMPT_LAYOUTS = ["standard", "prefix-cache"]
+
+
+def _template_name(global_inputs: GlobalInputs, name: str) -> str:
+    # The prefix-cache layout has its own templates with the same slots: post-prefix, bundle-prefix, ...
+    return f"{name}-prefix" if global_inputs.prompt_layout == "prefix-cache" else name
 
 
 def _select_bio_text(bio_kit: BioKit, locale: str, channel: str) -> str:
@@ -32,81 +74,187 @@ def _build_affiliate_link(links: AffiliateLinks, locale: str) -> str:
     return getattr(links, locale, "")
 
 
-def _thumbnail_prompt(theme_hint: str, channel: str) -> str:
-    base = (
-        "minimal, editorial, modern tech/career aesthetic, abstract shapes or simple symbolic icons, "
-        "high readability, clean composition, no clutter, 16:9, no brand logos, "
-        "optional 3-6 words max, language matches locale"
-    )
-    style = "insight card" if channel == "LinkedIn" else "blog cover"
-    return (
-        f"{base}, style: {style}, theme: {theme_hint}"
-    )
+def _locale_values(content: LocaleContent) -> Dict[str, str]:
+    return {
+        "locale": content.locale,
+        "locale_upper": content.locale.upper(),
+        "title": content.title,
+        "description": content.description,
+        "category": content.category or "N/A",
+        "tags": ", ".join(content.tags) if content.tags else "N/A",
+        "keywords": ", ".join(content.keywords) if content.keywords else "N/A",
+        "content": content.content
+    }
 
 
-def generate_prompts(
+def _escaped_inputs(global_inputs: GlobalInputs) -> GlobalInputs:
+    # Reference mode: user-supplied text must not carry article markers into the prompt (see escape_refs).
+    changes = {}
+    for item in fields(global_inputs):
+        value = getattr(global_inputs, item.name)
+        if isinstance(value, str) and escape_refs(value) is not value:
+            changes[item.name] = escape_refs(value)
+    return replace(global_inputs, **changes) if changes else global_inputs
+
+
+def iter_prompts(
     global_inputs: GlobalInputs,
     locale_contents: Dict[str, LocaleContent],
     affiliate_links: AffiliateLinks,
     channels: List[str],
-    bio_kit: BioKit
-) -> Tuple[Dict[str, str], List[PromptResult]]:
-    bundle_by_channel: Dict[str, str] = {}
-    flat_results: List[PromptResult] = []
+    bio_kit: BioKit,
+    cache: PromptCache | None = None,
+    articles: Dict[str, str] | None = None
+) -> Iterator[PromptResult]:
+    # Yields results channel by channel; nothing is kept once a result has been consumed.
+    # With a cache, only prompts whose inputs changed since an earlier run are rebuilt.
+    # In reference content mode, prompts carry [[article:<name>]] markers and the bodies go into articles.
     locales = ["en", "pt", "es", "it"]
+    reference = global_inputs.content_mode == "reference" and articles is not None
+    if reference:
+        global_inputs = _escaped_inputs(global_inputs)
 
+    # Article fields are the same for every channel; format them once per run.
+    locale_values: Dict[str, Dict[str, str]] = {}
+    for locale in locales:
+        content = locale_contents.get(locale)
+        if content and content.content.strip():
+            values = _locale_values(content)
+            if reference:
+                # The body itself is stored in articles and put back verbatim; expansion never rescans it.
+                values = {key: value if key == "content" else escape_refs(value) for key, value in values.items()}
+            locale_values[locale] = values
+    locale_keys: Dict[str, str] = {}
+    if cache is not None:
+        locale_keys = {locale: cache.locale_key(locale, values) for locale, values in locale_values.items()}
+
+    separate = global_inputs.distribution_mode == "separate"
     for channel in channels:
         config = CHANNEL_RULES[channel]
-        if global_inputs.distribution_mode == "separate":
-            bundle_text = _build_bundle_prompt(
-                global_inputs=global_inputs,
-                locale_contents=locale_contents,
-                affiliate_links=affiliate_links,
-                channel=channel,
-                config=config,
-                bio_kit=bio_kit
-            )
+        extras = _locale_extras(global_inputs, affiliate_links, channel, config, bio_kit, list(locale_values))
+        if reference:
+            extras = {locale: tuple(escape_refs(item) for item in extra) for locale, extra in extras.items()}
+        channel_key = _channel_key(global_inputs, channel, config, separate, reference) if cache is not None else ""
+        if separate:
+            build = partial(_build_bundle_prompt, global_inputs, locale_values, extras, channel, config, reference)
+            if cache is None:
+                bundle_text, bodies, sections, floor = build()
+            else:
+                key = digest(channel_key, *chain.from_iterable((locale_keys[locale], *extras[locale]) for locale in extras))
+                bundle_text, bodies, sections, floor = cache.fetch(key, build)
+            if reference:
+                articles.update(bodies)
             if bundle_text:
-                bundle_by_channel[channel] = bundle_text
-                for locale in locales:
-                    content = locale_contents.get(locale)
-                    if content and content.content.strip():
-                        flat_results.append(
-                            PromptResult(channel=channel, locale=locale, variant="A", prompt_text=bundle_text)
-                        )
+                for locale in locale_values:
+                    yield PromptResult(
+                        channel=channel,
+                        locale=locale,
+                        variant="A",
+                        prompt_text=bundle_text,
+                        sections=sections,
+                        budget_floor=floor
+                    )
             continue
 
-        variants = ["A", "B"] if global_inputs.generate_variants else ["A"]
-        for locale in locales:
-            content = locale_contents.get(locale)
-            if not content or not content.content.strip():
-                continue
-
-            allow_blog, allow_affiliate = _link_rules(global_inputs, channel, config)
-            blog_link = _build_blog_link(global_inputs, locale) if allow_blog else ""
-            affiliate_link = _build_affiliate_link(affiliate_links, locale) if allow_affiliate else ""
-
-            for variant in variants:
-                prompt_text = _build_prompt_text(
-                    global_inputs=global_inputs,
-                    locale_content=content,
-                    channel=channel,
-                    config=config,
-                    blog_link=blog_link,
-                    affiliate_link=affiliate_link,
-                    variant=variant,
-                    bio_kit=bio_kit
+        variants = _variant_rules(global_inputs)
+        template = _post_skeleton(global_inputs, channel, config)
+        for locale, values in locale_values.items():
+            seen = set()
+            for variant, variant_rule in variants.items():
+                build = partial(
+                    _build_prompt_text,
+                    template,
+                    global_inputs,
+                    values,
+                    channel,
+                    config,
+                    *extras[locale],
+                    variant_rule,
+                    reference
                 )
-                flat_results.append(
-                    PromptResult(channel=channel, locale=locale, variant=variant, prompt_text=prompt_text)
+                if cache is None:
+                    prompt_text, bodies, floor = build()
+                else:
+                    key = digest(channel_key, locale_keys[locale], *extras[locale], variant_rule)
+                    prompt_text, bodies, floor = cache.fetch(key, build)
+                if reference:
+                    articles.update(bodies)
+                # A variant that renders the same prompt as an earlier one would only pay for the same answer twice.
+                if prompt_text in seen:
+                    continue
+                seen.add(prompt_text)
+                yield PromptResult(
+                    channel=channel, locale=locale, variant=variant, prompt_text=prompt_text, budget_floor=floor
                 )
 
-        if flat_results:
-            bundle_by_channel[channel] = "\n\n".join(
-                [item.prompt_text for item in flat_results if item.channel == channel]
-            )
 
-    return bundle_by_channel, flat_results
+def collect_prompts(
+    global_inputs: GlobalInputs,
+    locale_contents: Dict[str, LocaleContent],
+    affiliate_links: AffiliateLinks,
+    channels: List[str],
+    bio_kit: BioKit,
+    cache: PromptCache | None = None,
+    on_result: Callable[[PromptResult], None] | None = None
+) -> PromptSet:
+    # on_result sees each result as it is added; raising from it stops the run (the UI uses it to cancel).
+    prompt_set = PromptSet(separate=global_inputs.distribution_mode == "separate")
+    for result in iter_prompts(
+        global_inputs, locale_contents, affiliate_links, channels, bio_kit, cache, prompt_set.articles
+    ):
+        prompt_set.add(result)
+        if on_result:
+            on_result(result)
+    return prompt_set
+
+
+def generate_prompts(
+    global_inputs: GlobalInputs,
+    locale_contents: Dict[str, LocaleContent],
+    affiliate_links: AffiliateLinks,
+    channels: List[str],
+    bio_kit: BioKit,
+    cache: PromptCache | None = None
+) -> Tuple[Dict[str, str], List[PromptResult]]:
+    # Full prompt text in every content mode; collect_prompts keeps reference mode's shared bodies.
+    prompt_set = PromptSet(separate=global_inputs.distribution_mode == "separate")
+    for result in iter_prompts(global_inputs, locale_contents, affiliate_links, channels, bio_kit, cache):
+        prompt_set.add(result)
+    return prompt_set.bundles(), prompt_set.results
+
+
+def _channel_key(global_inputs: GlobalInputs, channel: str, config, separate: bool, reference: bool) -> str:
+    # Per-channel inputs shared by every locale; per-locale inputs are added to this key by the caller.
+    fields = _BUNDLE_FIELDS if separate else _POST_FIELDS
+    return digest(
+        "bundle" if separate else "post",
+        "reference" if reference else "inline",
+        TEMPLATE_VERSION,
+        tokenizer_name() if global_inputs.token_budget else "",
+        channel,
+        *astuple(config),
+        *[getattr(global_inputs, name) for name in fields]
+    )
+
+
+def _locale_extras(
+    global_inputs: GlobalInputs,
+    affiliate_links: AffiliateLinks,
+    channel: str,
+    config,
+    bio_kit: BioKit,
+    locales: List[str]
+) -> Dict[str, Tuple[str, str, str]]:
+    # (bio_text, blog_link, affiliate_link) per locale for one channel.
+    allow_blog, allow_affiliate = _link_rules(global_inputs, channel, config)
+    return {
+        locale: (
+            _select_bio_text(bio_kit, locale, channel),
+            _build_blog_link(global_inputs, locale) if allow_blog else "",
+            _build_affiliate_link(affiliate_links, locale) if allow_affiliate else ""
+        )
+        for locale in locales
+    }
 
 
 def _link_rules(global_inputs: GlobalInputs, channel: str, config) -> Tuple[bool, bool]:
@@ -129,113 +277,111 @@ def _link_rules(global_inputs: GlobalInputs, channel: str, config) -> Tuple[bool
 
 def _build_bundle_prompt(
     global_inputs: GlobalInputs,
-    locale_contents: Dict[str, LocaleContent],
-    affiliate_links: AffiliateLinks,
+    locale_values: Dict[str, Dict[str, str]],
+    extras: Dict[str, Tuple[str, str, str]],
     channel: str,
     config,
-    bio_kit: BioKit
-) -> str:
-    locales = ["en", "pt", "es", "it"]
-    locale_blocks: List[str] = []
-    output_blocks: List[str] = []
+    reference: bool
+) -> Tuple[str, Dict[str, str], BundleIndex | None, int]:
+    # Returns the bundle, the article bodies it points to in reference mode, the offsets of its locale blocks,
+    # and the fixed text's token count when that alone breaks the token budget (0 otherwise).
+    if not locale_values:
+        return "", {}, None, 0
 
-    for locale in locales:
-        content = locale_contents.get(locale)
-        if not content or not content.content.strip():
-            continue
+    link_guidance = f"Link policy: {global_inputs.link_policy}."
+    if channel == "LinkedIn":
+        link_guidance += f" LinkedIn CTA policy: {global_inputs.linkedin_cta_policy}."
 
-        allow_blog, allow_affiliate = _link_rules(global_inputs, channel, config)
-        blog_link = _build_blog_link(global_inputs, locale) if allow_blog else ""
-        affiliate_link = _build_affiliate_link(affiliate_links, locale) if allow_affiliate else ""
-
-        bio_text = _select_bio_text(bio_kit, locale, channel)
-        locale_blocks.append(
-            "\n".join(
-                [
-                    f"=== INPUT LOCALE: {locale.upper()} ===",
-                    f"Writer profile (do not repeat verbatim, use as voice reference): {bio_text}",
-                    f"Title: {content.title}",
-                    f"Description: {content.description}",
-                    f"Category: {content.category or 'N/A'}",
-                    f"Tags: {', '.join(content.tags) if content.tags else 'N/A'}",
-                    f"Keywords: {', '.join(content.keywords) if content.keywords else 'N/A'}",
-                    f"Content: {content.content}",
-                    f"Blog link for this locale: {blog_link or 'N/A'}",
-                    f"Affiliate link for this locale: {affiliate_link or 'N/A'}"
-                ]
-            )
-        )
+    template = skeleton(
+        _template_name(global_inputs, "bundle"),
+        channel=channel,
+        tone=global_inputs.tone,
+        persona=global_inputs.persona,
+        length=global_inputs.length,
+        main_call_to_action=global_inputs.main_call_to_action,
+        link_guidance=link_guidance,
+        affiliate_disclosure=global_inputs.affiliate_disclosure,
+        style_rules=config.style_rules,
+        linkedin_generate_comment=global_inputs.linkedin_generate_comment
+    )
+    contents = {locale: values["content"] for locale, values in locale_values.items()}
+    names = {locale: locale for locale in contents}
+    prefix = global_inputs.prompt_layout == "prefix-cache"
+
+    budget = global_inputs.token_budget
+    floor = 0
+    if budget and count_tokens(_render_bundle(template, locale_values, extras, contents, prefix)) > budget:
+        # Only the article bodies shrink; what the rest of the bundle leaves is shared between locales.
+        overhead = count_tokens(_render_bundle(template, locale_values, extras, dict.fromkeys(contents, ""), prefix))
+        shares = split_budget([count_tokens(content) for content in contents.values()], budget - overhead)
+        for locale, share in zip(list(contents), shares):
+            fitted = fit_text(contents[locale], share)
+            if fitted is not contents[locale]:
+                contents[locale], names[locale] = fitted, f"{locale}-{share}"
+        if count_tokens(_render_bundle(template, locale_values, extras, contents, prefix)) > budget:
+            floor = _budget_floor(channel, budget, overhead)
+
+    if not reference:
+        text = _render_bundle(template, locale_values, extras, contents, prefix)
+        return text, {}, index_bundle(text), floor
+    bodies = {names[locale]: content for locale, content in contents.items()}
+    refs = {locale: article_ref(names[locale]) for locale in contents}
+    text = _render_bundle(template, locale_values, extras, refs, prefix)
+    return text, bodies, index_bundle(text), floor
+
+
+def _budget_floor(channel: str, budget: int, overhead: int) -> int:
+    # Even fully truncated article bodies leave the prompt over budget; say so instead of sending it quietly.
+    warn(
+        f"{channel}: the {budget:,} token budget cannot be met; the prompt without article content "
+        f"already takes ~{overhead:,} tokens."
+    )
+    return overhead
 
-        output_blocks.append(
-            "\n".join(
-                [
-                    f"=== LOCALE: {locale.upper()} ===",
-                    "POST_TEXT:",
-                    "<final post text>",
-                    "THUMBNAIL_PROMPT (MIDJOURNEY):",
-                    "<N/A or prompt>",
-                    "FIRST_COMMENT (LinkedIn only):",
-                    "<N/A or comment>",
-                    "HASHTAGS (if relevant):",
-                    "<LinkedIn 3-8 hashtags, otherwise N/A>",
-                    "COMMENTS_TEMPLATES (if enabled):",
-                    "<5 short comments or N/A>"
-                ]
-            )
-        )
 
-    if not locale_blocks:
-        return ""
+def _render_bundle(
+    template: PromptTemplate,
+    locale_values: Dict[str, Dict[str, str]],
+    extras: Dict[str, Tuple[str, str, str]],
+    contents: Dict[str, str],
+    prefix: bool = False
+) -> str:
+    # The prefix layout keeps the article inputs free of channel data; bios and links go in their own blocks.
+    input_template = load_template("bundle-prefix-input" if prefix else "bundle-input")
+    links_template = load_template("bundle-prefix-links")
+    output_template = load_template("bundle-output")
+    locale_blocks: List[str] = []
+    link_blocks: List[str] = []
+    output_blocks: List[str] = []
 
-    thumb_guidelines = (
-        "If thumbnails are allowed, generate a Midjourney prompt: minimal, editorial, modern tech/career aesthetic, "
-        "abstract shapes or simple symbolic icons, high readability, clean composition, no clutter, 16:9, "
-        "optional 3-6 words max (language matches locale). LinkedIn: insight card. Others: blog cover."
+    for locale, values in locale_values.items():
+        bio_text, blog_link, affiliate_link = extras[locale]
+        links = {"bio_text": bio_text, "blog_link": blog_link or "N/A", "affiliate_link": affiliate_link or "N/A"}
+        locale_blocks.append(input_template.render(**{**values, "content": contents[locale]}, **links))
+        if prefix:
+            link_blocks.append(links_template.render(locale_upper=values["locale_upper"], **links))
+        output_blocks.append(output_template.render(locale_upper=values["locale_upper"]))
+
+    return template.render(
+        locale_inputs="\n\n".join(locale_blocks),
+        locale_links="\n\n".join(link_blocks),
+        locale_outputs="\n".join(output_blocks)
     )
 
-    link_guidance = f"Link policy: {global_inputs.link_policy}."
-    if channel == "LinkedIn":
-        link_guidance += f" LinkedIn CTA policy: {global_inputs.linkedin_cta_policy}."
 
-    return "\n".join(
-        [
-            "You are an expert community writer. Generate channel-native content.",
-            f"Channel: {channel}",
-            "You must produce one output per locale: EN, PT, ES, IT.",
-            f"Tone: {global_inputs.tone}",
-            f"Persona: {global_inputs.persona}",
-            f"Length: {global_inputs.length}",
-            f"Main CTA: {global_inputs.main_call_to_action}",
-            link_guidance,
-            f"Affiliate disclosure: {global_inputs.affiliate_disclosure}",
-            "Anti-spam: reputation first, avoid sales language.",
-            f"Channel style rules: {config.style_rules}",
-            f"LinkedIn first comment enabled: {global_inputs.linkedin_generate_comment}.",
-            "If LinkedIn first comment is disabled, return N/A for FIRST_COMMENT.",
-            "If thumbnails are not allowed for this channel, return N/A in THUMBNAIL_PROMPT.",
-            "If channel is not LinkedIn, FIRST_COMMENT must be N/A.",
-            thumb_guidelines,
-            "",
-            "Inputs:",
-            "\n\n".join(locale_blocks),
-            "",
-            "Return exactly this structure and nothing else:",
-            f"CHANNEL: {channel}",
-            "\n".join(output_blocks)
-        ]
-    )
+def _variant_rules(global_inputs: GlobalInputs) -> Dict[str, str]:
+    # Variant name -> the section appended last to its prompt; a single prompt gets no variant section.
+    if not global_inputs.generate_variants:
+        return {"A": ""}
+    template = load_template("variant")
+    return {
+        name: template.render(variant=name, hook=strategy.hook, structure=strategy.structure)
+        for name, strategy in VARIANT_STRATEGIES.items()
+    }
 
 
-def _build_prompt_text(
-    global_inputs: GlobalInputs,
-    locale_content: LocaleContent,
-    channel: str,
-    config,
-    blog_link: str,
-    affiliate_link: str,
-    variant: str,
-    bio_kit: BioKit
-) -> str:
+def _post_skeleton(global_inputs: GlobalInputs, channel: str, config) -> PromptTemplate:
+    # Everything except the per-locale slots is fixed for a channel and a set of global inputs.
     length_hint = global_inputs.length
     if config.suggested_length and config.suggested_length.lower() != length_hint:
         length_hint = f"{length_hint} (channel suggests {config.suggested_length})"
@@ -246,6 +392,43 @@ def _build_prompt_text(
         else "Write N/A in COMMENTS_TEMPLATES."
     )
 
+    channel_style = config.style_rules
+    if channel == "Medium":
+        channel_style += " Add a note: editorial caution, no overt marketing."
+
+    first_comment_rule = "N/A"
+    if channel == "LinkedIn" and global_inputs.linkedin_generate_comment:
+        first_comment_rule = "Generate a first comment that adds value, includes a question, and optionally a link per policy."
+
+    return skeleton(
+        _template_name(global_inputs, "post"),
+        channel=channel,
+        tone=global_inputs.tone,
+        persona=global_inputs.persona,
+        length_hint=length_hint,
+        main_call_to_action=global_inputs.main_call_to_action,
+        link_policy=global_inputs.link_policy,
+        affiliate_disclosure=global_inputs.affiliate_disclosure,
+        channel_style=channel_style,
+        first_comment_rule=first_comment_rule,
+        comment_rule=comment_rule
+    )
+
+
+def _build_prompt_text(
+    template: PromptTemplate,
+    global_inputs: GlobalInputs,
+    values: Dict[str, str],
+    channel: str,
+    config,
+    bio_text: str,
+    blog_link: str,
+    affiliate_link: str,
+    variant_rule: str,
+    reference: bool
+) -> Tuple[str, Dict[str, str], int]:
+    # Returns the prompt, the article body it points to in reference mode,
+    # and the fixed text's token count when that alone breaks the token budget (0 otherwise).
     link_instruction = "No links." if global_inputs.link_policy == "No links" else "Links allowed if relevant."
     if blog_link:
         link_instruction = f"Blog link (discreet): {blog_link}"
@@ -256,58 +439,40 @@ def _build_prompt_text(
     if affiliate_link:
         affiliate_instruction = f"Affiliate link (use only if contextually helpful): {affiliate_link}"
 
-    thumb_rule = "THUMBNAIL_PROMPT (MIDJOURNEY): N/A"
+    thumbnail_rule = "THUMBNAIL_PROMPT (MIDJOURNEY): N/A"
     if config.allow_thumbnail:
-        hint = locale_content.title or locale_content.description or "tech career"
-        thumb_rule = f"THUMBNAIL_PROMPT (MIDJOURNEY):\n{_thumbnail_prompt(hint, channel)}"
-
-    channel_style = config.style_rules
-    if channel == "Medium":
-        channel_style += " Add a note: editorial caution, no overt marketing."
-
-    first_comment_rule = "N/A"
-    if channel == "LinkedIn" and global_inputs.linkedin_generate_comment:
-        first_comment_rule = "Generate a first comment that adds value, includes a question, and optionally a link per policy."
-
-    output_rules = (
-        "Return exactly this structure and nothing else:\n"
-        f"CHANNEL: {channel}\n"
-        f"=== LOCALE: {locale_content.locale.upper()} ===\n"
-        "POST_TEXT:\n"
-        "<final post text>\n\n"
-        f"{thumb_rule}\n\n"
-        "FIRST_COMMENT (LinkedIn only):\n"
-        "<comment or N/A>\n\n"
-        "HASHTAGS (if relevant):\n"
-        "<LinkedIn 3-8 hashtags, otherwise N/A>\n\n"
-        "COMMENTS_TEMPLATES (if enabled):\n"
-        "<5 short comments or N/A>"
-    )
-
-    bio_text = _select_bio_text(bio_kit, locale_content.locale, channel)
-
-    return (
-        "You are a channel-native content editor. Produce a final post ready to publish.\n"
-        f"Channel: {channel}\n"
-        f"Locale: {locale_content.locale}\n"
-        f"Writer profile (do not repeat verbatim, use as voice reference): {bio_text}\n"
-        f"Tone: {global_inputs.tone}\n"
-        f"Persona: {global_inputs.persona}\n"
-        f"Length: {length_hint}\n"
-        f"Main CTA: {global_inputs.main_call_to_action}\n"
-        f"Link policy: {global_inputs.link_policy}. {link_instruction}\n"
-        f"Affiliate disclosure: {global_inputs.affiliate_disclosure}\n"
-        f"Affiliate rule: {affiliate_instruction}\n"
-        f"Anti-spam: reputation first, avoid sales language.\n"
-        f"Channel style: {channel_style}\n"
-        f"LinkedIn first comment: {first_comment_rule}\n"
-        f"Title: {locale_content.title}\n"
-        f"Description: {locale_content.description}\n"
-        f"Category: {locale_content.category or 'N/A'}\n"
-        f"Tags: {', '.join(locale_content.tags) if locale_content.tags else 'N/A'}\n"
-        f"Keywords: {', '.join(locale_content.keywords) if locale_content.keywords else 'N/A'}\n"
-        "Content source:\n"
-        f"{locale_content.content}\n\n"
-        f"{comment_rule}\n\n"
-        f"{output_rules}"
-    )
+        style = "insight card" if channel == "LinkedIn" else "blog cover"
+        hint = values["title"] or values["description"] or "tech career"
+        thumbnail_rule = skeleton("thumbnail", style=style).render(theme=hint)
+
+    slots = {
+        "bio_text": bio_text,
+        "link_instruction": link_instruction,
+        "affiliate_instruction": affiliate_instruction,
+        "thumbnail_rule": thumbnail_rule
+    }
+    content, name = values["content"], values["locale"]
+
+    def render(body: str) -> str:
+        text = template.render(**{**values, "content": body}, **slots)
+        return f"{text}\n\n{variant_rule}" if variant_rule else text
+
+    budget = global_inputs.token_budget
+    floor = 0
+    if budget:
+        text = render(content)
+        if count_tokens(text) <= budget:
+            if not reference:
+                return text, {}, 0
+        else:
+            # Only the article body shrinks, to whatever the rest of the prompt leaves.
+            room = budget - count_tokens(render(""))
+            fitted = fit_text(content, room)
+            if fitted is not content:
+                content, name = fitted, f"{name}-{max(room, 0)}"
+            if count_tokens(render(content)) > budget:
+                floor = _budget_floor(channel, budget, budget - room)
+
+    if not reference:
+        return render(content), {}, floor
+    return render(article_ref(name)), {name: content}, floor
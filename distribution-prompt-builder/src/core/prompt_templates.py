@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from functools import cached_property, lru_cache
+import keyword
+import re
+from typing import Callable, Dict, List, Tuple
+
+from utils.paths import get_prompts_dir
+
+TEMPLATE_VERSION = "v1"
+
+# Slots are lowercase names in braces; any other brace is literal text.
+_SLOT = re.compile(r"\{([a-z_]+)\}")
+
+
+@dataclass(frozen=True)
+class PromptTemplate:
+    # Literals at even indexes, slot names at odd indexes: literal, slot, literal, ..., literal.
+    parts: Tuple[str, ...]
+
+    @property
+    def slots(self) -> List[str]:
+        return list(dict.fromkeys(self.parts[1::2]))
+
+    def fill(self, **values: object) -> "PromptTemplate":
+        # Fills the given slots and merges them into the surrounding literals; the rest stay open.
+        parts: List[str] = [self.parts[0]]
+        for index in range(1, len(self.parts), 2):
+            name, literal = self.parts[index], self.parts[index + 1]
+            if name in values:
+                parts[-1] += f"{values[name]}{literal}"
+            else:
+                parts.extend([name, literal])
+        return PromptTemplate(tuple(parts))
+
+    @cached_property
+    def render(self) -> Callable[..., str]:
+        # render(**values) -> str, compiled on first use into a single f-string over the parts.
+        return _compile_renderer(self.parts)
+
+
+def _compile_renderer(parts: Tuple[str, ...]) -> Callable[..., str]:
+    # Literals are passed in as globals (L0, L1, ...), so their text never needs escaping.
+    namespace: Dict[str, object] = {}
+    pieces: List[str] = []
+    for index, part in enumerate(parts):
+        if index % 2:
+            pieces.append(f"{{{part}}}")
+        elif part:
+            name = f"L{index // 2}"
+            namespace[name] = part
+            pieces.append(f"{{{name}}}")
+    # Values for slots a template does not use are accepted and ignored (Unused cannot clash with a slot name).
+    slots = list(dict.fromkeys(parts[1::2]))
+    signature = ", ".join(["*", *slots, "**Unused"]) if slots else "**Unused"
+    body = f'f"{"".join(pieces)}"' if pieces else '""'
+    exec(f"def render({signature}):\n    return {body}\n", namespace)
+    return namespace["render"]
+
+
+def compile_template(text: str) -> PromptTemplate:
+    parts: List[str] = []
+    position = 0
+    for match in _SLOT.finditer(text):
+        if keyword.iskeyword(match.group(1)):
+            continue
+        parts.extend([text[position:match.start()], match.group(1)])
+        position = match.end()
+    parts.append(text[position:])
+    return PromptTemplate(tuple(parts))
+
+
+@lru_cache(maxsize=None)
+def load_template(name: str, version: str = TEMPLATE_VERSION) -> PromptTemplate:
+    path = get_prompts_dir() / f"{name}.{version}.txt"
+    text = path.read_text(encoding="utf-8")
+    # Editors add a final newline; the prompts themselves do not end with one.
+    return compile_template(text[:-1] if text.endswith("\n") else text)
+
+
+@lru_cache(maxsize=512)
+def _skeleton(name: str, version: str, static: Tuple[Tuple[str, object], ...]) -> PromptTemplate:
+    return load_template(name, version).fill(**dict(static))
+
+
+def skeleton(name: str, version: str = TEMPLATE_VERSION, **static: object) -> PromptTemplate:
+    # Template with the slots that stay fixed for a channel already filled in; cached across runs.
+    return _skeleton(name, version, tuple(static.items()))
+
+
+def clear_template_cache() -> None:
+    load_template.cache_clear()
+    _skeleton.cache_clear()
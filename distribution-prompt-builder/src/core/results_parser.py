@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+import re
+from typing import Dict, List, Tuple
+
+from .channel_rules import CHANNEL_RULES
+
+LOCALES = ["en", "pt", "es", "it"]
+
+# Section headers of the requested output format, in order, with the record field each one fills.
+SECTIONS: Dict[str, str] = {
+    "POST_TEXT": "post_text",
+    "THUMBNAIL_PROMPT": "thumbnail_prompt",
+    "FIRST_COMMENT": "first_comment",
+    "HASHTAGS": "hashtags",
+    "COMMENTS_TEMPLATES": "comment_templates"
+}
+
+# Headers may come back wrapped in Markdown (**POST_TEXT:**, ### CHANNEL: ...); those marks are ignored.
+_CHANNEL = re.compile(r"CHANNEL:\s*(.*)")
+_LOCALE = re.compile(r"===\s*LOCALE:\s*(\S+)\s*===")
+_SECTION = re.compile(r"(" + "|".join(SECTIONS) + r")(?:\s*\([^)]*\))?\s*:\s*(.*)")
+_PLACEHOLDER = re.compile(r"<[^<>\n]+>")
+_HASHTAG = re.compile(r"#[\w-]+")
+_LIST_MARKER = re.compile(r"(?:[-*]|\d+[.)])\s+")
+
+
+@dataclass
+class ResultRecord:
+    channel: str
+    locale: str
+    post_text: str = ""
+    thumbnail_prompt: str = ""
+    first_comment: str = ""
+    hashtags: List[str] = field(default_factory=list)
+    comment_templates: List[str] = field(default_factory=list)
+    source: str = ""
+    line: int = 0
+
+
+@dataclass
+class ResultIssue:
+    source: str
+    line: int
+    message: str
+
+
+class _ResultsParser:
+    # One pass over the lines; each line either opens a channel, a locale block or a section, or extends the open section.
+    def __init__(self, source: str) -> None:
+        self.source = source
+        self.records: List[ResultRecord] = []
+        self.issues: List[ResultIssue] = []
+        self.channel = ""
+        self.channel_line = 0
+        self.channel_records = 0
+        self.record: ResultRecord | None = None
+        self.sections: Dict[str, List[str]] = {}
+        self.section = ""
+        self.stray = False
+
+    def issue(self, line: int, message: str) -> None:
+        self.issues.append(ResultIssue(self.source, line, message))
+
+    def feed(self, number: int, line: str) -> None:
+        header = line.strip().strip("*#").strip()
+        match = _CHANNEL.fullmatch(header)
+        if match:
+            self.close_record()
+            self.close_channel()
+            self.channel, self.channel_line, self.channel_records = match.group(1).strip("* "), number, 0
+            if self.channel not in CHANNEL_RULES:
+                self.issue(number, f"Unknown channel: {self.channel or '(empty)'}")
+            return
+        match = _LOCALE.fullmatch(header)
+        if match:
+            self.close_record()
+            locale = match.group(1).lower()
+            if not self.channel:
+                self.issue(number, f"Locale {locale.upper()} appears before any CHANNEL line.")
+            if locale not in LOCALES:
+                self.issue(number, f"Unknown locale: {match.group(1)}")
+            self.record = ResultRecord(self.channel, locale, source=self.source, line=number)
+            self.channel_records += 1
+            return
+        match = _SECTION.fullmatch(header)
+        if match:
+            name = match.group(1)
+            self.stray = False
+            if self.record is None:
+                self.issue(number, f"{name} appears outside a locale block.")
+                self.section = ""
+                return
+            if name in self.sections:
+                self.issue(number, f"{self.label()}: {name} appears more than once; the last one is kept.")
+            self.section = name
+            self.sections[name] = [match.group(2)] if match.group(2).strip() else []
+            return
+        if self.section:
+            self.sections[self.section].append(line)
+        elif line.strip() and not self.stray:
+            # Reported once per run of stray lines.
+            self.stray = True
+            self.issue(number, "Text outside any section: " + line.strip()[:60])
+
+    def label(self) -> str:
+        record = self.record
+        return f"{record.channel or '?'} {record.locale.upper()}" if record else "?"
+
+    def close_record(self) -> None:
+        record = self.record
+        self.section, self.stray = "", False
+        if record is None:
+            return
+        for name, attribute in SECTIONS.items():
+            if name not in self.sections:
+                self.issue(record.line, f"{self.label()}: missing {name}.")
+                continue
+            value = "\n".join(self.sections[name]).strip()
+            if _PLACEHOLDER.fullmatch(value):
+                self.issue(record.line, f"{self.label()}: {name} still holds the placeholder {value}.")
+                value = ""
+            elif name == "POST_TEXT" and value.upper() in ("", "N/A", "NA", "NONE"):
+                self.issue(record.line, f"{self.label()}: POST_TEXT is empty.")
+                value = ""
+            elif value.upper() in ("N/A", "NA", "NONE"):
+                value = ""
+            if attribute == "hashtags":
+                record.hashtags = _HASHTAG.findall(value)
+            elif attribute == "comment_templates":
+                lines = [_LIST_MARKER.sub("", item.strip(), count=1) for item in value.splitlines()]
+                record.comment_templates = [item for item in lines if item]
+            else:
+                setattr(record, attribute, value)
+        if record.first_comment and record.channel and record.channel != "LinkedIn":
+            self.issue(record.line, f"{self.label()}: FIRST_COMMENT must be N/A outside LinkedIn.")
+        self.records.append(record)
+        self.record = None
+        self.sections = {}
+
+    def close_channel(self) -> None:
+        if self.channel_line and not self.channel_records:
+            self.issue(self.channel_line, f"{self.channel or '(empty)'}: no locale blocks.")
+
+
+def parse_results(text: str, source: str = "") -> Tuple[List[ResultRecord], List[ResultIssue]]:
+    # Pasted or saved LLM answers -> one record per channel and locale block, plus every structural problem found.
+    parser = _ResultsParser(source)
+    last = 0
+    for last, line in enumerate(text.splitlines(), start=1):
+        parser.feed(last, line)
+    parser.close_record()
+    parser.close_channel()
+    if not last or not text.strip():
+        parser.issue(0, "No results: the text is empty.")
+    elif not parser.channel_line and not parser.records:
+        parser.issue(1, "No CHANNEL line found.")
+    return parser.records, parser.issues
@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+import math
+import os
+import re
+from typing import Callable, Dict, List, Sequence
+
+# tiktoken if installed, else the heuristic; APP_TOKENIZER=tiktoken|heuristic (or a registered name) pins one.
+TOKENIZERS = ["tiktoken", "heuristic"]
+
+# English prose averages about four characters per token with GPT-style BPE vocabularies.
+CHARS_PER_TOKEN = 4.0
+
+TRUNCATION_MARKER = "\n\n[Content truncated to fit the token budget.]"
+
+Counter = Callable[[str], int]
+
+# Cut points tried in order: paragraph, line, word, then any character.
+_BOUNDARIES = [re.compile(r"\n\s*\n"), re.compile(r"\n"), re.compile(r"\s+")]
+
+
+def _heuristic_counter() -> Counter:
+    def count(text: str) -> int:
+        return math.ceil(len(text) / CHARS_PER_TOKEN)
+
+    return count
+
+
+def _tiktoken_counter() -> Counter:
+    import tiktoken
+
+    encoding = tiktoken.get_encoding("cl100k_base")
+
+    def count(text: str) -> int:
+        return len(encoding.encode(text, disallowed_special=()))
+
+    return count
+
+
+_FACTORIES: Dict[str, Callable[[], Counter]] = {
+    "tiktoken": _tiktoken_counter,
+    "heuristic": _heuristic_counter
+}
+
+# Picked on first use, so importing this module never loads a vocabulary.
+TOKENIZER = ""
+_count: Counter | None = None
+
+
+def register_tokenizer(name: str, factory: Callable[[], Counter]) -> None:
+    _FACTORIES[name] = factory
+    if name not in TOKENIZERS:
+        TOKENIZERS.insert(0, name)
+
+
+def available_tokenizers() -> List[str]:
+    names: List[str] = []
+    for name in TOKENIZERS:
+        try:
+            _FACTORIES[name]()
+        except Exception:
+            continue
+        names.append(name)
+    return names
+
+
+def use_tokenizer(name: str | None = None) -> str:
+    global TOKENIZER, _count
+    candidates = [name] if name else TOKENIZERS
+    for candidate in candidates:
+        if candidate not in _FACTORIES:
+            raise ValueError(f"Unknown tokenizer: {candidate}")
+        try:
+            # tiktoken may also fail while fetching its vocabulary, not only on import.
+            _count = _FACTORIES[candidate]()
+        except Exception:
+            continue
+        TOKENIZER = candidate
+        return TOKENIZER
+    raise ImportError(f"Tokenizer is not available: {name}")
+
+
+def _counter() -> Counter:
+    if _count is None:
+        try:
+            use_tokenizer(os.environ.get("APP_TOKENIZER", "").strip().lower() or None)
+        except (ImportError, ValueError):
+            use_tokenizer()
+    return _count
+
+
+def tokenizer_name() -> str:
+    _counter()
+    return TOKENIZER
+
+
+def count_tokens(text: str) -> int:
+    return _counter()(text) if text else 0
+
+
+def fit_text(text: str, max_tokens: int) -> str:
+    # Longest prefix that fits with the marker, cut at a paragraph, line, word or character boundary.
+    # A coarser cut is kept only if it still fills at least half of the budget. Same input, same output.
+    if count_tokens(text) <= max_tokens:
+        return text
+    budget = max_tokens - count_tokens(TRUNCATION_MARKER)
+    if budget <= 0:
+        return TRUNCATION_MARKER.strip()
+    best = ""
+    for boundary in _BOUNDARIES:
+        prefix = _longest_prefix(text, [match.start() for match in boundary.finditer(text)], budget)
+        if len(prefix) > len(best):
+            best = prefix
+        if count_tokens(best) * 2 >= budget:
+            return best + TRUNCATION_MARKER
+    prefix = _longest_prefix(text, range(1, len(text)), budget)
+    if len(prefix) > len(best):
+        best = prefix
+    return best + TRUNCATION_MARKER if best else TRUNCATION_MARKER.strip()
+
+
+def _longest_prefix(text: str, cuts: Sequence[int], budget: int) -> str:
+    # Binary search over cut positions; token counts grow with the prefix length.
+    low, high, best = 0, len(cuts) - 1, ""
+    while low <= high:
+        middle = (low + high) // 2
+        prefix = text[:cuts[middle]].rstrip()
+        if count_tokens(prefix) <= budget:
+            best, low = prefix, middle + 1
+        else:
+            high = middle - 1
+    return best
+
+
+def split_budget(sizes: List[int], total: int) -> List[int]:
+    # Equal shares of total; texts that need less than their share hand the rest to the others.
+    shares = [0] * len(sizes)
+    remaining = max(0, total)
+    order = sorted(range(len(sizes)), key=lambda index: (sizes[index], index))
+    for position, index in enumerate(order):
+        share = remaining // (len(order) - position)
+        shares[index] = min(sizes[index], share)
+        remaining -= shares[index]
+    return shares
+
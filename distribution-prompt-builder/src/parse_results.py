@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import argparse
+from dataclasses import asdict
+from pathlib import Path
+import sys
+import time
+from typing import BinaryIO, Iterable, Iterator, List, Tuple
+
+from core.results_parser import ResultIssue, ResultRecord, parse_results
+from utils.json_backend import dumps
+from utils.logger import error as log_error
+from utils.paths import get_outputs_dir
+
+
+FORMATS = ["jsonl", "json"]
+
+
+def collect_results(targets: Iterable[Path]) -> List[str]:
+    files: List[str] = []
+    for target in targets:
+        if target.is_dir():
+            files.extend(str(item) for item in sorted(target.rglob("*-results.txt")) if item.is_file())
+        elif target.is_file():
+            files.append(str(target))
+        else:
+            print(f"Skipping missing path: {target}", file=sys.stderr)
+    return files
+
+
+def parse_files(files: Iterable[str]) -> Iterator[Tuple[str, List[ResultRecord], List[ResultIssue]]]:
+    # One file in memory at a time.
+    for file_path in files:
+        try:
+            text = Path(file_path).read_text(encoding="utf-8")
+        except Exception as exc:
+            log_error(f"Failed to read results from {file_path}: {exc}")
+            yield file_path, [], [ResultIssue(file_path, 0, f"Failed to read results: {exc}")]
+            continue
+        records, issues = parse_results(text, file_path)
+        yield file_path, records, issues
+
+
+def write_records(
+    handle: BinaryIO,
+    parsed: Iterable[Tuple[str, List[ResultRecord], List[ResultIssue]]],
+    output_format: str
+) -> Tuple[int, int, int]:
+    # jsonl: one record per line as files are parsed; json: {"records": [...], "issues": [...]} at the end.
+    files = records = 0
+    issues: List[ResultIssue] = []
+    collected: List[dict] = []
+    for _, file_records, file_issues in parsed:
+        files += 1
+        records += len(file_records)
+        issues.extend(file_issues)
+        for issue in file_issues:
+            print(f"{issue.source}:{issue.line}: {issue.message}", file=sys.stderr)
+        if output_format == "jsonl":
+            for record in file_records:
+                handle.write(dumps(asdict(record), compact=True) + b"\n")
+        else:
+            collected.extend(asdict(record) for record in file_records)
+    if output_format == "json":
+        handle.write(dumps({"records": collected, "issues": [asdict(issue) for issue in issues]}) + b"\n")
+    return files, records, len(issues)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Parse distribution results (the LLM answers) into one JSON record per channel and locale."
+    )
+    parser.add_argument(
+        "paths",
+        nargs="*",
+        type=Path,
+        help="Results files or directories (all *-results.txt inside). Default: outputs/distribution-results."
+    )
+    parser.add_argument("--format", choices=FORMATS, default="jsonl")
+    parser.add_argument("--output", type=Path, default=None, help="Default: standard output.")
+    args = parser.parse_args()
+
+    files = collect_results(args.paths or [get_outputs_dir() / "distribution-results"])
+    if not files:
+        print("No results files found.", file=sys.stderr)
+        return 0
+
+    start = time.perf_counter()
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        with args.output.open("wb") as handle:
+            counts = write_records(handle, parse_files(files), args.format)
+    else:
+        counts = write_records(sys.stdout.buffer, parse_files(files), args.format)
+        sys.stdout.flush()
+    print(
+        f"{counts[0]} files, {counts[1]} records, {counts[2]} issues, {time.perf_counter() - start:.2f}s",
+        file=sys.stderr
+    )
+    return 1 if counts[2] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
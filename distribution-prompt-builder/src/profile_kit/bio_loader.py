@@ -1,14 +1,14 @@
 from __future__ import annotations
 
-import json
 from pathlib import Path
-from typing import Dict
-
-from PySide6.QtWidgets import QMessageBox
+from typing import Callable, Dict
 
 from .bio_models import BioEntry, BioKit, CHANNELS, LOCALES
+from utils.journal import read_journaled
 from utils.logger import error as log_error
 
+ErrorHandler = Callable[[str, str], None]
+
 
 def default_bio_entry(locale: str, channel: str) -> BioEntry:
     return BioEntry(
@@ -37,15 +37,14 @@ def default_bio_kit() -> BioKit:
     return BioKit(profiles=profiles)
 
 
-def load_bio_kit(path: str | Path) -> BioKit:
+def load_bio_kit(path: str | Path, on_error: ErrorHandler | None = None) -> BioKit:
     target = Path(path)
     if not target.exists():
         return default_bio_kit()
     try:
-        with target.open("r", encoding="utf-8") as handle:
-            data = json.load(handle)
-        return BioKit.from_dict(data)
+        return BioKit.from_dict(read_journaled(target))
     except Exception as exc:
         log_error(f"Failed to load bio kit from {target}: {exc}")
-        QMessageBox.critical(None, "Load error", f"Failed to load bios: {exc}")
+        if on_error:
+            on_error("Load error", f"Failed to load bios: {exc}")
         return default_bio_kit()
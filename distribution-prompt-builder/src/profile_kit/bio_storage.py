@@ -1,32 +1,36 @@
 from __future__ import annotations
 
-import json
 from pathlib import Path
-from typing import Dict
+from typing import Callable, Dict
 
 from .bio_models import BioKit
-from PySide6.QtWidgets import QMessageBox
+from utils.json_backend import dump
 from utils.logger import error as log_error
 from utils.logger import info as log_info
 
+ErrorHandler = Callable[[str, str], None]
+
 
 def ensure_dir(path: Path) -> None:
     path.mkdir(parents=True, exist_ok=True)
 
 
-def save_bios_json(path: str | Path, kit: BioKit) -> None:
+def save_bios_json(path: str | Path, kit: BioKit, on_error: ErrorHandler | None = None) -> bool:
     target = Path(path)
     ensure_dir(target.parent)
     try:
-        with target.open("w", encoding="utf-8") as handle:
-            json.dump(kit.to_dict(), handle, indent=2)
+        with target.open("wb") as handle:
+            dump(kit.to_dict(), handle)
         log_info(f"Saved bios JSON to {target}")
+        return True
     except Exception as exc:
         log_error(f"Failed to save bios JSON to {target}: {exc}")
-        QMessageBox.critical(None, "Save error", f"Failed to save bios JSON: {exc}")
+        if on_error:
+            on_error("Save error", f"Failed to save bios JSON: {exc}")
+        return False
 
 
-def save_bios_md(path: str | Path, kit: BioKit) -> None:
+def save_bios_md(path: str | Path, kit: BioKit, on_error: ErrorHandler | None = None) -> bool:
     target = Path(path)
     ensure_dir(target.parent)
     lines = []
@@ -44,18 +48,24 @@ def save_bios_md(path: str | Path, kit: BioKit) -> None:
         with target.open("w", encoding="utf-8") as handle:
             handle.write("\n".join(lines))
         log_info(f"Saved bios MD to {target}")
+        return True
     except Exception as exc:
         log_error(f"Failed to save bios MD to {target}: {exc}")
-        QMessageBox.critical(None, "Save error", f"Failed to save bios MD: {exc}")
+        if on_error:
+            on_error("Save error", f"Failed to save bios MD: {exc}")
+        return False
 
 
-def save_runtime_copy(path: str | Path, kit: BioKit) -> None:
+def save_runtime_copy(path: str | Path, kit: BioKit, on_error: ErrorHandler | None = None) -> bool:
     target = Path(path)
     ensure_dir(target.parent)
     try:
-        with target.open("w", encoding="utf-8") as handle:
-            json.dump(kit.to_dict(), handle, indent=2)
+        with target.open("wb") as handle:
+            dump(kit.to_dict(), handle)
         log_info(f"Saved runtime bios to {target}")
+        return True
     except Exception as exc:
         log_error(f"Failed to save runtime bios to {target}: {exc}")
-        QMessageBox.critical(None, "Save error", f"Failed to save runtime bios: {exc}")
+        if on_error:
+            on_error("Save error", f"Failed to save runtime bios: {exc}")
+        return False
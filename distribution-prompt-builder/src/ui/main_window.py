@@ -1,7 +1,6 @@
 from __future__ import annotations
 
-from typing import Dict, List
-import json
+from typing import Dict, List, Tuple
 from pathlib import Path
 
 from PySide6.QtWidgets import (
@@ -16,25 +15,40 @@ from PySide6.QtWidgets import (
     QLabel,
     QLineEdit,
     QMessageBox,
+    QPlainTextEdit,
+    QProgressBar,
     QPushButton,
     QRadioButton,
     QScrollArea,
+    QSpinBox,
     QTabWidget,
     QTextEdit,
     QVBoxLayout,
     QWidget
 )
-from PySide6.QtCore import QTimer
+from PySide6.QtCore import QTimer, Signal
 
 from core.channel_rules import CHANNEL_RULES
-from core.models import AffiliateLinks, GlobalInputs, LocaleContent, PromptResult
-from core.prompt_generator import generate_prompts
+from core.models import AffiliateLinks, GlobalInputs, LocaleContent, PromptResult, PromptSet
+from core.package_inputs import LINK_POLICY_LABELS
+from core.prefix_report import format_prefix_report, prefix_report, send_order
+from core.prompt_cache import PromptCache
+from core.prompt_generator import collect_prompts
+from core.tokens import tokenizer_name
 from profile_kit.bio_generator import build_bio_generation_prompt, build_bio_generation_prompt_all
 from profile_kit.bio_loader import default_bio_kit, load_bio_kit
 from profile_kit.bio_models import BIO_FIELDS, CHANNELS, LOCALES, BioKit
 from profile_kit.bio_storage import save_bios_json, save_bios_md, save_runtime_copy
+from ui.tasks import CancelToken, Progress, TaskRunner, checked
 from utils.clipboard import copy_to_clipboard
-from utils.io import save_all_prompts, save_per_channel, save_results_templates, load_content_package
+from utils.json_backend import dump, loads
+from utils.io import (
+    load_content_package,
+    save_articles,
+    save_per_channel,
+    save_prompt_stream,
+    save_results_templates
+)
 from utils.logger import info, warn, error
 from utils.paths import (
     ensure_app_dirs,
@@ -43,10 +57,20 @@ from utils.paths import (
     get_outputs_dir,
     get_repo_schema_path
 )
-from utils.validators import infer_title_from_content, validate_inputs, validate_blog_url, validate_slug
+from utils.journal import save_journaled
+from utils.save_service import SaveService
+from utils.validators import (
+    infer_title_from_content,
+    validate_inputs,
+    validate_blog_url,
+    validate_slug,
+    warm_validator_cache
+)
 
 
 class MainWindow(QWidget):
+    profile_saved = Signal(bool, str)
+
     def __init__(self) -> None:
         super().__init__()
         self.setWindowTitle("distribution-prompt-builder")
@@ -58,13 +82,19 @@ class MainWindow(QWidget):
         self.profile_md_path = get_app_root() / "profile-kit" / "bios.md"
         self.profile_export_dir = get_outputs_dir() / "profile-kit"
         self.schema_path = get_repo_schema_path()
+        warm_validator_cache(self.schema_path)
 
         ensure_app_dirs()
         (get_app_root() / "profile-kit").mkdir(parents=True, exist_ok=True)
 
-        self.bio_kit: BioKit = load_bio_kit(self.profile_data_path)
+        self.bio_kit: BioKit = load_bio_kit(self.profile_data_path, on_error=self._show_error)
         if not self.profile_data_path.exists():
-            save_runtime_copy(self.profile_data_path, self.bio_kit)
+            save_runtime_copy(self.profile_data_path, self.bio_kit, on_error=self._show_error)
+        self._save_service = SaveService()
+        self.profile_saved.connect(self._handle_profile_saved)
+        # Generate, import and save run on a thread pool; their results come back on the GUI thread.
+        self._tasks = TaskRunner(self)
+        self._tasks.busy_changed.connect(self._handle_busy_changed)
 
         self.translation_key = QLineEdit()
         self.author = QLineEdit()
@@ -110,12 +140,27 @@ class MainWindow(QWidget):
         self.length = QComboBox()
         self.length.addItems(["Short", "Standard", "Long"])
 
+        self.token_budget = QSpinBox()
+        self.token_budget.setRange(0, 2_000_000)
+        self.token_budget.setSingleStep(1000)
+        self.token_budget.setSpecialValueText("Off")
+        self.token_budget.setSuffix(" tokens")
+        self.token_budget.setToolTip("Shorten the article content so each prompt fits this many tokens.")
+
         self.generate_variants = QCheckBox("Generate 2 variants per channel")
         self.generate_variants.setChecked(True)
 
         self.include_comments = QCheckBox("Include comment templates")
         self.include_comments.setChecked(True)
 
+        self.reference_content = QCheckBox("Store article bodies once (expanded on copy)")
+
+        self.prompt_layout = QComboBox()
+        self.prompt_layout.addItems(["Standard", "Prefix cache"])
+        self.prompt_layout.setToolTip(
+            "Prefix cache puts the shared instructions and the article first, so consecutive prompts start the same."
+        )
+
         self.linkedin_generate_comment = QCheckBox("Generate first comment")
         self.linkedin_generate_comment.setChecked(True)
         self.linkedin_cta_policy = QComboBox()
@@ -145,6 +190,16 @@ class MainWindow(QWidget):
         self.save_per_channel_button = QPushButton("Save to file (per channel)")
         self.save_per_channel_button.clicked.connect(self.handle_save_per_channel)
 
+        self.prefix_report_button = QPushButton("Prefix report")
+        self.prefix_report_button.clicked.connect(self.handle_prefix_report)
+
+        self.task_progress = QProgressBar()
+        self.task_progress.setRange(0, 100)
+        self.task_progress.setVisible(False)
+        self.cancel_task_button = QPushButton("Cancel")
+        self.cancel_task_button.setVisible(False)
+        self.cancel_task_button.clicked.connect(lambda: self._tasks.cancel())
+
         layout = QVBoxLayout()
         self.main_tabs = QTabWidget()
         self.main_tabs.addTab(self._build_distribution_tab(), "Distribution")
@@ -152,9 +207,15 @@ class MainWindow(QWidget):
         layout.addWidget(self.main_tabs)
         self.setLayout(layout)
 
-        self._last_prompts = []
-        self._bundle_by_channel: Dict[str, str] = {}
-        self._channel_outputs: Dict[str, Dict[str, QTextEdit]] = {}
+        self._prompt_set = PromptSet()
+        self._prompt_cache = PromptCache()
+        # Output widgets are built the first time a tab is shown and kept across regenerations.
+        self._channel_tabs: Dict[str, QWidget] = {}
+        self._locale_tabs: Dict[str, QTabWidget] = {}
+        self._output_views: Dict[Tuple[str, str], QPlainTextEdit] = {}
+        self._tab_texts: Dict[Tuple[str, str], str] = {}
+        self._token_labels: Dict[Tuple[str, str], QLabel] = {}
+        self._token_counts: Dict[Tuple[str, str], Tuple[str, int]] = {}
         self._last_global_inputs: GlobalInputs | None = None
         self._loading_profile = False
 
@@ -232,6 +293,9 @@ class MainWindow(QWidget):
         group.setLayout(layout)
         return group
 
+    def _show_error(self, title: str, message: str) -> None:
+        QMessageBox.critical(self, title, message)
+
     def _setup_locale_tabs(self) -> None:
         for locale in ["en", "pt", "es", "it"]:
             tab = QWidget()
@@ -275,8 +339,11 @@ class MainWindow(QWidget):
         form.addRow("Tone", self.tone)
         form.addRow("Persona", self.persona)
         form.addRow("Length", self.length)
+        form.addRow("Token budget", self.token_budget)
+        form.addRow("Prompt layout", self.prompt_layout)
         form.addRow("", self.generate_variants)
         form.addRow("", self.include_comments)
+        form.addRow("", self.reference_content)
         form.addRow("LinkedIn options", self._build_linkedin_options())
         group.setLayout(form)
         return group
@@ -294,13 +361,17 @@ class MainWindow(QWidget):
         group = QGroupBox("Generated prompts")
         layout = QVBoxLayout()
         self.output_tabs = QTabWidget()
+        self.output_tabs.currentChanged.connect(lambda _: self._show_current_output())
         layout.addWidget(self.output_tabs)
 
         buttons = QHBoxLayout()
         buttons.addWidget(self.copy_button)
         buttons.addWidget(self.save_button)
         buttons.addWidget(self.save_per_channel_button)
+        buttons.addWidget(self.prefix_report_button)
         buttons.addStretch(1)
+        buttons.addWidget(self.task_progress)
+        buttons.addWidget(self.cancel_task_button)
 
         layout.addLayout(buttons)
         group.setLayout(layout)
@@ -404,7 +475,10 @@ class MainWindow(QWidget):
             allow_affiliate_override=self.affiliate_override.isChecked(),
             distribution_mode="separate" if self.distribution_separate.isChecked() else "single",
             linkedin_generate_comment=self.linkedin_generate_comment.isChecked(),
-            linkedin_cta_policy=self.linkedin_cta_policy.currentText()
+            linkedin_cta_policy=self.linkedin_cta_policy.currentText(),
+            token_budget=self.token_budget.value(),
+            content_mode="reference" if self.reference_content.isChecked() else "inline",
+            prompt_layout="prefix-cache" if self.prompt_layout.currentIndex() == 1 else "standard"
         )
 
     def _collect_affiliate_links(self) -> AffiliateLinks:
@@ -493,76 +567,159 @@ class MainWindow(QWidget):
                 )
                 return
 
-        bundle_by_channel, prompts = generate_prompts(
-            global_inputs,
-            locale_contents,
-            self._collect_affiliate_links(),
-            channels,
-            self.bio_kit
-        )
-        if not prompts:
-            QMessageBox.warning(self, "No prompts", "No prompts were generated. Check content fields.")
-            return
+        affiliate_links = self._collect_affiliate_links()
+        bio_kit = self.bio_kit
+        cache = self._prompt_cache
 
-        self._last_prompts = prompts
-        self._bundle_by_channel = bundle_by_channel
-        self._last_global_inputs = global_inputs
-        self._render_outputs(channels, locale_contents)
-        info("Prompts generated.")
+        def work(token: CancelToken, report: Progress) -> PromptSet:
+            # Generate tasks never overlap (one task per name), so the cache is only used by one thread at a time.
+            def on_result(result: PromptResult) -> None:
+                token.check()
+                report(100 * (channels.index(result.channel) + 1) // len(channels), f"Generating {result.channel}")
 
-        missing_titles = [
-            locale for locale, item in locale_contents.items() if not item.title and item.content
-        ]
-        if missing_titles:
-            QMessageBox.information(
-                self,
-                "Title inferred",
-                "Some titles were inferred from content: " + ", ".join(missing_titles)
+            return collect_prompts(
+                global_inputs, locale_contents, affiliate_links, channels, bio_kit, cache=cache, on_result=on_result
             )
 
+        def done(prompt_set: PromptSet) -> None:
+            if not prompt_set:
+                QMessageBox.warning(self, "No prompts", "No prompts were generated. Check content fields.")
+                return
+
+            self._prompt_set = prompt_set
+            self._last_global_inputs = global_inputs
+            updated = self._render_outputs(channels, locale_contents)
+            info(f"Prompts generated ({len(prompt_set)} prompts, shown tab {'updated' if updated else 'unchanged'}).")
+
+            missing_titles = [
+                locale for locale, item in locale_contents.items() if not item.title and item.content
+            ]
+            if missing_titles:
+                QMessageBox.information(
+                    self,
+                    "Title inferred",
+                    "Some titles were inferred from content: " + ", ".join(missing_titles)
+                )
+
+        self._tasks.start(
+            "generate",
+            work,
+            done,
+            on_progress=self._show_task_progress,
+            on_error=lambda message: self._show_error("Generate error", f"Failed to generate prompts: {message}"),
+            on_cancelled=lambda: info("Prompt generation cancelled.")
+        )
+
     def handle_copy(self) -> None:
-        if not self._last_prompts:
+        if not self._prompt_set:
             QMessageBox.warning(self, "No prompts", "Generate prompts first.")
             return
-        global_inputs = self._collect_global_inputs()
-        if global_inputs.distribution_mode == "separate":
-            full_text = "\n\n".join(self._bundle_by_channel.values())
-        else:
-            full_text = "\n\n".join([item.prompt_text for item in self._last_prompts])
-        copy_to_clipboard(full_text)
+        copy_to_clipboard(self._prompt_set.expand("\n\n".join(self._prompt_set.bundles().values())))
+
+    def handle_prefix_report(self) -> None:
+        if not self._prompt_set:
+            QMessageBox.warning(self, "No prompts", "Generate prompts first.")
+            return
+        report = prefix_report(send_order(self._prompt_set))
+        info(f"Prefix report: {report.shared_tokens} of {report.total_tokens} tokens in shared prefixes.")
+        QMessageBox.information(self, "Prefix report", format_prefix_report(report))
 
     def handle_save_all(self) -> None:
-        if not self._last_prompts:
+        if not self._prompt_set:
             QMessageBox.warning(self, "No prompts", "Generate prompts first.")
             return
-        global_inputs = self._collect_global_inputs()
-        if global_inputs.distribution_mode == "separate":
-            bundle_results = [
-                PromptResult(channel=channel, locale="bundle", variant="A", prompt_text=text)
-                for channel, text in self._bundle_by_channel.items()
-            ]
-            path = save_all_prompts(self.outputs_dir, global_inputs.translation_key, bundle_results)
-        else:
-            path = save_all_prompts(self.outputs_dir, global_inputs.translation_key, self._last_prompts)
-        save_results_templates(
-            get_outputs_dir() / "distribution-results",
-            global_inputs.translation_key,
-            self._selected_channels()
-        )
-        QMessageBox.information(self, "Saved", f"Saved to {path}")
+        translation_key = self._collect_global_inputs().translation_key
+        channels = self._selected_channels()
+        prompt_set = self._prompt_set
+
+        def work(token: CancelToken, report: Progress) -> Tuple[List[str], List[Tuple[str, str]]]:
+            errors: List[Tuple[str, str]] = []
+            paths, _ = save_prompt_stream(
+                self.outputs_dir,
+                translation_key,
+                checked(prompt_set, len(prompt_set), token, report, "Saving prompts"),
+                separate=prompt_set.separate,
+                per_channel=False,
+                articles=prompt_set.articles,
+                on_error=lambda title, message: errors.append((title, message))
+            )
+            save_results_templates(
+                get_outputs_dir() / "distribution-results",
+                translation_key,
+                channels,
+                on_error=lambda title, message: errors.append((title, message))
+            )
+            return paths, errors
+
+        def done(outcome: Tuple[List[str], List[Tuple[str, str]]]) -> None:
+            paths, errors = outcome
+            self._report_save(paths, errors, f"Saved to {paths[0]}" if paths else "")
+
+        self._start_save(work, done)
 
     def handle_save_per_channel(self) -> None:
-        if not self._last_prompts:
+        if not self._prompt_set:
             QMessageBox.warning(self, "No prompts", "Generate prompts first.")
             return
-        global_inputs = self._collect_global_inputs()
-        paths = save_per_channel(self.outputs_dir, global_inputs.translation_key, self._bundle_by_channel)
-        save_results_templates(
-            get_outputs_dir() / "distribution-results",
-            global_inputs.translation_key,
-            self._selected_channels()
+        translation_key = self._collect_global_inputs().translation_key
+        channels = self._selected_channels()
+        prompt_set = self._prompt_set
+
+        def work(token: CancelToken, report: Progress) -> Tuple[List[str], List[Tuple[str, str]]]:
+            errors: List[Tuple[str, str]] = []
+            on_error = lambda title, message: errors.append((title, message))
+            channel_names = list(prompt_set.by_channel)
+            bundles = {
+                channel: prompt_set.bundle(channel)
+                for channel in checked(channel_names, len(channel_names), token, report, "Joining bundles")
+            }
+            token.check()
+            paths = save_per_channel(self.outputs_dir, translation_key, bundles, on_error=on_error)
+            if prompt_set.articles:
+                path = save_articles(self.outputs_dir, translation_key, prompt_set.articles, on_error=on_error)
+                if path:
+                    paths.append(path)
+            save_results_templates(
+                get_outputs_dir() / "distribution-results", translation_key, channels, on_error=on_error
+            )
+            return paths, errors
+
+        def done(outcome: Tuple[List[str], List[Tuple[str, str]]]) -> None:
+            paths, errors = outcome
+            self._report_save(paths, errors, "Saved files:\n" + "\n".join(paths))
+
+        self._start_save(work, done)
+
+    def _start_save(self, work, done) -> None:
+        self._tasks.start(
+            "save",
+            work,
+            done,
+            on_progress=self._show_task_progress,
+            on_error=lambda message: self._show_error("Save error", f"Failed to save prompts: {message}"),
+            on_cancelled=lambda: info("Saving cancelled; files already written were kept.")
         )
-        QMessageBox.information(self, "Saved", "Saved files:\n" + "\n".join(paths))
+
+    def _report_save(self, paths: List[str], errors: List[Tuple[str, str]], saved_message: str) -> None:
+        # "Saved" only when files were written and nothing failed; otherwise one warning lists every problem.
+        if paths and not errors:
+            QMessageBox.information(self, "Saved", saved_message)
+            return
+        problems = [f"{title}: {message}" for title, message in errors] or ["No files were written."]
+        heading = "Save incomplete" if paths else "Save failed"
+        warn(f"{heading}: " + "; ".join(problems))
+        lines = problems + (["", "Files written:"] + paths if paths else [])
+        QMessageBox.warning(self, heading, "\n".join(lines))
+
+    def _show_task_progress(self, percent: int, message: str) -> None:
+        self.task_progress.setValue(percent)
+        self.task_progress.setFormat(f"{message} (%p%)")
+
+    def _handle_busy_changed(self, busy: bool) -> None:
+        self.task_progress.setValue(0)
+        self.task_progress.setFormat("%p%")
+        self.task_progress.setVisible(busy)
+        self.cancel_task_button.setVisible(busy)
 
     def handle_save_draft(self) -> None:
         global_inputs = self._collect_global_inputs()
@@ -587,7 +744,10 @@ class MainWindow(QWidget):
                 "linkedinCtaPolicy": global_inputs.linkedin_cta_policy,
                 "tone": global_inputs.tone,
                 "persona": global_inputs.persona,
-                "length": global_inputs.length
+                "length": global_inputs.length,
+                "tokenBudget": global_inputs.token_budget,
+                "contentMode": global_inputs.content_mode,
+                "promptLayout": global_inputs.prompt_layout
             },
             "affiliate": {
                 "en": self.affiliate_en.text().strip(),
@@ -612,8 +772,8 @@ class MainWindow(QWidget):
         draft_dir.mkdir(parents=True, exist_ok=True)
         path = draft_dir / f"{global_inputs.translation_key}-distributor.json"
         try:
-            with path.open("w", encoding="utf-8") as handle:
-                json.dump(data, handle, indent=2)
+            with path.open("wb") as handle:
+                dump(data, handle)
             info(f"Draft saved to {path}")
             QMessageBox.information(self, "Saved", f"Draft saved to {path}")
         except Exception as exc:
@@ -629,8 +789,7 @@ class MainWindow(QWidget):
             return
         target = Path(file_name)
         try:
-            with target.open("r", encoding="utf-8") as handle:
-                data = json.load(handle)
+            data = loads(target.read_bytes())
         except Exception as exc:
             error(f"Failed to load draft from {target}: {exc}")
             QMessageBox.critical(self, "Load error", f"Failed to load draft: {exc}")
@@ -652,6 +811,9 @@ class MainWindow(QWidget):
         self.length.setCurrentText(global_data.get("length", "standard").capitalize())
         self.linkedin_generate_comment.setChecked(global_data.get("linkedinGenerateComment", True))
         self.linkedin_cta_policy.setCurrentText(global_data.get("linkedinCtaPolicy", "Link in comments"))
+        self.token_budget.setValue(int(global_data.get("tokenBudget", 0) or 0))
+        self.reference_content.setChecked(global_data.get("contentMode") == "reference")
+        self.prompt_layout.setCurrentIndex(1 if global_data.get("promptLayout") == "prefix-cache" else 0)
 
         if global_data.get("distributionMode") == "single":
             self.distribution_single.setChecked(True)
@@ -679,78 +841,127 @@ class MainWindow(QWidget):
             checkbox.setChecked(name in channels)
         info(f"Draft loaded from {file_name}")
 
-    def _render_outputs(self, channels: List[str], locale_contents: Dict[str, LocaleContent]) -> None:
-        self.output_tabs.clear()
-        self._channel_outputs.clear()
-        locales = ["en", "pt", "es", "it"]
-
-        for channel in channels:
-            channel_tab = QWidget()
-            channel_layout = QVBoxLayout(channel_tab)
-            locale_tabs = QTabWidget()
-            self._channel_outputs[channel] = {}
-
-            for locale in locales:
-                locale_tab = QWidget()
-                locale_layout = QVBoxLayout(locale_tab)
-                text_area = QTextEdit()
-                text_area.setReadOnly(True)
-                prompt = self._resolve_prompt_text(channel, locale)
-                text_area.setPlainText(prompt)
-                locale_layout.addWidget(text_area)
-
-                button_row = QHBoxLayout()
-                copy_button = QPushButton("Copy this")
-                copy_button.clicked.connect(lambda _, t=text_area: copy_to_clipboard(t.toPlainText()))
-                channel_copy = QPushButton("Copy all for this channel")
-                channel_copy.clicked.connect(
-                    lambda _, c=channel: copy_to_clipboard(self._bundle_by_channel.get(c, ""))
-                )
-                button_row.addWidget(copy_button)
-                button_row.addWidget(channel_copy)
-                button_row.addStretch(1)
-                locale_layout.addLayout(button_row)
-
-                locale_tabs.addTab(locale_tab, locale.upper())
-                self._channel_outputs[channel][locale] = text_area
-
-            channel_layout.addWidget(locale_tabs)
-            channel_actions = QHBoxLayout()
-            copy_channel = QPushButton("Copy all for this channel")
-            copy_channel.clicked.connect(
-                lambda _, c=channel: copy_to_clipboard(self._bundle_by_channel.get(c, ""))
-            )
-            channel_actions.addWidget(copy_channel)
-            channel_actions.addStretch(1)
-            channel_layout.addLayout(channel_actions)
-
-            self.output_tabs.addTab(channel_tab, channel)
+    def _render_outputs(self, channels: List[str], locale_contents: Dict[str, LocaleContent]) -> int:
+        # Only the tab on screen is filled in now; the others are filled in when they are first shown.
+        current = [self.output_tabs.tabText(index) for index in range(self.output_tabs.count())]
+        if current != channels:
+            self.output_tabs.blockSignals(True)
+            while self.output_tabs.count():
+                # removeTab keeps the page, so a channel selected again later reuses its widgets.
+                self.output_tabs.removeTab(0)
+            for channel in channels:
+                self.output_tabs.addTab(self._channel_tab(channel), channel)
+            self.output_tabs.blockSignals(False)
+        return self._show_current_output()
+
+    def _channel_tab(self, channel: str) -> QWidget:
+        if channel in self._channel_tabs:
+            return self._channel_tabs[channel]
+        channel_tab = QWidget()
+        channel_layout = QVBoxLayout(channel_tab)
+        locale_tabs = QTabWidget()
+        for locale in ["en", "pt", "es", "it"]:
+            # Empty page until the tab is first shown.
+            placeholder = QWidget()
+            QVBoxLayout(placeholder)
+            locale_tabs.addTab(placeholder, locale.upper())
+        locale_tabs.currentChanged.connect(lambda _: self._show_current_output())
+        channel_layout.addWidget(locale_tabs)
+
+        channel_actions = QHBoxLayout()
+        copy_channel = QPushButton("Copy all for this channel")
+        copy_channel.clicked.connect(
+            lambda _, c=channel: copy_to_clipboard(self._prompt_set.expand(self._prompt_set.bundle(c)))
+        )
+        channel_actions.addWidget(copy_channel)
+        channel_actions.addStretch(1)
+        channel_layout.addLayout(channel_actions)
+
+        self._channel_tabs[channel] = channel_tab
+        self._locale_tabs[channel] = locale_tabs
+        return channel_tab
+
+    def _show_current_output(self) -> int:
+        index = self.output_tabs.currentIndex()
+        if index < 0 or not self._prompt_set:
+            return 0
+        channel = self.output_tabs.tabText(index)
+        locale_tabs = self._locale_tabs[channel]
+        return int(self._refresh_output(channel, locale_tabs.tabText(locale_tabs.currentIndex()).lower()))
+
+    def _refresh_output(self, channel: str, locale: str) -> bool:
+        key = (channel, locale)
+        view = self._output_views.get(key)
+        if view is None:
+            view = self._build_output_view(channel, locale)
+        prompt = self._resolve_prompt_text(channel, locale)
+        updated = prompt != self._tab_texts.get(key)
+        if updated:
+            view.setPlainText(prompt)
+            self._tab_texts[key] = prompt
+        self._token_labels[key].setText(self._token_summary(channel, locale, prompt))
+        return updated
+
+    def _build_output_view(self, channel: str, locale: str) -> QPlainTextEdit:
+        locale_tabs = self._locale_tabs[channel]
+        locale_layout = locale_tabs.widget(["en", "pt", "es", "it"].index(locale)).layout()
+        view = QPlainTextEdit()
+        view.setReadOnly(True)
+        locale_layout.addWidget(view)
 
-    def _resolve_prompt_text(self, channel: str, locale: str) -> str:
-        if self._last_global_inputs and self._last_global_inputs.distribution_mode == "separate":
-            bundle = self._bundle_by_channel.get(channel, "")
-            return self._extract_locale_block(bundle, locale, channel)
-        return "\n\n".join(
-            [
-                item.prompt_text
-                for item in self._last_prompts
-                if item.channel == channel and item.locale == locale
-            ]
+        button_row = QHBoxLayout()
+        copy_button = QPushButton("Copy this")
+        copy_button.clicked.connect(
+            lambda _, c=channel, loc=locale: copy_to_clipboard(self._prompt_set.expand(self._prompt_set.view(c, loc)))
+        )
+        channel_copy = QPushButton("Copy all for this channel")
+        channel_copy.clicked.connect(
+            lambda _, c=channel: copy_to_clipboard(self._prompt_set.expand(self._prompt_set.bundle(c)))
         )
+        token_label = QLabel()
+        self._token_labels[(channel, locale)] = token_label
+        button_row.addWidget(copy_button)
+        button_row.addWidget(channel_copy)
+        button_row.addStretch(1)
+        button_row.addWidget(token_label)
+        locale_layout.addLayout(button_row)
+
+        self._output_views[(channel, locale)] = view
+        return view
+
+    def _count_tokens(self, key: Tuple[str, str], text: str) -> int:
+        # Counting can be slow with a real tokenizer, so unchanged texts keep their previous count.
+        cached = self._token_counts.get(key)
+        if cached and cached[0] == text:
+            return cached[1]
+        tokens = self._prompt_set.token_count(text)
+        self._token_counts[key] = (text, tokens)
+        return tokens
+
+    def _token_summary(self, channel: str, locale: str, prompt: str) -> str:
+        if self._prompt_set.separate:
+            # The whole bundle is what gets sent, so it is the count that matters for the budget.
+            view_tokens = self._count_tokens((channel, locale), prompt)
+            tokens = self._count_tokens((channel, "bundle"), self._prompt_set.bundle(channel))
+            summary = f"~{view_tokens:,} tokens in this view, ~{tokens:,} in the channel bundle"
+        else:
+            # The tab shows every variant; the budget applies to each prompt on its own.
+            results = self._prompt_set.get(channel, locale)
+            tokens = max(
+                [self._count_tokens((channel, f"{locale}:{item.variant}"), item.prompt_text) for item in results],
+                default=0
+            )
+            summary = f"~{tokens:,} tokens" + (" per variant" if len(results) > 1 else "")
+        budget = self._last_global_inputs.token_budget if self._last_global_inputs else 0
+        if budget and tokens > budget:
+            summary += f" - over the {budget:,} token budget"
+            floor = max((item.budget_floor for item in self._prompt_set.get(channel, locale)), default=0)
+            if floor:
+                summary += f", which is below the ~{floor:,} tokens of fixed prompt text"
+        return f"{summary} ({tokenizer_name()})"
 
-    def _extract_locale_block(self, bundle: str, locale: str, channel: str) -> str:
-        marker = f"=== LOCALE: {locale.upper()} ==="
-        if marker not in bundle:
-            return bundle
-        parts = bundle.split(marker)
-        if len(parts) < 2:
-            return bundle
-        tail = parts[1]
-        next_marker = tail.find("=== LOCALE:")
-        if next_marker != -1:
-            tail = tail[:next_marker]
-        header = bundle.split("Return exactly this structure and nothing else:", 1)[0]
-        return f"{header.strip()}\nReturn exactly this structure and nothing else:\nCHANNEL: {channel}\n{marker}{tail}"
+    def _resolve_prompt_text(self, channel: str, locale: str) -> str:
+        return self._prompt_set.view(channel, locale)
 
     def _load_profile_fields(self) -> None:
         locale = self.profile_locale.currentText().lower()
@@ -809,25 +1020,25 @@ class MainWindow(QWidget):
         channel = self.profile_channel.currentText()
         entry = self._collect_profile_entry()
         self.bio_kit.profiles.setdefault(locale, {})[channel] = entry
-        save_bios_json(self.profile_json_path, self.bio_kit)
-        save_bios_md(self.profile_md_path, self.bio_kit)
-        save_runtime_copy(self.profile_data_path, self.bio_kit)
+        save_bios_json(self.profile_json_path, self.bio_kit, on_error=self._show_error)
+        save_bios_md(self.profile_md_path, self.bio_kit, on_error=self._show_error)
+        self._queue_runtime_copy()
         self.profile_status.setText("Saved")
         QMessageBox.information(self, "Saved", "Profile kit saved.")
 
     def _reset_bio_kit(self) -> None:
         self.bio_kit = default_bio_kit()
-        save_runtime_copy(self.profile_data_path, self.bio_kit)
+        self._queue_runtime_copy()
         self._load_profile_fields()
         self.profile_status.setText("Saved")
         QMessageBox.information(self, "Reset", "Profile kit reset to defaults.")
 
     def _export_profile_json(self) -> None:
-        save_bios_json(self.profile_export_dir / "bios.json", self.bio_kit)
+        save_bios_json(self.profile_export_dir / "bios.json", self.bio_kit, on_error=self._show_error)
         QMessageBox.information(self, "Exported", "Profile kit JSON exported.")
 
     def _export_profile_md(self) -> None:
-        save_bios_md(self.profile_export_dir / "bios.md", self.bio_kit)
+        save_bios_md(self.profile_export_dir / "bios.md", self.bio_kit, on_error=self._show_error)
         QMessageBox.information(self, "Exported", "Profile kit MD exported.")
 
     def _generate_bio_prompt_language(self) -> None:
@@ -838,14 +1049,62 @@ class MainWindow(QWidget):
         self.bio_prompt_output.setPlainText(build_bio_generation_prompt_all())
 
     def _autosave_profile_kit(self) -> None:
-        save_runtime_copy(self.profile_data_path, self.bio_kit)
-        self.profile_status.setText("Saved")
+        self._queue_runtime_copy()
+
+    def _queue_runtime_copy(self) -> None:
+        # to_dict() snapshots the kit; the save thread appends only the changed fields to the journal.
+        self._save_service.submit(
+            self.profile_data_path,
+            self.bio_kit.to_dict(),
+            on_done=lambda ok, message: self.profile_saved.emit(ok, message),
+            write=save_journaled
+        )
+
+    def _handle_profile_saved(self, ok: bool, message: str) -> None:
+        if not ok:
+            self._show_error("Save error", message)
+        elif not self._autosave_timer.isActive() and not self._save_service.pending():
+            self.profile_status.setText("Saved")
+
+    def closeEvent(self, event) -> None:
+        if self._autosave_timer.isActive():
+            self._autosave_timer.stop()
+            self._autosave_profile_kit()
+        self._save_service.close()
+        self._tasks.cancel()
+        self._tasks.wait()
+        super().closeEvent(event)
 
     def handle_import_package(self) -> None:
         file_name, _ = QFileDialog.getOpenFileName(self, "Import Content Package", "", "JSON Files (*.json)")
         if not file_name:
             return
-        data, errors = load_content_package(file_name, self.schema_path)
+        schema_path = self.schema_path
+
+        def work(token: CancelToken, report: Progress) -> Tuple[Dict[str, object], List[str], List[Tuple[str, str]]]:
+            report(0, "Importing package")
+            read_errors: List[Tuple[str, str]] = []
+            data, errors = load_content_package(
+                file_name, schema_path, on_error=lambda title, message: read_errors.append((title, message))
+            )
+            return data, errors, read_errors
+
+        def done(outcome: Tuple[Dict[str, object], List[str], List[Tuple[str, str]]]) -> None:
+            data, errors, read_errors = outcome
+            for title, message in read_errors:
+                self._show_error(title, message)
+            self._apply_package(data, errors)
+
+        self._tasks.start(
+            "import",
+            work,
+            done,
+            on_progress=self._show_task_progress,
+            on_error=lambda message: self._show_error("Import error", f"Failed to import package: {message}"),
+            on_cancelled=lambda: info("Package import cancelled.")
+        )
+
+    def _apply_package(self, data: Dict[str, object], errors: List[str]) -> None:
         if errors:
             QMessageBox.critical(self, "Invalid package", "\n".join(errors))
             warn("Import failed: " + "; ".join(errors))
@@ -854,12 +1113,7 @@ class MainWindow(QWidget):
         self.blog_url.setText(data["global"]["blogUrl"])
         self.author.setText(data["global"].get("author", ""))
         policy = data["global"].get("linkPolicy", "no-links")
-        policy_map = {
-            "no-links": "No links",
-            "blog-only": "Blog link only",
-            "blog-and-affiliate": "Blog link + optional affiliate link (non-Reddit/Quora only)"
-        }
-        self.link_policy.setCurrentText(policy_map.get(policy, "No links"))
+        self.link_policy.setCurrentText(LINK_POLICY_LABELS.get(policy, "No links"))
         locales = data.get("locales", {})
         for locale in ["en", "pt", "es", "it"]:
             loc = locales.get(locale, {})
@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from itertools import count
+import threading
+from typing import Callable, Dict, Iterable, Iterator, Tuple, TypeVar
+
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal
+
+from utils.logger import error
+
+Progress = Callable[[int, str], None]
+T = TypeVar("T")
+
+
+class TaskCancelled(Exception):
+    pass
+
+
+class CancelToken:
+    # Checked by the work between steps; a step that is already running is never interrupted.
+    def __init__(self) -> None:
+        self._event = threading.Event()
+
+    def cancel(self) -> None:
+        self._event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def check(self) -> None:
+        if self._event.is_set():
+            raise TaskCancelled()
+
+
+Work = Callable[[CancelToken, Progress], object]
+
+
+def checked(items: Iterable[T], total: int, token: CancelToken, report: Progress, message: str) -> Iterator[T]:
+    # Passes items through, checking for cancellation before each one and reporting progress in whole percents.
+    last = -1
+    for index, item in enumerate(items):
+        token.check()
+        percent = 100 * index // total if total else 0
+        if percent != last:
+            report(percent, message)
+            last = percent
+        yield item
+
+
+@dataclass
+class _Callbacks:
+    on_done: Callable[[object], None]
+    on_progress: Progress | None = None
+    on_error: Callable[[str], None] | None = None
+    on_cancelled: Callable[[], None] | None = None
+
+
+class _Task(QRunnable):
+    def __init__(self, runner: "TaskRunner", task_id: int, work: Work, token: CancelToken) -> None:
+        super().__init__()
+        # Owned by the runner until it completes, not deleted by the pool behind Python's back.
+        self.setAutoDelete(False)
+        self._runner = runner
+        self._task_id = task_id
+        self._work = work
+        self.token = token
+
+    def run(self) -> None:
+        # Pool thread: widgets must not be touched here, results go back through the runner's signals.
+        def report(percent: int, message: str) -> None:
+            self._runner.progressed.emit(self._task_id, percent, message)
+
+        try:
+            result = self._work(self.token, report)
+        except TaskCancelled:
+            self._runner.completed.emit(self._task_id, "cancelled", None)
+            return
+        except Exception as exc:
+            error(f"Background task failed: {exc}")
+            self._runner.completed.emit(self._task_id, "failed", str(exc))
+            return
+        self._runner.completed.emit(self._task_id, "cancelled" if self.token.cancelled else "done", result)
+
+
+class TaskRunner(QObject):
+    # Runs work(token, report) on a thread pool; every callback is delivered on the GUI thread.
+    # One task per name at a time: starting a name again cancels the running task and queues the new one after it.
+    progressed = Signal(int, int, str)
+    completed = Signal(int, str, object)
+    busy_changed = Signal(bool)
+
+    def __init__(self, parent: QObject | None = None, max_threads: int = 2) -> None:
+        super().__init__(parent)
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(max_threads)
+        self._ids = count(1)
+        self._running: Dict[str, Tuple[int, _Task, _Callbacks]] = {}
+        self._queued: Dict[str, Tuple[Work, _Callbacks, CancelToken]] = {}
+        self.progressed.connect(self._handle_progress)
+        self.completed.connect(self._handle_completed)
+
+    def start(
+        self,
+        name: str,
+        work: Work,
+        on_done: Callable[[object], None],
+        on_progress: Progress | None = None,
+        on_error: Callable[[str], None] | None = None,
+        on_cancelled: Callable[[], None] | None = None
+    ) -> CancelToken:
+        callbacks = _Callbacks(on_done, on_progress, on_error, on_cancelled)
+        token = CancelToken()
+        if name in self._running:
+            self._running[name][1].token.cancel()
+            previous = self._queued.get(name)
+            if previous and previous[1].on_cancelled:
+                previous[1].on_cancelled()
+            self._queued[name] = (work, callbacks, token)
+            return token
+        self._launch(name, work, callbacks, token)
+        return token
+
+    def cancel(self, name: str | None = None) -> None:
+        names = [name] if name else list(self._running)
+        for item in names:
+            queued = self._queued.pop(item, None)
+            if queued and queued[1].on_cancelled:
+                queued[1].on_cancelled()
+            if item in self._running:
+                self._running[item][1].token.cancel()
+
+    def is_running(self, name: str | None = None) -> bool:
+        return bool(self._running) if name is None else name in self._running
+
+    def wait(self, msecs: int = -1) -> bool:
+        # Blocks until the pool is idle; completion callbacks still need the event loop to run.
+        return self._pool.waitForDone(msecs)
+
+    def _launch(self, name: str, work: Work, callbacks: _Callbacks, token: CancelToken) -> None:
+        was_busy = bool(self._running)
+        task_id = next(self._ids)
+        task = _Task(self, task_id, work, token)
+        self._running[name] = (task_id, task, callbacks)
+        self._pool.start(task)
+        if not was_busy:
+            self.busy_changed.emit(True)
+
+    def _find(self, task_id: int) -> str:
+        for name, (running_id, _, _) in self._running.items():
+            if running_id == task_id:
+                return name
+        return ""
+
+    def _handle_progress(self, task_id: int, percent: int, message: str) -> None:
+        name = self._find(task_id)
+        callbacks = self._running[name][2] if name else None
+        if callbacks and callbacks.on_progress and not self._running[name][1].token.cancelled:
+            callbacks.on_progress(percent, message)
+
+    def _handle_completed(self, task_id: int, outcome: str, payload: object) -> None:
+        name = self._find(task_id)
+        if not name:
+            return
+        _, _, callbacks = self._running.pop(name)
+        if outcome == "done":
+            callbacks.on_done(payload)
+        elif outcome == "failed" and callbacks.on_error:
+            callbacks.on_error(str(payload))
+        elif outcome == "cancelled" and callbacks.on_cancelled:
+            callbacks.on_cancelled()
+        queued = self._queued.pop(name, None)
+        if queued:
+            self._launch(name, *queued)
+        elif not self._running:
+            self.busy_changed.emit(False)
@@ -1,38 +1,53 @@
 from __future__ import annotations
 
-import json
+from itertools import groupby
+from operator import attrgetter
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Callable, Dict, Iterable, List, Tuple
 
-from PySide6.QtWidgets import QMessageBox
-
-from core.models import PromptResult
+from core.models import PromptResult, bundle_text
+from utils.json_backend import dump, loads
 from utils.logger import error as log_error
 from utils.logger import info as log_info
 from utils.validators import validate_content_package
 
+ErrorHandler = Callable[[str, str], None]
+
 
 def ensure_dir(path: Path) -> None:
     path.mkdir(parents=True, exist_ok=True)
 
 
-def save_all_prompts(base_dir: str | Path, translation_key: str, prompts: List[PromptResult]) -> str:
+def save_all_prompts(
+    base_dir: str | Path,
+    translation_key: str,
+    prompts: Iterable[PromptResult],
+    on_error: ErrorHandler | None = None
+) -> str:
     base_path = Path(base_dir)
     ensure_dir(base_path)
     file_path = base_path / f"{translation_key}-distribution-prompts.txt"
-    content = "\n\n".join([item.prompt_text for item in prompts])
     try:
         with file_path.open("w", encoding="utf-8") as handle:
-            handle.write(content)
+            for index, item in enumerate(prompts):
+                if index:
+                    handle.write("\n\n")
+                handle.write(item.prompt_text)
         log_info(f"Saved prompts to {file_path}")
         return str(file_path)
     except Exception as exc:
         log_error(f"Failed to save prompts: {exc}")
-        QMessageBox.critical(None, "Save error", f"Failed to save prompts: {exc}")
+        if on_error:
+            on_error("Save error", f"Failed to save prompts: {exc}")
         return ""
 
 
-def save_per_channel(base_dir: str | Path, translation_key: str, bundle_by_channel: Dict[str, str]) -> List[str]:
+def save_per_channel(
+    base_dir: str | Path,
+    translation_key: str,
+    bundle_by_channel: Dict[str, str],
+    on_error: ErrorHandler | None = None
+) -> List[str]:
     channel_dir = Path(base_dir) / translation_key
     ensure_dir(channel_dir)
     paths: List[str] = []
@@ -44,11 +59,106 @@ def save_per_channel(base_dir: str | Path, translation_key: str, bundle_by_chann
             paths.append(str(file_path))
         except Exception as exc:
             log_error(f"Failed to save channel prompt {channel}: {exc}")
-            QMessageBox.critical(None, "Save error", f"Failed to save {channel}: {exc}")
+            if on_error:
+                on_error("Save error", f"Failed to save {channel}: {exc}")
     return paths
 
 
-def save_results_templates(base_dir: str | Path, translation_key: str, channels: List[str]) -> List[str]:
+def save_prompt_stream(
+    base_dir: str | Path,
+    translation_key: str,
+    prompts: Iterable[PromptResult],
+    separate: bool,
+    all_prompts: bool = True,
+    per_channel: bool = True,
+    articles: Dict[str, str] | None = None,
+    on_error: ErrorHandler | None = None
+) -> Tuple[List[str], int]:
+    # Single pass over a channel-ordered stream: only one channel's prompts are held at a time.
+    # Writes the same files as save_all_prompts (bundles in separate mode) and save_per_channel.
+    # articles may fill up while the stream is consumed (reference content mode); it is saved last.
+    base_path = Path(base_dir)
+    ensure_dir(base_path)
+    file_path = base_path / f"{translation_key}-distribution-prompts.txt"
+    channel_dir = base_path / translation_key
+    if per_channel:
+        ensure_dir(channel_dir)
+    paths: List[str] = []
+    count = 0
+    handle = None
+    try:
+        if all_prompts:
+            handle = file_path.open("w", encoding="utf-8")
+    except Exception as exc:
+        log_error(f"Failed to save prompts: {exc}")
+        if on_error:
+            on_error("Save error", f"Failed to save prompts: {exc}")
+    try:
+        for index, (channel, group) in enumerate(groupby(prompts, key=attrgetter("channel"))):
+            items = list(group)
+            count += len(items)
+            text = bundle_text(items, separate)
+            if handle:
+                if index:
+                    handle.write("\n\n")
+                handle.write(text)
+            if per_channel:
+                channel_path = channel_dir / f"{channel.lower().replace('.', '')}-bundle.txt"
+                try:
+                    with channel_path.open("w", encoding="utf-8") as channel_handle:
+                        channel_handle.write(text)
+                    paths.append(str(channel_path))
+                except Exception as exc:
+                    log_error(f"Failed to save channel prompt {channel}: {exc}")
+                    if on_error:
+                        on_error("Save error", f"Failed to save {channel}: {exc}")
+        if handle:
+            handle.close()
+            handle = None
+            paths.insert(0, str(file_path))
+            log_info(f"Saved prompts to {file_path}")
+    except Exception as exc:
+        log_error(f"Failed to save prompts: {exc}")
+        if on_error:
+            on_error("Save error", f"Failed to save prompts: {exc}")
+    finally:
+        if handle:
+            handle.close()
+    if articles:
+        path = save_articles(base_path, translation_key, articles, on_error=on_error)
+        if path:
+            paths.append(path)
+    return paths, count
+
+
+def save_articles(
+    base_dir: str | Path,
+    translation_key: str,
+    articles: Dict[str, str],
+    on_error: ErrorHandler | None = None
+) -> str:
+    # Article bodies that reference-mode prompts point to with [[article:<name>]].
+    base_path = Path(base_dir)
+    ensure_dir(base_path)
+    file_path = base_path / f"{translation_key}-articles.json"
+    try:
+        with file_path.open("wb") as handle:
+            dump(articles, handle)
+        log_info(f"Saved articles to {file_path}")
+        return str(file_path)
+    except Exception as exc:
+        log_error(f"Failed to save articles: {exc}")
+        if on_error:
+            on_error("Save error", f"Failed to save articles: {exc}")
+        return ""
+
+
+def save_results_templates(
+    base_dir: str | Path,
+    translation_key: str,
+    channels: List[str],
+    on_error: ErrorHandler | None = None
+) -> List[str]:
     results_dir = Path(base_dir) / translation_key
     ensure_dir(results_dir)
     paths: List[str] = []
@@ -60,22 +170,27 @@ def save_results_templates(base_dir: str | Path, translation_key: str, channels:
             paths.append(str(file_path))
         except Exception as exc:
             log_error(f"Failed to save results template {channel}: {exc}")
-            QMessageBox.critical(None, "Save error", f"Failed to save results template: {exc}")
+            if on_error:
+                on_error("Save error", f"Failed to save results template: {exc}")
     return paths
 
 
-def load_content_package(file_path: str | Path, schema_path: str | Path) -> Tuple[Dict[str, object], List[str]]:
+def load_content_package(
+    file_path: str | Path,
+    schema_path: str | Path,
+    on_error: ErrorHandler | None = None
+) -> Tuple[Dict[str, object], List[str]]:
     target = Path(file_path)
     try:
-        with target.open("r", encoding="utf-8") as handle:
-            data = handle.read()
+        data = target.read_bytes()
     except Exception as exc:
         log_error(f"Failed to read content package from {target}: {exc}")
-        QMessageBox.critical(None, "Read error", f"Failed to read content package: {exc}")
+        if on_error:
+            on_error("Read error", f"Failed to read content package: {exc}")
         return {}, ["Failed to read content package."]
 
     try:
-        payload = json.loads(data)
+        payload = loads(data)
     except Exception as exc:
         log_error(f"Invalid JSON: {exc}")
         return {}, ["Invalid JSON."]
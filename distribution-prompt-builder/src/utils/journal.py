@@ -0,0 +1,210 @@
+from __future__ import annotations
+
+import hashlib
+import os
+from pathlib import Path
+import threading
+from typing import Any, Callable, Dict, List, Tuple
+
+from utils.json_backend import dumps, loads
+from utils.logger import error as log_error
+from utils.logger import warn as log_warn
+from utils.save_service import atomic_write, json_bytes
+
+JOURNAL_VERSION = 1
+# Compact once the journal outgrows the base snapshot (but never below this many bytes).
+JOURNAL_MIN_COMPACT_BYTES = 64 * 1024
+
+ErrorHandler = Callable[[str, str], None]
+Op = Dict[str, Any]
+
+_MISSING = object()
+
+
+def journal_path(path: str | Path) -> Path:
+    target = Path(path)
+    return target.with_name(f"{target.name}.journal")
+
+
+def diff_ops(old: Any, new: Any, prefix: Tuple[str, ...] = ()) -> List[Op]:
+    # Objects are diffed key by key; lists and scalars are replaced whole.
+    if isinstance(old, dict) and isinstance(new, dict):
+        ops: List[Op] = []
+        for key, value in new.items():
+            previous = old.get(key, _MISSING)
+            if previous is _MISSING:
+                ops.append({"op": "set", "path": [*prefix, key], "value": value})
+            elif previous != value or type(previous) is not type(value):
+                ops.extend(diff_ops(previous, value, (*prefix, key)))
+        for key in old.keys() - new.keys():
+            ops.append({"op": "del", "path": [*prefix, key]})
+        return ops
+    if old == new and type(old) is type(new):
+        return []
+    return [{"op": "set", "path": list(prefix), "value": new}]
+
+
+def apply_ops(doc: Any, ops: List[Op]) -> Any:
+    for op in ops:
+        path = op["path"]
+        if not path:
+            doc = op.get("value") if op["op"] == "set" else {}
+            continue
+        node = doc
+        for key in path[:-1]:
+            child = node.get(key)
+            if not isinstance(child, dict):
+                child = {}
+                node[key] = child
+            node = child
+        if op["op"] == "set":
+            node[path[-1]] = op["value"]
+        else:
+            node.pop(path[-1], None)
+    return doc
+
+
+def _read_base(path: Path) -> Tuple[Dict[str, Any] | None, str]:
+    try:
+        data = path.read_bytes()
+    except FileNotFoundError:
+        return None, hashlib.sha1(b"").hexdigest()
+    return loads(data), hashlib.sha1(data).hexdigest()
+
+
+def _replay(path: Path, doc: Dict[str, Any], base_sha1: str) -> Tuple[Dict[str, Any], int]:
+    # Returns the document and the byte offset where the last valid record ends (0: no usable journal).
+    journal = journal_path(path)
+    try:
+        handle = journal.open("rb")
+    except FileNotFoundError:
+        return doc, 0
+    with handle:
+        header = handle.readline()
+        try:
+            meta = loads(header)
+        except ValueError:
+            log_warn(f"Ignoring journal with unreadable header: {journal}")
+            return doc, 0
+        if meta.get("base") != base_sha1:
+            # Left over from before the last compaction; the base already contains it.
+            return doc, 0
+        offset = len(header)
+        for line in handle:
+            if not line.endswith(b"\n"):
+                log_warn(f"Ignoring torn journal record in {journal}")
+                break
+            try:
+                ops = loads(line)["ops"]
+            except (ValueError, KeyError, TypeError):
+                log_warn(f"Stopping journal replay at a corrupt record in {journal}")
+                break
+            doc = apply_ops(doc, ops)
+            offset += len(line)
+    return doc, offset
+
+
+def read_journaled(path: str | Path) -> Dict[str, Any]:
+    # Base snapshot plus every complete journal record; raises like json.load would.
+    target = Path(path)
+    base, base_sha1 = _read_base(target)
+    if base is None and not journal_path(target).exists():
+        raise FileNotFoundError(f"No such file: '{target}'")
+    return _replay(target, base if base is not None else {}, base_sha1)[0]
+
+
+def load_journaled(path: str | Path, on_error: ErrorHandler | None = None) -> Dict[str, Any] | None:
+    target = Path(path)
+    try:
+        return read_journaled(target)
+    except Exception as exc:
+        log_error(f"Failed to load JSON from {target}: {exc}")
+        if on_error:
+            on_error("Load error", f"Failed to load JSON from {target}: {exc}")
+        return None
+
+
+class JournaledDocument:
+    def __init__(self, path: str | Path, min_compact_bytes: int = JOURNAL_MIN_COMPACT_BYTES) -> None:
+        self.path = Path(path)
+        self.journal = journal_path(self.path)
+        self.min_compact_bytes = min_compact_bytes
+        self._lock = threading.Lock()
+        self._state: Dict[str, Any] | None = None
+        self._base_size = 0
+        self._journal_size = 0
+
+    def save(self, doc: Dict[str, Any]) -> None:
+        # Appends the delta against the last saved state; the first save of a new file writes it whole.
+        with self._lock:
+            if self._state is None and not self._open():
+                self._compact(doc)
+                return
+            ops = diff_ops(self._state, doc)
+            if not ops:
+                return
+            record = dumps({"ops": ops}, compact=True) + b"\n"
+            with self.journal.open("ab") as handle:
+                handle.write(record)
+                handle.flush()
+                os.fsync(handle.fileno())
+            self._journal_size += len(record)
+            self._state = doc
+            if self._journal_size > max(self.min_compact_bytes, self._base_size):
+                self._compact(doc)
+
+    def compact(self) -> None:
+        with self._lock:
+            if self._state is not None:
+                self._compact(self._state)
+
+    def _open(self) -> bool:
+        # Adopt what is on disk as the baseline; False means there is nothing usable yet.
+        try:
+            base, base_sha1 = _read_base(self.path)
+        except (OSError, ValueError) as exc:
+            log_warn(f"Rewriting unreadable journaled file {self.path}: {exc}")
+            return False
+        if base is None:
+            return False
+        doc, valid_end = _replay(self.path, base, base_sha1)
+        self._state = doc
+        self._base_size = self.path.stat().st_size
+        if not valid_end:
+            self._write_header(base_sha1)
+            return True
+        if valid_end < self.journal.stat().st_size:
+            # Drop a torn tail so new records are not appended after it.
+            os.truncate(self.journal, valid_end)
+        self._journal_size = valid_end
+        return True
+
+    def _compact(self, doc: Dict[str, Any]) -> None:
+        data = json_bytes(doc)
+        atomic_write(self.path, data)
+        self._write_header(hashlib.sha1(data).hexdigest())
+        self._state = doc
+        self._base_size = len(data)
+
+    def _write_header(self, base_sha1: str) -> None:
+        header = dumps({"journal": JOURNAL_VERSION, "base": base_sha1}, compact=True) + b"\n"
+        atomic_write(self.journal, header)
+        self._journal_size = len(header)
+
+
+_DOCUMENTS: Dict[str, JournaledDocument] = {}
+_DOCUMENTS_LOCK = threading.Lock()
+
+
+def get_journaled_document(path: str | Path) -> JournaledDocument:
+    key = str(Path(path).resolve())
+    with _DOCUMENTS_LOCK:
+        document = _DOCUMENTS.get(key)
+        if document is None:
+            document = JournaledDocument(path)
+            _DOCUMENTS[key] = document
+        return document
+
+
+def save_journaled(path: str | Path, doc: Dict[str, Any]) -> None:
+    get_journaled_document(path).save(doc)
@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import io
+import json
+import os
+from typing import Any, BinaryIO, Callable, Dict, List, Tuple
+
+# Fastest installed backend wins; APP_JSON_BACKEND=orjson|msgspec|json pins one.
+BACKENDS = ["orjson", "msgspec", "json"]
+
+Dumps = Callable[[Any, bool], bytes]
+Loads = Callable[[Any], Any]
+
+# ensure_ascii=False matches the orjson/msgspec layout; float formatting can still differ (1e+20 vs 1e20).
+_JSON_OPTIONS: Dict[bool, Dict[str, Any]] = {
+    False: {"ensure_ascii": False, "indent": 2},
+    True: {"ensure_ascii": False, "separators": (",", ":")}
+}
+
+
+def _json_backend() -> Tuple[Dumps, Loads]:
+    def dumps(payload: Any, compact: bool) -> bytes:
+        return json.dumps(payload, **_JSON_OPTIONS[compact]).encode("utf-8")
+
+    return dumps, json.loads
+
+
+def _orjson_backend() -> Tuple[Dumps, Loads]:
+    import orjson
+
+    compact_options = orjson.OPT_NON_STR_KEYS
+    pretty_options = orjson.OPT_NON_STR_KEYS | orjson.OPT_INDENT_2
+
+    def dumps(payload: Any, compact: bool) -> bytes:
+        return orjson.dumps(payload, option=compact_options if compact else pretty_options)
+
+    return dumps, orjson.loads
+
+
+def _msgspec_backend() -> Tuple[Dumps, Loads]:
+    import msgspec
+
+    encoder = msgspec.json.Encoder()
+    decoder = msgspec.json.Decoder()
+
+    def dumps(payload: Any, compact: bool) -> bytes:
+        data = encoder.encode(payload)
+        return data if compact else msgspec.json.format(data, indent=2)
+
+    return dumps, decoder.decode
+
+
+_FACTORIES: Dict[str, Callable[[], Tuple[Dumps, Loads]]] = {
+    "orjson": _orjson_backend,
+    "msgspec": _msgspec_backend,
+    "json": _json_backend
+}
+
+_FALLBACK_DUMPS, _FALLBACK_LOADS = _json_backend()
+BACKEND = "json"
+_dumps: Dumps = _FALLBACK_DUMPS
+_loads: Loads = _FALLBACK_LOADS
+
+
+def available_backends() -> List[str]:
+    names: List[str] = []
+    for name in BACKENDS:
+        try:
+            _FACTORIES[name]()
+        except ImportError:
+            continue
+        names.append(name)
+    return names
+
+
+def use_backend(name: str | None = None) -> str:
+    global BACKEND, _dumps, _loads
+    candidates = [name] if name else BACKENDS
+    for candidate in candidates:
+        if candidate not in _FACTORIES:
+            raise ValueError(f"Unknown JSON backend: {candidate}")
+        try:
+            _dumps, _loads = _FACTORIES[candidate]()
+        except ImportError:
+            continue
+        BACKEND = candidate
+        return BACKEND
+    raise ImportError(f"JSON backend is not installed: {name}")
+
+
+def dumps(payload: Any, compact: bool = False) -> bytes:
+    # Pretty output matches json.dumps(indent=2) layout; compact drops all whitespace.
+    try:
+        return _dumps(payload, compact)
+    except Exception:
+        if BACKEND == "json":
+            raise
+        # Values the fast encoders reject (huge ints, lone surrogates, ...) still save as before.
+        return _FALLBACK_DUMPS(payload, compact)
+
+
+def dump(payload: Any, handle: BinaryIO, compact: bool = False) -> None:
+    if BACKEND != "json":
+        handle.write(dumps(payload, compact=compact))
+        return
+    # The stdlib encoder streams chunks to the file instead of building the whole document first.
+    text = io.TextIOWrapper(handle, encoding="utf-8")
+    try:
+        json.dump(payload, text, **_JSON_OPTIONS[compact])
+        text.flush()
+    finally:
+        text.detach()
+
+
+def loads(data: bytes | str) -> Any:
+    return _loads(data)
+
+
+try:
+    use_backend(os.environ.get("APP_JSON_BACKEND", "").strip().lower() or None)
+except (ImportError, ValueError):
+    use_backend()
@@ -1,17 +1,209 @@
 from __future__ import annotations
 
+import atexit
+import json
+import os
+from pathlib import Path
+import queue
+import sys
+import threading
 import time
+from typing import List, Tuple
 
 from utils.paths import get_logs_dir
 
 LOG_FILE = get_logs_dir() / "errors.log"
+LOG_MAX_BYTES = 1024 * 1024
+LOG_BACKUPS = 3
+LOG_FLUSH_INTERVAL = 0.5
+LOG_BATCH_SIZE = 256
+
+Record = Tuple[float, str, str]
+
+
+class BatchedLogWriter:
+    def __init__(
+        self,
+        path: Path,
+        max_bytes: int = LOG_MAX_BYTES,
+        backups: int = LOG_BACKUPS,
+        flush_interval: float = LOG_FLUSH_INTERVAL,
+        batch_size: int = LOG_BATCH_SIZE,
+        jsonl: bool = False
+    ) -> None:
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self.jsonl = jsonl
+        self._forked = False
+        self._reset()
+        if hasattr(os, "register_at_fork"):
+            os.register_at_fork(after_in_child=self._after_fork)
+
+    def _reset(self) -> None:
+        self._lock = threading.Lock()
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._thread: threading.Thread | None = None
+        self._handle = None
+        self._handle_path: Path | None = None
+
+    def _after_fork(self) -> None:
+        # The parent's writer thread does not exist in the child; start over with an empty queue.
+        self._reset()
+        self._forked = True
+
+    @property
+    def target(self) -> Path:
+        return self.path.with_suffix(".jsonl") if self.jsonl else self.path
+
+    def write(self, level: str, message: str) -> None:
+        if self._thread is None:
+            self._start()
+        self._queue.put((time.time(), level, message))
+
+    def flush(self, timeout: float = 2.0) -> None:
+        if self._thread is None:
+            return
+        done = threading.Event()
+        self._queue.put(done)
+        done.wait(timeout)
+
+    def close(self, timeout: float = 2.0) -> None:
+        thread = self._thread
+        if thread is None:
+            return
+        self._queue.put(None)
+        thread.join(timeout)
+        self._thread = None
+
+    def _start(self) -> None:
+        with self._lock:
+            if self._thread is not None:
+                return
+            if self._forked:
+                _register_child_flush(self)
+                self._forked = False
+            self._thread = threading.Thread(target=self._run, name="log-writer", daemon=True)
+            self._thread.start()
+
+    def _run(self) -> None:
+        pending: List[Record] = []
+        deadline = None
+        while True:
+            timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                item = False
+            if isinstance(item, tuple):
+                pending.append(item)
+                if deadline is None:
+                    deadline = time.monotonic() + self.flush_interval
+                if len(pending) < self.batch_size:
+                    continue
+            if pending:
+                self._write_batch(pending)
+                pending = []
+            deadline = None
+            if isinstance(item, threading.Event):
+                item.set()
+            elif item is None:
+                self._close_handle()
+                return
+
+    def _format(self, record: Record) -> str:
+        created, level, message = record
+        if self.jsonl:
+            return json.dumps({
+                "ts": time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(created)),
+                "level": level,
+                "message": message
+            }, ensure_ascii=False) + "\n"
+        timestamp = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(created))
+        return f"[{timestamp}] {level.upper()}: {message}\n"
+
+    def _write_batch(self, records: List[Record]) -> None:
+        data = "".join(self._format(record) for record in records).encode("utf-8")
+        target = self.target
+        try:
+            if self._handle is not None and self._handle_path != target:
+                self._close_handle()
+            if self._handle is None:
+                target.parent.mkdir(parents=True, exist_ok=True)
+                self._handle = target.open("ab")
+                self._handle_path = target
+            if self.max_bytes and self._handle.tell() and self._handle.tell() + len(data) > self.max_bytes:
+                self._rotate()
+            self._handle.write(data)
+            self._handle.flush()
+        except OSError as exc:
+            self._close_handle()
+            print(f"Failed to write log {target}: {exc}", file=sys.stderr)
+
+    def _rotate(self) -> None:
+        # errors.log -> errors.log.1 -> ... -> errors.log.<backups>; the oldest is overwritten.
+        target = self.target
+        self._close_handle()
+        for index in range(self.backups - 1, 0, -1):
+            source = target.with_name(f"{target.name}.{index}")
+            if source.exists():
+                os.replace(source, target.with_name(f"{target.name}.{index + 1}"))
+        if self.backups > 0:
+            os.replace(target, target.with_name(f"{target.name}.1"))
+        else:
+            target.unlink(missing_ok=True)
+        self._handle = target.open("ab")
+        self._handle_path = target
+
+    def _close_handle(self) -> None:
+        if self._handle is not None:
+            try:
+                self._handle.close()
+            except OSError:
+                pass
+            self._handle = None
+            self._handle_path = None
+
+
+def _register_child_flush(writer: BatchedLogWriter) -> None:
+    # Pool workers leave through os._exit, which skips atexit; multiprocessing finalizers still run.
+    from multiprocessing import util
+
+    util.Finalize(writer, writer.close, exitpriority=10)
+
+
+_WRITER = BatchedLogWriter(LOG_FILE, jsonl=os.environ.get("APP_LOG_FORMAT", "").lower() == "jsonl")
+atexit.register(_WRITER.close)
+
+
+def configure(
+    max_bytes: int | None = None,
+    backups: int | None = None,
+    flush_interval: float | None = None,
+    batch_size: int | None = None,
+    jsonl: bool | None = None
+) -> None:
+    _WRITER.flush()
+    if max_bytes is not None:
+        _WRITER.max_bytes = max_bytes
+    if backups is not None:
+        _WRITER.backups = backups
+    if flush_interval is not None:
+        _WRITER.flush_interval = flush_interval
+    if batch_size is not None:
+        _WRITER.batch_size = batch_size
+    if jsonl is not None:
+        _WRITER.jsonl = jsonl
+
+
+def flush() -> None:
+    _WRITER.flush()
 
 
 def _write(level: str, message: str) -> None:
-    timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
-    LOG_FILE.parent.mkdir(parents=True, exist_ok=True)
-    with LOG_FILE.open("a", encoding="utf-8") as handle:
-        handle.write(f"[{timestamp}] {level.upper()}: {message}\n")
+    _WRITER.write(level, message)
 
 
 def info(message: str) -> None:
@@ -61,6 +61,10 @@ def get_logs_dir() -> Path:
     return get_app_root() / "logs"
 
 
+def get_prompts_dir() -> Path:
+    return get_app_root() / "prompts"
+
+
 def ensure_app_dirs() -> None:
     for directory in [get_outputs_dir(), get_data_dir(), get_logs_dir()]:
         directory.mkdir(parents=True, exist_ok=True)
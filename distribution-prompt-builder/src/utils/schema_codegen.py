@@ -0,0 +1,296 @@
+from __future__ import annotations
+
+import re
+from typing import Any, Callable, Dict, List, Tuple
+
+# Draft 7 keywords the generator cannot express; schemas using them keep the plain
+# Draft7Validator path. Annotations (title, default, format, ...) are ignored like Draft 7 does.
+UNSUPPORTED_KEYWORDS = {"dependencies", "multipleOf"}
+
+_TYPE_CHECKS = {
+    "object": "isinstance({v}, dict)",
+    "array": "isinstance({v}, list)",
+    "string": "isinstance({v}, str)",
+    "boolean": "isinstance({v}, bool)",
+    "null": "{v} is None",
+    "number": "(isinstance({v}, (int, float)) and not isinstance({v}, bool))",
+    "integer": "_is_integer({v})"
+}
+
+
+class UnsupportedSchema(Exception):
+    pass
+
+
+def _is_integer(value: Any) -> bool:
+    if isinstance(value, bool):
+        return False
+    if isinstance(value, int):
+        return True
+    return isinstance(value, float) and value.is_integer()
+
+
+def _json_equal(left: Any, right: Any) -> bool:
+    # JSON equality: booleans never equal numbers, containers compare element-wise.
+    if isinstance(left, bool) or isinstance(right, bool):
+        return isinstance(left, bool) and isinstance(right, bool) and left == right
+    if isinstance(left, dict) and isinstance(right, dict):
+        return left.keys() == right.keys() and all(_json_equal(left[key], right[key]) for key in left)
+    if isinstance(left, list) and isinstance(right, list):
+        return len(left) == len(right) and all(_json_equal(a, b) for a, b in zip(left, right))
+    if isinstance(left, (int, float)) and isinstance(right, (int, float)):
+        return left == right
+    return type(left) is type(right) and not isinstance(left, (dict, list)) and left == right
+
+
+def _unique(items: List[Any]) -> bool:
+    for index, item in enumerate(items):
+        for other in items[index + 1:]:
+            if _json_equal(item, other):
+                return False
+    return True
+
+
+class _Generator:
+    def __init__(self, root: Any) -> None:
+        self.root = root
+        self.functions: List[str] = []
+        self.constants: List[str] = []
+        self.refs: Dict[str, str] = {}
+        self.counter = 0
+
+    def constant(self, value: Any) -> str:
+        name = f"_C{len(self.constants)}"
+        self.constants.append(f"{name} = {value!r}")
+        return name
+
+    def regex(self, pattern: str) -> str:
+        try:
+            re.compile(pattern)
+        except re.error as exc:
+            raise UnsupportedSchema(f"Invalid pattern {pattern!r}: {exc}") from exc
+        name = f"_R{len(self.constants)}"
+        self.constants.append(f"{name} = re.compile({pattern!r})")
+        return name
+
+    def resolve(self, ref: str) -> Any:
+        if not ref.startswith("#"):
+            raise UnsupportedSchema(f"Only local $ref is supported: {ref}")
+        node = self.root
+        for part in [item for item in ref[1:].split("/") if item]:
+            part = part.replace("~1", "/").replace("~0", "~")
+            if isinstance(node, list):
+                node = node[int(part)]
+            elif isinstance(node, dict) and part in node:
+                node = node[part]
+            else:
+                raise UnsupportedSchema(f"Unresolvable $ref: {ref}")
+        return node
+
+    def compile(self, schema: Any) -> str:
+        name = f"_v{self.counter}"
+        self.counter += 1
+        if schema is True or schema == {}:
+            self.functions.append(f"def {name}(data):\n    return True\n")
+            return name
+        if schema is False:
+            self.functions.append(f"def {name}(data):\n    return False\n")
+            return name
+        if not isinstance(schema, dict):
+            raise UnsupportedSchema(f"Schema must be an object or boolean, got {type(schema).__name__}")
+
+        if "$ref" in schema:
+            # Draft 7 ignores sibling keywords next to $ref.
+            ref = schema["$ref"]
+            if ref not in self.refs:
+                self.refs[ref] = name
+                target = self.compile(self.resolve(ref))
+                self.functions.append(f"def {name}(data):\n    return {target}(data)\n")
+            else:
+                self.functions.append(f"def {name}(data):\n    return {self.refs[ref]}(data)\n")
+            return name
+
+        unsupported = UNSUPPORTED_KEYWORDS & schema.keys()
+        if unsupported:
+            raise UnsupportedSchema(f"Unsupported keywords: {', '.join(sorted(unsupported))}")
+
+        lines: List[str] = []
+        self._type(schema, lines)
+        self._object(schema, lines)
+        self._array(schema, lines)
+        self._string(schema, lines)
+        self._number(schema, lines)
+        self._values(schema, lines)
+        self._combinators(schema, lines)
+        body = "\n".join(f"    {line}" for line in lines + ["return True"])
+        self.functions.append(f"def {name}(data):\n{body}\n")
+        return name
+
+    def _type(self, schema: Dict[str, Any], lines: List[str]) -> None:
+        if "type" not in schema:
+            return
+        types = schema["type"] if isinstance(schema["type"], list) else [schema["type"]]
+        checks = []
+        for item in types:
+            if item not in _TYPE_CHECKS:
+                raise UnsupportedSchema(f"Unknown type {item!r}")
+            checks.append(_TYPE_CHECKS[item].format(v="data"))
+        lines.append(f"if not ({' or '.join(checks) or 'False'}):")
+        lines.append("    return False")
+
+    def _object(self, schema: Dict[str, Any], lines: List[str]) -> None:
+        keys = {"required", "properties", "patternProperties", "additionalProperties",
+                "minProperties", "maxProperties", "propertyNames"}
+        if not keys & schema.keys():
+            return
+        block: List[str] = []
+        for key in schema.get("required", []):
+            block += [f"if {key!r} not in data:", "    return False"]
+        if "minProperties" in schema:
+            block += [f"if len(data) < {int(schema['minProperties'])}:", "    return False"]
+        if "maxProperties" in schema:
+            block += [f"if len(data) > {int(schema['maxProperties'])}:", "    return False"]
+        properties = schema.get("properties", {})
+        for key, subschema in properties.items():
+            func = self.compile(subschema)
+            block += [f"if {key!r} in data and not {func}(data[{key!r}]):", "    return False"]
+        patterns = [
+            (self.regex(pattern), self.compile(subschema))
+            for pattern, subschema in schema.get("patternProperties", {}).items()
+        ]
+        additional = schema.get("additionalProperties", True)
+        if patterns or additional is not True:
+            known = f"_C{len(self.constants)}"
+            self.constants.append(f"{known} = frozenset({sorted(properties)!r})")
+            block.append("for key, value in data.items():")
+            block.append("    matched = False")
+            for regex, func in patterns:
+                block += [
+                    f"    if {regex}.search(key):",
+                    "        matched = True",
+                    f"        if not {func}(value):",
+                    "            return False"
+                ]
+            if additional is not True:
+                func = self.compile(additional)
+                block += [f"    if not matched and key not in {known} and not {func}(value):", "        return False"]
+        if "propertyNames" in schema:
+            func = self.compile(schema["propertyNames"])
+            block += ["for key in data:", f"    if not {func}(key):", "        return False"]
+        lines.append("if isinstance(data, dict):")
+        lines.extend(f"    {line}" for line in block or ["pass"])
+
+    def _array(self, schema: Dict[str, Any], lines: List[str]) -> None:
+        keys = {"items", "additionalItems", "minItems", "maxItems", "uniqueItems", "contains"}
+        if not keys & schema.keys():
+            return
+        block: List[str] = []
+        if "minItems" in schema:
+            block += [f"if len(data) < {int(schema['minItems'])}:", "    return False"]
+        if "maxItems" in schema:
+            block += [f"if len(data) > {int(schema['maxItems'])}:", "    return False"]
+        items = schema.get("items", True)
+        if isinstance(items, list):
+            for index, subschema in enumerate(items):
+                func = self.compile(subschema)
+                block += [f"if len(data) > {index} and not {func}(data[{index}]):", "    return False"]
+            additional = schema.get("additionalItems", True)
+            if additional is not True:
+                func = self.compile(additional)
+                block += [f"for item in data[{len(items)}:]:", f"    if not {func}(item):", "        return False"]
+        elif items is not True and items != {}:
+            func = self.compile(items)
+            block += ["for item in data:", f"    if not {func}(item):", "        return False"]
+        if schema.get("uniqueItems") is True:
+            block += ["if not _unique(data):", "    return False"]
+        if "contains" in schema:
+            func = self.compile(schema["contains"])
+            block += [f"if not any({func}(item) for item in data):", "    return False"]
+        lines.append("if isinstance(data, list):")
+        lines.extend(f"    {line}" for line in block or ["pass"])
+
+    def _string(self, schema: Dict[str, Any], lines: List[str]) -> None:
+        block: List[str] = []
+        if "minLength" in schema:
+            block += [f"if len(data) < {int(schema['minLength'])}:", "    return False"]
+        if "maxLength" in schema:
+            block += [f"if len(data) > {int(schema['maxLength'])}:", "    return False"]
+        if "pattern" in schema:
+            regex = self.regex(schema["pattern"])
+            block += [f"if not {regex}.search(data):", "    return False"]
+        if block:
+            lines.append("if isinstance(data, str):")
+            lines.extend(f"    {line}" for line in block)
+
+    def _number(self, schema: Dict[str, Any], lines: List[str]) -> None:
+        block: List[str] = []
+        for keyword, operator in [
+            ("minimum", "<"), ("maximum", ">"), ("exclusiveMinimum", "<="), ("exclusiveMaximum", ">=")
+        ]:
+            if keyword in schema:
+                block += [f"if data {operator} {schema[keyword]!r}:", "    return False"]
+        if block:
+            lines.append("if isinstance(data, (int, float)) and not isinstance(data, bool):")
+            lines.extend(f"    {line}" for line in block)
+
+    def _values(self, schema: Dict[str, Any], lines: List[str]) -> None:
+        if "enum" in schema:
+            values = self.constant(list(schema["enum"]))
+            lines += [f"if not any(_json_equal(data, item) for item in {values}):", "    return False"]
+        if "const" in schema:
+            value = self.constant(schema["const"])
+            lines += [f"if not _json_equal(data, {value}):", "    return False"]
+
+    def _combinators(self, schema: Dict[str, Any], lines: List[str]) -> None:
+        for subschema in schema.get("allOf", []):
+            lines += [f"if not {self.compile(subschema)}(data):", "    return False"]
+        if "anyOf" in schema:
+            funcs = [self.compile(subschema) for subschema in schema["anyOf"]]
+            lines += [f"if not ({' or '.join(f'{func}(data)' for func in funcs) or 'False'}):", "    return False"]
+        if "oneOf" in schema:
+            funcs = [self.compile(subschema) for subschema in schema["oneOf"]]
+            lines += [f"if ({' + '.join(f'bool({func}(data))' for func in funcs) or '0'}) != 1:", "    return False"]
+        if "not" in schema:
+            lines += [f"if {self.compile(schema['not'])}(data):", "    return False"]
+        if "if" in schema:
+            condition = self.compile(schema["if"])
+            then_func = self.compile(schema.get("then", True))
+            else_func = self.compile(schema.get("else", True))
+            lines += [
+                f"if {condition}(data):",
+                f"    if not {then_func}(data):",
+                "        return False",
+                f"elif not {else_func}(data):",
+                "    return False"
+            ]
+
+
+def generate_validator_source(schema: Any) -> str:
+    generator = _Generator(schema)
+    entry = generator.compile(schema)
+    parts = [
+        "# Generated from content_package.schema.json by utils.schema_codegen. Do not edit.",
+        "import re",
+        "",
+        "from utils.schema_codegen import _is_integer, _json_equal, _unique",
+        "",
+        *generator.constants,
+        "",
+        *generator.functions,
+        f"validate = {entry}",
+        ""
+    ]
+    return "\n".join(parts)
+
+
+def compile_validator(schema: Any) -> Callable[[Any], bool]:
+    namespace: Dict[str, Any] = {}
+    exec(compile(generate_validator_source(schema), "<content_package_fastpath>", "exec"), namespace)
+    return namespace["validate"]
+
+
+def try_compile_validator(schema: Any) -> Tuple[Callable[[Any], bool] | None, str]:
+    try:
+        return compile_validator(schema), ""
+    except (UnsupportedSchema, RecursionError, SyntaxError, ValueError, TypeError) as exc:
+        return None, str(exc)
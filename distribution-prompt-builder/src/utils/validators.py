@@ -1,14 +1,24 @@
 from __future__ import annotations
 
-from typing import List, Dict
+from typing import TYPE_CHECKING, Any, Callable, List, Dict, Tuple
 import json
 from pathlib import Path
-from jsonschema import Draft7Validator
+import threading
 import re
 from urllib.parse import urlparse
 
 from core.models import GlobalInputs, LocaleContent
-from utils.logger import error as log_error
+from utils.logger import error as log_error, warn as log_warn
+from utils.schema_codegen import try_compile_validator
+
+if TYPE_CHECKING:
+    from jsonschema import Draft7Validator
+
+
+FastValidator = Callable[[Any], bool]
+
+_VALIDATOR_CACHE: Dict[str, Tuple[int, Draft7Validator, FastValidator | None]] = {}
+_VALIDATOR_LOCK = threading.Lock()
 
 
 def validate_inputs(global_inputs: GlobalInputs, locale_contents: List[LocaleContent], channels: List[str]) -> List[str]:
@@ -47,18 +57,67 @@ def validate_slug(value: str) -> bool:
     return re.match(r"^[a-z0-9]+(?:-[a-z0-9]+)*$", value) is not None
 
 
+def _load_validators(schema_path: str | Path) -> Tuple[Draft7Validator, FastValidator | None]:
+    # One compiled validator pair per schema file, rebuilt only when the file's mtime changes.
+    path = Path(schema_path)
+    mtime_ns = path.stat().st_mtime_ns
+    key = str(path.resolve())
+    with _VALIDATOR_LOCK:
+        cached = _VALIDATOR_CACHE.get(key)
+    if cached and cached[0] == mtime_ns:
+        return cached[1], cached[2]
+    # jsonschema is imported on first use so headless imports of this module stay cheap.
+    from jsonschema import Draft7Validator
+
+    schema = json.loads(path.read_text(encoding="utf-8"))
+    validator = Draft7Validator(schema)
+    fast, reason = try_compile_validator(schema)
+    if fast is None:
+        log_warn(f"Fast schema validator unavailable for {path}: {reason}")
+    with _VALIDATOR_LOCK:
+        _VALIDATOR_CACHE[key] = (mtime_ns, validator, fast)
+    return validator, fast
+
+
+def get_content_package_validator(schema_path: str | Path) -> Draft7Validator:
+    return _load_validators(schema_path)[0]
+
+
+def get_fast_validator(schema_path: str | Path) -> FastValidator | None:
+    return _load_validators(schema_path)[1]
+
+
+def warm_validator_cache(schema_path: str | Path) -> bool:
+    path = Path(schema_path)
+    if not path.exists():
+        return False
+    try:
+        _load_validators(path)
+        return True
+    except Exception as exc:
+        log_error(f"Failed to load schema at {path}: {exc}")
+        return False
+
+
 def validate_content_package(payload: Dict[str, object], schema_path: str | Path) -> List[str]:
     path = Path(schema_path)
     if not path.exists():
         log_error(f"Schema file not found at {path}")
         return ["Schema file not found."]
     try:
-        schema = json.loads(path.read_text(encoding="utf-8"))
+        validator, fast = _load_validators(path)
     except Exception as exc:
         log_error(f"Failed to read schema at {path}: {exc}")
         return [f"Failed to read schema: {exc}"]
 
-    validator = Draft7Validator(schema)
+    # The generated validator only answers valid/invalid; Draft 7 builds the error report.
+    if fast is not None:
+        try:
+            if fast(payload):
+                return []
+        except RecursionError:
+            pass
+
     errors = []
     for err in sorted(validator.iter_errors(payload), key=lambda e: e.path):
         path = ".".join([str(item) for item in err.path]) or "root"
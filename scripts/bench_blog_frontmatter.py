@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+
+BASE = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(BASE / "creator-app" / "src"))
+
+from utils.blog_index import _parse_frontmatter, read_frontmatter  # noqa: E402
+
+
+FRONTMATTER = """---
+title: "Synthetic post {index}"
+description: "Benchmark post used to measure frontmatter reads."
+date: 2025-{month:02d}-{day:02d}
+translationKey: synthetic-post-{index}
+category: Career
+tags:
+  - career
+  - benchmark
+---
+"""
+
+CODE_BLOCK = "```python\n" + "def handler(event):\n    return {'status': 'ok', 'event': event}\n" * 40 + "```\n\n"
+IMAGE_BLOCK = "![inline](data:image/png;base64," + "iVBORw0KGgoAAAANSUhEUgAA" * 400 + ")\n\n"
+PARAGRAPH = "Practical guidance paragraph for a long article body. " * 30 + "\n\n"
+
+
+def build_corpus(target: Path, posts: int, seed: int) -> None:
+    rng = random.Random(seed)
+    target.mkdir(parents=True, exist_ok=True)
+    for index in range(posts):
+        blocks = [rng.choice([CODE_BLOCK, IMAGE_BLOCK, PARAGRAPH]) for _ in range(rng.randint(5, 60))]
+        text = FRONTMATTER.format(index=index, month=rng.randint(1, 12), day=rng.randint(1, 28)) + "".join(blocks)
+        (target / f"post-{index:05d}.mdx").write_text(text, encoding="utf-8")
+
+
+def bench_full_read(files: list[Path]) -> tuple[int, float]:
+    total = 0
+    start = time.perf_counter()
+    for file_path in files:
+        text = file_path.read_text(encoding="utf-8")
+        total += len(text.encode("utf-8"))
+        _parse_frontmatter(text)
+    return total, time.perf_counter() - start
+
+
+def bench_header_read(files: list[Path]) -> tuple[int, float]:
+    total = 0
+    start = time.perf_counter()
+    for file_path in files:
+        header, bytes_read = read_frontmatter(file_path)
+        total += bytes_read
+        _parse_frontmatter(header)
+    return total, time.perf_counter() - start
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Compare bytes read per post: full read vs header-only scan.")
+    parser.add_argument("--posts", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        posts_dir = Path(tmp) / "content" / "posts" / "en"
+        build_corpus(posts_dir, args.posts, args.seed)
+        files = sorted(posts_dir.glob("*.mdx"))
+
+        for label, bench in [("full read_text", bench_full_read), ("header-only", bench_header_read)]:
+            total, elapsed = bench(files)
+            print(
+                f"{label:>15}: {total / len(files):>10.0f} bytes/post, "
+                f"{total / 1_048_576:>8.1f} MiB total, {elapsed * 1000:>8.1f} ms"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+
+BASE = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(BASE / "creator-app" / "src"))
+
+from utils import blog_index  # noqa: E402
+
+
+LOCALES = ["en", "pt", "es", "it"]
+CATEGORIES = ["Career", "AI", "Web", "Cloud", "Data"]
+TAGS = ["python", "career", "devops", "frontend", "backend", "ml", "interview", "salary"]
+
+
+def build_corpus(posts_root: Path, posts: int, seed: int) -> None:
+    rng = random.Random(seed)
+    body = "Synthetic article body paragraph. " * 200
+    for index in range(posts):
+        locale = LOCALES[index % len(LOCALES)]
+        target = posts_root / locale
+        target.mkdir(parents=True, exist_ok=True)
+        tags = ", ".join(rng.sample(TAGS, 3))
+        text = (
+            "---\n"
+            f"title: \"Synthetic post {index}\"\n"
+            f"date: 2025-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}\n"
+            f"translationKey: synthetic-{index // len(LOCALES)}\n"
+            f"category: {rng.choice(CATEGORIES)}\n"
+            f"tags: [{tags}]\n"
+            "---\n"
+            f"{body}\n"
+        )
+        (target / f"post-{index:05d}.mdx").write_text(text, encoding="utf-8")
+
+
+def simulate_latency(latency_ms: float) -> None:
+    if latency_ms <= 0:
+        return
+    read_frontmatter = blog_index.read_frontmatter
+
+    def slow_read(file_path: Path, *args, **kwargs):
+        time.sleep(latency_ms / 1000)
+        return read_frontmatter(file_path, *args, **kwargs)
+
+    blog_index.read_frontmatter = slow_read
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark cold and warm blog index scans per worker count.")
+    parser.add_argument("--posts", type=int, default=10_000)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 4, 16])
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Simulated per-read latency (slow disks).")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    simulate_latency(args.latency_ms)
+    with tempfile.TemporaryDirectory() as tmp:
+        posts_root = Path(tmp) / "content" / "posts"
+        build_corpus(posts_root, args.posts, args.seed)
+        index_path = Path(tmp) / "blog-index.json"
+        print(f"corpus: {args.posts} posts, simulated latency {args.latency_ms} ms/read")
+
+        baseline = None
+        for workers in args.workers:
+            index_path.unlink(missing_ok=True)
+            start = time.perf_counter()
+            themes = blog_index.refresh_blog_index(posts_root, index_path, workers=workers)
+            cold = time.perf_counter() - start
+
+            start = time.perf_counter()
+            blog_index.refresh_blog_index(posts_root, index_path, workers=workers)
+            warm = time.perf_counter() - start
+
+            if baseline is None:
+                baseline = themes
+            elif themes != baseline:
+                print(f"workers={workers}: results differ from workers={args.workers[0]}")
+                return 1
+            print(f"workers={workers:>3}: cold {cold * 1000:>9.1f} ms, warm {warm * 1000:>8.1f} ms, {len(themes)} posts")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable, Tuple
+
+
+BASE = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(BASE / "translator-app" / "src"))
+
+from utils import json_backend  # noqa: E402
+
+
+LOCALE_TEXT = {
+    "en": ("How to Start a Tech Career", "Career", "Build a portfolio before you apply. "),
+    "pt": ("Como iniciar uma carreira em tecnologia", "Carreira", "Monte um portfólio antes de se candidatar. "),
+    "es": ("Cómo empezar una carrera en tecnología", "Carrera", "Crea un portafolio antes de postularte. "),
+    "it": ("Come iniziare una carriera tech", "Carriera", "Costruisci un portfolio prima di candidarti. ")
+}
+
+
+def build_package(locale_kib: int) -> dict:
+    locales = {}
+    for locale, (title, category, sentence) in LOCALE_TEXT.items():
+        paragraph = sentence * 20
+        count = max(1, locale_kib * 1024 // (len(paragraph.encode("utf-8")) + 32))
+        body = "\n\n".join(f"## Section {index}\n\n{paragraph}" for index in range(count))
+        locales[locale] = {
+            "title": title,
+            "description": f"A practical guide: {title}.",
+            "slug": title.lower().replace(" ", "-"),
+            "content": f"# {title}\n\n{body}",
+            "tags": ["career", "tech"],
+            "keywords": ["tech career", "entry level"],
+            "category": category,
+            "affiliate": {"enabled": False, "url": "", "disclosure": ""}
+        }
+    return {
+        "meta": {
+            "translationKey": "bench-json-001",
+            "createdAt": "2025-01-01T00:00:00",
+            "updatedAt": "2025-01-02T00:00:00",
+            "source": "translator",
+            "publishAllLocales": True,
+            "localesIncluded": list(LOCALE_TEXT)
+        },
+        "global": {
+            "author": "Sample Author",
+            "blogUrl": "https://example.com",
+            "linkPolicy": "blog-only",
+            "defaultAffiliateDisclosure": False
+        },
+        "locales": locales
+    }
+
+
+def legacy_save(path: Path, payload: dict) -> None:
+    # The previous utils/io.py::save_json.
+    with path.open("w", encoding="utf-8") as handle:
+        json.dump(payload, handle, indent=2)
+
+
+def legacy_load(path: Path) -> dict:
+    with path.open("r", encoding="utf-8") as handle:
+        return json.load(handle)
+
+
+def save(path: Path, payload: dict, compact: bool) -> None:
+    # What utils/io.py::save_json does now.
+    with path.open("wb") as handle:
+        json_backend.dump(payload, handle, compact=compact)
+
+
+def measure(action: Callable[[], object], repeat: int) -> Tuple[float, float]:
+    # Best wall time of N runs, then peak traced allocation of one more run.
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        action()
+        best = min(best, time.perf_counter() - start)
+    tracemalloc.start()
+    action()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return best, peak
+
+
+def report(label: str, size: int, seconds: float, peak: int) -> None:
+    print(f"{label:>22}: {size / seconds / 1_048_576:>8.1f} MiB/s, peak {peak / 1_048_576:>7.1f} MiB")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Save/load throughput and peak memory per JSON backend.")
+    parser.add_argument("--locale-kib", type=int, default=1024, help="Article content per locale.")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    payload = build_package(args.locale_kib)
+    with tempfile.TemporaryDirectory() as tmp:
+        legacy_path = Path(tmp) / "legacy.json"
+        legacy_save(legacy_path, payload)
+        size = legacy_path.stat().st_size
+        print(f"package: {size / 1_048_576:.1f} MiB on disk (legacy format), backends: {json_backend.available_backends()}")
+
+        seconds, peak = measure(lambda: legacy_save(legacy_path, payload), args.repeat)
+        report("legacy json.dump save", size, seconds, peak)
+        seconds, peak = measure(lambda: legacy_load(legacy_path), args.repeat)
+        report("legacy json.load", size, seconds, peak)
+
+        for name in json_backend.available_backends():
+            json_backend.use_backend(name)
+            for compact in (False, True):
+                mode = "compact" if compact else "pretty"
+                path = Path(tmp) / f"{name}-{mode}.json"
+                seconds, peak = measure(lambda: save(path, payload, compact), args.repeat)
+                report(f"{name} {mode} save", size, seconds, peak)
+                seconds, peak = measure(lambda: json_backend.loads(path.read_bytes()), args.repeat)
+                report(f"{name} {mode} load", size, seconds, peak)
+                if json_backend.loads(path.read_bytes()) != payload:
+                    print(f"{name} {mode}: round trip mismatch")
+                    return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+
+BASE = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(BASE / "translator-app" / "src"))
+
+from utils.logger import BatchedLogWriter  # noqa: E402
+
+
+def legacy_write(log_file: Path, level: str, message: str) -> None:
+    # The previous utils/logger.py::_write: mkdir + open + append + close for every call.
+    timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
+    log_file.parent.mkdir(parents=True, exist_ok=True)
+    with log_file.open("a", encoding="utf-8") as handle:
+        handle.write(f"[{timestamp}] {level.upper()}: {message}\n")
+
+
+def report(label: str, calls: int, call_seconds: float, total_seconds: float) -> None:
+    print(
+        f"{label:>16}: {calls / call_seconds:>12.0f} calls/s on the caller, "
+        f"{calls / total_seconds:>10.0f} lines/s until on disk"
+    )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Log calls per second: per-call open vs batched background writer.")
+    parser.add_argument("--calls", type=int, default=100_000)
+    args = parser.parse_args()
+
+    message = "Saved JSON to /home/user/outputs/content-packages/how-to-start-a-tech-career.json"
+    with tempfile.TemporaryDirectory() as tmp:
+        legacy_file = Path(tmp) / "legacy" / "errors.log"
+        start = time.perf_counter()
+        for _ in range(args.calls):
+            legacy_write(legacy_file, "info", message)
+        elapsed = time.perf_counter() - start
+        report("per-call open", args.calls, elapsed, elapsed)
+
+        for label, jsonl in [("batched text", False), ("batched jsonl", True)]:
+            writer = BatchedLogWriter(Path(tmp) / label.replace(" ", "-") / "errors.log", max_bytes=0, jsonl=jsonl)
+            start = time.perf_counter()
+            for _ in range(args.calls):
+                writer.write("info", message)
+            call_seconds = time.perf_counter() - start
+            writer.close(timeout=60)
+            report(label, args.calls, call_seconds, time.perf_counter() - start)
+            lines = sum(1 for _ in writer.target.open("rb"))
+            if lines != args.calls:
+                print(f"{label}: expected {args.calls} lines, found {lines}")
+                return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
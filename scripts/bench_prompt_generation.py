@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import Callable
+
+
+BASE = Path(__file__).resolve().parents[1]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Distribution prompts per second: 6 channels x 4 locales x 2 variants.")
+    parser.add_argument("--iterations", type=int, default=2000)
+    parser.add_argument("--paragraphs", type=int, default=20, help="Article paragraphs per locale.")
+    parser.add_argument(
+        "--src",
+        default=str(BASE / "distribution-prompt-builder" / "src"),
+        help="Distributor src folder to benchmark (e.g. an older checkout, for before/after numbers)."
+    )
+    args = parser.parse_args()
+    sys.path.insert(0, args.src)
+
+    from core.channel_rules import CHANNEL_RULES
+    from core.package_inputs import package_to_inputs
+    from core.prompt_generator import generate_prompts
+    from profile_kit.bio_loader import default_bio_kit
+
+    try:
+        from core.prompt_templates import clear_template_cache
+    except ImportError:
+        clear_template_cache = None
+    try:
+        from core.prompt_cache import PromptCache
+    except ImportError:
+        PromptCache = None
+
+    locales = {}
+    for locale in ["en", "pt", "es", "it"]:
+        body = "\n\n".join(f"## Step {index}\n\n" + "Practical advice for a career switch. " * 12 for index in range(args.paragraphs))
+        locales[locale] = {
+            "title": f"How to start a tech career ({locale})",
+            "description": "A practical guide.",
+            "slug": f"start-tech-career-{locale}",
+            "content": body,
+            "tags": ["career", "tech"],
+            "keywords": ["tech career"],
+            "category": "Career"
+        }
+    payload = {
+        "meta": {"translationKey": "bench-prompts"},
+        "global": {"author": "Sample Author", "blogUrl": "https://example.com", "linkPolicy": "blog-and-affiliate"},
+        "locales": locales
+    }
+    channels = list(CHANNEL_RULES)
+    bio_kit = default_bio_kit()
+
+    def run(mode: str, cold: bool) -> Callable[[], int]:
+        global_inputs, locale_contents, affiliate_links = package_to_inputs(
+            payload, {"distribution_mode": mode, "generate_variants": True}
+        )
+
+        def generate() -> int:
+            if cold and clear_template_cache:
+                clear_template_cache()
+            return len(generate_prompts(global_inputs, locale_contents, affiliate_links, channels, bio_kit)[1])
+
+        return generate
+
+    def run_cached(mode: str) -> Callable[[], int]:
+        # Regenerate after editing one locale's description, with the prompt cache warm from earlier runs.
+        global_inputs, locale_contents, affiliate_links = package_to_inputs(
+            payload, {"distribution_mode": mode, "generate_variants": True}
+        )
+        cache = PromptCache()
+        state = {"edits": 0}
+
+        def generate() -> int:
+            state["edits"] += 1
+            locale_contents["es"].description = f"A practical guide (edit {state['edits']})."
+            return len(generate_prompts(global_inputs, locale_contents, affiliate_links, channels, bio_kit, cache)[1])
+
+        return generate
+
+    print(f"src: {args.src}")
+    for mode, label in [("single", "per-locale prompts"), ("separate", "channel bundles")]:
+        cases = [("", run(mode, False))]
+        if clear_template_cache:
+            cases = [(" (cold templates)", run(mode, True)), (" (warm templates)", run(mode, False))]
+        if PromptCache:
+            cases.append((" (cache, one locale edited)", run_cached(mode)))
+        for suffix, generate in cases:
+            prompts = generate()
+            start = time.perf_counter()
+            for _ in range(args.iterations):
+                generate()
+            elapsed = time.perf_counter() - start
+            print(
+                f"{label + suffix:>46}: {prompts} prompts/run, "
+                f"{prompts * args.iterations / elapsed:>10.0f} prompts/s, {elapsed / args.iterations * 1e6:>8.1f} us/run"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+
+BASE = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(BASE / "translator-app" / "src"))
+
+from jsonschema import Draft7Validator  # noqa: E402
+
+from utils.paths import get_repo_schema_path  # noqa: E402
+from utils.validators import get_content_package_validator, validate_content_package, warm_validator_cache  # noqa: E402
+
+
+LOCALE_TEXT = {
+    "en": ("How to Start a Tech Career", "how-to-start-a-tech-career", "Career"),
+    "pt": ("Como iniciar uma carreira em tecnologia", "como-iniciar-carreira-tecnologia", "Carreira"),
+    "es": ("Como empezar una carrera en tecnologia", "como-empezar-carrera-tecnologia", "Carrera"),
+    "it": ("Come iniziare una carriera tech", "come-iniziare-carriera-tech", "Carriera")
+}
+
+
+def build_package(paragraphs: int) -> dict:
+    locales = {}
+    for locale, (title, slug, category) in LOCALE_TEXT.items():
+        body = "\n\n".join(f"## Section {index}\n\n" + f"{title} paragraph text. " * 40 for index in range(paragraphs))
+        locales[locale] = {
+            "title": title,
+            "description": f"A practical guide: {title}.",
+            "slug": slug,
+            "content": f"# {title}\n\n{body}",
+            "tags": ["career", "tech"],
+            "keywords": ["tech career", "entry level"],
+            "category": category,
+            "affiliate": {"enabled": False, "url": "", "disclosure": ""}
+        }
+    return {
+        "meta": {
+            "translationKey": "bench-translator-001",
+            "createdAt": "2025-01-01T00:00:00",
+            "updatedAt": "2025-01-02T00:00:00",
+            "source": "translator",
+            "publishAllLocales": True,
+            "localesIncluded": ["en", "pt", "es", "it"]
+        },
+        "global": {
+            "author": "Sample Author",
+            "blogUrl": "https://example.com",
+            "linkPolicy": "blog-only",
+            "defaultAffiliateDisclosure": False
+        },
+        "locales": locales
+    }
+
+
+def validate_uncached(payload: dict, schema_path: Path) -> list[str]:
+    schema = json.loads(schema_path.read_text(encoding="utf-8"))
+    validator = Draft7Validator(schema)
+    return [
+        f"{'.'.join(str(item) for item in err.path) or 'root'}: {err.message}"
+        for err in sorted(validator.iter_errors(payload), key=lambda e: e.path)
+    ]
+
+
+def run(label: str, func, payload: dict, schema_path: Path, seconds: float) -> None:
+    count = 0
+    start = time.perf_counter()
+    deadline = start + seconds
+    while time.perf_counter() < deadline:
+        func(payload, schema_path)
+        count += 1
+    elapsed = time.perf_counter() - start
+    print(f"{label:>28}: {count / elapsed:>10.0f} validations/s")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Validations per second on a four-locale content package.")
+    parser.add_argument("--schema", type=Path, default=None)
+    parser.add_argument("--paragraphs", type=int, default=20)
+    parser.add_argument("--seconds", type=float, default=2.0)
+    args = parser.parse_args()
+
+    schema_path = args.schema or get_repo_schema_path()
+    if not schema_path.exists():
+        print(f"Schema not found at {schema_path}")
+        return 1
+    payload = build_package(args.paragraphs)
+    print(f"package: {len(json.dumps(payload)) / 1024:.0f} KiB, schema: {schema_path}")
+
+    errors = validate_content_package(payload, schema_path)
+    if errors:
+        print("Sample package is invalid for this schema:\n" + "\n".join(errors))
+        return 1
+
+    run("uncached (read+parse+build)", validate_uncached, payload, schema_path, args.seconds)
+    warm_validator_cache(schema_path)
+    run("cached + generated fast path", validate_content_package, payload, schema_path, args.seconds)
+    validator = get_content_package_validator(schema_path)
+    run("cached Draft7 only", lambda item, _: list(validator.iter_errors(item)), payload, schema_path, args.seconds)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import argparse
+import os
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+
+BASE = Path(__file__).resolve().parents[1]
+APPS = ["creator-app", "translator-app", "distribution-prompt-builder"]
+PACKAGES = ["core", "profile_kit", "utils"]
+
+# UI helpers that are allowed to import Qt; everything else must stay headless.
+QT_MODULES = {"utils.clipboard"}
+EXTRA_MODULES = {"distribution-prompt-builder": ["batch"]}
+
+
+def discover_modules(app: str) -> List[str]:
+    src = BASE / app / "src"
+    modules: List[str] = []
+    for package in PACKAGES:
+        for file_path in sorted((src / package).glob("*.py")):
+            name = f"{package}.{file_path.stem}"
+            if file_path.stem != "__init__" and name not in QT_MODULES:
+                modules.append(name)
+    return modules + EXTRA_MODULES.get(app, [])
+
+
+def measure(app: str, module: str) -> Tuple[float, List[str]]:
+    # Fresh interpreter per module so nothing is already cached in sys.modules.
+    src = BASE / app / "src"
+    env = {**os.environ, "PYTHONPATH": str(src)}
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=src,
+        env=env,
+        capture_output=True,
+        text=True
+    )
+    if completed.returncode != 0:
+        raise RuntimeError(completed.stderr.strip().splitlines()[-1] if completed.stderr.strip() else "import failed")
+    cumulative_us = 0
+    qt_imports: List[str] = []
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        fields = [item.strip() for item in line[len("import time:"):].split("|")]
+        if not fields[1].isdigit():
+            continue
+        name = fields[2]
+        if name == module:
+            cumulative_us = int(fields[1])
+        if name.split(".")[0] in ("PySide6", "shiboken6"):
+            qt_imports.append(name)
+    return cumulative_us / 1000, qt_imports
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Fail when a headless core module is slow to import or pulls in Qt.")
+    parser.add_argument("--budget-ms", type=float, default=100.0)
+    parser.add_argument("--runs", type=int, default=3, help="Best of N cold imports per module.")
+    parser.add_argument("--apps", nargs="+", default=APPS, choices=APPS)
+    args = parser.parse_args()
+
+    failures = 0
+    for app in args.apps:
+        for module in discover_modules(app):
+            try:
+                samples = [measure(app, module) for _ in range(max(1, args.runs))]
+            except RuntimeError as exc:
+                print(f"FAIL {app}:{module}: {exc}")
+                failures += 1
+                continue
+            elapsed = min(sample[0] for sample in samples)
+            qt_imports = samples[0][1]
+            problems: Dict[str, str] = {}
+            if elapsed > args.budget_ms:
+                problems["budget"] = f"{elapsed:.1f} ms > {args.budget_ms:.0f} ms"
+            if qt_imports:
+                problems["qt"] = "imports " + ", ".join(sorted(set(qt_imports))[:3])
+            status = "FAIL" if problems else "ok"
+            failures += bool(problems)
+            detail = "; ".join(problems.values())
+            print(f"{status:>4} {app + ':' + module:<56} {elapsed:>7.1f} ms {detail}".rstrip())
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
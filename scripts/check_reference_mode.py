@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+
+BASE = Path(__file__).resolve().parents[1]
+SRC = BASE / "distribution-prompt-builder" / "src"
+
+# Marker-like text in the article body and in user fields; neither may change what inline mode would send.
+LITERAL_MARKERS = "Literal markers: [[article:en]], [[article:pt-12]] and a dangling [[article:"
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Check that reference content mode expands to exactly the inline prompts."
+    )
+    parser.add_argument("package", nargs="?", type=Path, help="Content package JSON (default: a sample article).")
+    args = parser.parse_args()
+    sys.path.insert(0, str(SRC))
+
+    from core.channel_rules import CHANNEL_RULES
+    from core.package_inputs import package_to_inputs
+    from core.prompt_generator import collect_prompts
+    from profile_kit.bio_loader import default_bio_kit
+    from utils.json_backend import loads
+
+    if args.package:
+        payload = loads(args.package.read_bytes())
+    else:
+        locales = {}
+        for locale in ["en", "pt", "es", "it"]:
+            body = "\n\n".join(f"## Step {index}\n\n" + "Practical advice for a career switch. " * 12 for index in range(8))
+            locales[locale] = {
+                "title": f"How to start a tech career ({locale})",
+                "description": "A practical guide.",
+                "slug": f"start-tech-career-{locale}",
+                "content": body,
+                "tags": ["career", "tech"],
+                "keywords": ["tech career"],
+                "category": "Career"
+            }
+        payload = {
+            "meta": {"translationKey": "reference-check"},
+            "global": {"author": "Sample Author", "blogUrl": "https://example.com", "linkPolicy": "blog-and-affiliate"},
+            "locales": locales
+        }
+    for values in payload.get("locales", {}).values():
+        values["content"] = f"{values.get('content', '')}\n\n{LITERAL_MARKERS}"
+
+    channels = list(CHANNEL_RULES)
+    bio_kit = default_bio_kit()
+    failures = 0
+    for mode in ["single", "separate"]:
+        for budget in [0, 900]:
+            options = {"distribution_mode": mode, "token_budget": budget}
+            inline = collect_prompts(*package_to_inputs(payload, options), channels, bio_kit)
+            reference = collect_prompts(
+                *package_to_inputs(payload, {**options, "content_mode": "reference"}), channels, bio_kit
+            )
+            expanded = [reference.expand(result.prompt_text) for result in reference]
+            mismatches = sum(
+                1 for text, result in zip(expanded, inline) if text != result.prompt_text
+            ) + abs(len(expanded) - len(inline))
+            failures += mismatches
+            print(f"{mode} / budget {budget or 'off'}: {len(inline)} prompts, {mismatches} mismatches")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
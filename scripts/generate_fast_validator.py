@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+
+BASE = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(BASE / "translator-app" / "src"))
+
+from utils.paths import get_repo_schema_path  # noqa: E402
+from utils.schema_codegen import UnsupportedSchema, generate_validator_source  # noqa: E402
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Print or write the fast-path validator generated from the schema.")
+    parser.add_argument("--schema", type=Path, default=None)
+    parser.add_argument("--output", type=Path, default=None)
+    args = parser.parse_args()
+
+    schema_path = args.schema or get_repo_schema_path()
+    if not schema_path.exists():
+        print(f"Schema not found at {schema_path}")
+        return 1
+    try:
+        source = generate_validator_source(json.loads(schema_path.read_text(encoding="utf-8")))
+    except UnsupportedSchema as exc:
+        print(f"Schema is not supported by the generator: {exc}")
+        return 1
+    if args.output is None:
+        print(source)
+    else:
+        args.output.write_text(source, encoding="utf-8")
+        print(f"Wrote {args.output} ({len(source.splitlines())} lines)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+
+BASE = Path(__file__).resolve().parents[1]
+SRC = BASE / "distribution-prompt-builder" / "src"
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Shared-prefix length between consecutive distribution prompts, per prompt layout."
+    )
+    parser.add_argument("package", nargs="?", type=Path, help="Content package JSON (default: a sample article).")
+    parser.add_argument("--mode", choices=["separate", "single"], default=None, help="Default: both.")
+    parser.add_argument("--paragraphs", type=int, default=20, help="Sample article paragraphs per locale.")
+    parser.add_argument("--verbose", action="store_true", help="One line per prompt, in send order.")
+    args = parser.parse_args()
+    sys.path.insert(0, str(SRC))
+
+    from core.channel_rules import CHANNEL_RULES
+    from core.package_inputs import package_to_inputs
+    from core.prefix_report import format_prefix_report, prefix_report, send_order
+    from core.prompt_generator import PROMPT_LAYOUTS, collect_prompts
+    from profile_kit.bio_loader import default_bio_kit
+    from utils.json_backend import loads
+
+    if args.package:
+        payload = loads(args.package.read_bytes())
+    else:
+        locales = {}
+        for locale in ["en", "pt", "es", "it"]:
+            body = "\n\n".join(
+                f"## Step {index}\n\n" + "Practical advice for a career switch. " * 12 for index in range(args.paragraphs)
+            )
+            locales[locale] = {
+                "title": f"How to start a tech career ({locale})",
+                "description": "A practical guide.",
+                "slug": f"start-tech-career-{locale}",
+                "content": body,
+                "tags": ["career", "tech"],
+                "keywords": ["tech career"],
+                "category": "Career"
+            }
+        payload = {
+            "meta": {"translationKey": "prefix-report"},
+            "global": {"author": "Sample Author", "blogUrl": "https://example.com", "linkPolicy": "blog-and-affiliate"},
+            "locales": locales
+        }
+
+    channels = list(CHANNEL_RULES)
+    bio_kit = default_bio_kit()
+    modes = [args.mode] if args.mode else ["single", "separate"]
+    for mode in modes:
+        for layout in PROMPT_LAYOUTS:
+            global_inputs, locale_contents, affiliate_links = package_to_inputs(
+                payload, {"distribution_mode": mode, "prompt_layout": layout}
+            )
+            prompt_set = collect_prompts(global_inputs, locale_contents, affiliate_links, channels, bio_kit)
+            report = prefix_report(send_order(prompt_set))
+            print(f"== {mode} / {layout}: {len(report.steps)} prompts sent")
+            text = format_prefix_report(report)
+            print(text if args.verbose else text.splitlines()[-1])
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -56,6 +56,20 @@ def validate_schema(schema_path: Path) -> None:
     print(f"Schema OK: {schema_path}")
 
 
+def check_validator_parity() -> int:
+    # The fast-path validator is generated from the schema at runtime; keep it in step with Draft7Validator.
+    if importlib.util.find_spec("jsonschema") is None:
+        print("jsonschema not installed; skipping validator parity check.")
+        return 0
+
+    from validator_parity import FIXTURE_SCHEMA, run_parity
+
+    failures = run_parity(FIXTURE_SCHEMA, mutations=300, seed=7)
+    if failures:
+        print(f"Validator parity FAILED: {failures} mismatches")
+    return failures
+
+
 def main() -> int:
     base = Path(__file__).resolve().parents[1]
     schema_paths = []
@@ -65,7 +79,7 @@ def main() -> int:
 
     if schema_paths:
         validate_schema(schema_paths[0])
-    return 0
+    return 1 if check_validator_parity() else 0
 
 
 if __name__ == "__main__":
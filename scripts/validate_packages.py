@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List
+
+
+BASE = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(BASE / "translator-app" / "src"))
+
+from utils.json_backend import dumps, loads  # noqa: E402
+from utils.paths import get_repo_schema_path  # noqa: E402
+from utils.validators import validate_content_package, warm_validator_cache  # noqa: E402
+
+
+DEFAULT_DIRS = [
+    BASE / "creator-app" / "outputs" / "content-packages",
+    BASE / "translator-app" / "outputs" / "content-packages"
+]
+
+_SCHEMA_PATH: Path | None = None
+
+
+def _init_worker(schema_path: str) -> None:
+    # Each worker process compiles the schema once, before it sees its first file.
+    global _SCHEMA_PATH
+    _SCHEMA_PATH = Path(schema_path)
+    warm_validator_cache(_SCHEMA_PATH)
+
+
+def validate_file(file_path: str) -> Dict[str, object]:
+    start = time.perf_counter()
+    try:
+        payload = loads(Path(file_path).read_bytes())
+        errors = validate_content_package(payload, _SCHEMA_PATH)
+    except (OSError, UnicodeDecodeError) as exc:
+        errors = [f"Failed to read file: {exc}"]
+    except ValueError as exc:
+        errors = [f"Invalid JSON: {exc}"]
+    except Exception as exc:
+        # Anything else (RecursionError on deep nesting, a fast-path TypeError) fails this file, not the whole run.
+        errors = [f"Validation crashed: {exc}"]
+    return {
+        "file": file_path,
+        "ok": not errors,
+        "errors": errors,
+        "ms": round((time.perf_counter() - start) * 1000, 3)
+    }
+
+
+def collect_files(targets: Iterable[Path]) -> List[str]:
+    files: List[str] = []
+    for target in targets:
+        if target.is_dir():
+            files.extend(str(item) for item in sorted(target.rglob("*.json")) if item.is_file())
+        elif target.is_file():
+            files.append(str(target))
+        else:
+            print(f"Skipping missing path: {target}", file=sys.stderr)
+    return files
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Validate content package files; prints one JSON line per file.")
+    parser.add_argument("paths", nargs="*", type=Path, help="Files or directories (default: apps' outputs/content-packages).")
+    parser.add_argument("--schema", type=Path, default=None)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--chunksize", type=int, default=8)
+    args = parser.parse_args()
+
+    schema_path = args.schema or get_repo_schema_path()
+    if not schema_path.exists():
+        print(f"Schema not found at {schema_path}", file=sys.stderr)
+        return 1
+    files = collect_files(args.paths or DEFAULT_DIRS)
+    if not files:
+        print("No content package files found.", file=sys.stderr)
+        return 0
+
+    start = time.perf_counter()
+    failures = 0
+    workers = max(1, min(args.workers, len(files)))
+    if workers == 1:
+        _init_worker(str(schema_path))
+        results = map(validate_file, files)
+        pool = None
+    else:
+        pool = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(str(schema_path),))
+        results = pool.map(validate_file, files, chunksize=max(1, args.chunksize))
+    try:
+        for result in results:
+            failures += not result["ok"]
+            print(dumps(result, compact=True).decode("utf-8"), flush=True)
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+    elapsed = time.perf_counter() - start
+    print(
+        f"{len(files)} files, {failures} invalid, {workers} workers, {elapsed:.2f}s",
+        file=sys.stderr
+    )
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+import argparse
+import copy
+import json
+import random
+import sys
+from pathlib import Path
+
+
+BASE = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(BASE / "translator-app" / "src"))
+
+from jsonschema import Draft7Validator  # noqa: E402
+
+from bench_validation import build_package  # noqa: E402
+from utils.paths import get_repo_schema_path  # noqa: E402
+from utils.schema_codegen import UnsupportedSchema, compile_validator  # noqa: E402
+
+
+# Committed with the repo, so the parity check also runs where the real schema is not checked out.
+FIXTURE_SCHEMA = BASE / "scripts" / "fixtures" / "content_package.schema.json"
+
+SAMPLE_VALUES = [
+    None, True, False, 0, 1, -1, 1.5, 2.0, "", "x", "en", "creator", "blog-only", "Not A Slug",
+    "valid-slug", "https://example.com", [], ["en"], ["en", "en"], ["a", 1], {}, {"enabled": True},
+    {"enabled": "yes"}, {"unexpected": 1}
+]
+
+# Exercises every keyword the generator supports, independent of the repo schema.
+COVERAGE_SCHEMA = {
+    "definitions": {
+        "node": {
+            "type": "object",
+            "properties": {"value": {"type": "integer"}, "children": {"type": "array", "items": {"$ref": "#/definitions/node"}}},
+            "required": ["value"]
+        }
+    },
+    "type": "object",
+    "properties": {
+        "tree": {"$ref": "#/definitions/node"},
+        "count": {"type": "number", "minimum": 0, "exclusiveMaximum": 10},
+        "ratio": {"type": ["number", "null"], "exclusiveMinimum": 0, "maximum": 1},
+        "name": {"type": "string", "minLength": 2, "maxLength": 8, "pattern": "^[a-z]"},
+        "mode": {"enum": ["a", 1, None, [1, 2], {"k": True}]},
+        "flag": {"const": False},
+        "pair": {"type": "array", "items": [{"type": "string"}, {"type": "integer"}], "additionalItems": False},
+        "tags": {"type": "array", "items": {"type": "string"}, "minItems": 1, "maxItems": 3, "uniqueItems": True},
+        "mixed": {"type": "array", "uniqueItems": True, "contains": {"type": "integer"}},
+        "choice": {"oneOf": [{"type": "string"}, {"type": "integer"}, {"type": "number", "minimum": 5}]},
+        "either": {"anyOf": [{"type": "string", "maxLength": 1}, {"type": "boolean"}]},
+        "both": {"allOf": [{"type": "integer"}, {"minimum": 2}], "not": {"const": 3}},
+        "cond": {"if": {"type": "string"}, "then": {"minLength": 3}, "else": {"type": "integer"}},
+        "extras": {
+            "type": "object",
+            "patternProperties": {"^x-": {"type": "string"}},
+            "additionalProperties": {"type": "integer"},
+            "propertyNames": {"maxLength": 5},
+            "minProperties": 1,
+            "maxProperties": 3
+        },
+        "anything": True,
+        "nothing": False
+    },
+    "additionalProperties": False
+}
+
+COVERAGE_VALUES = SAMPLE_VALUES + [
+    {"value": 1, "children": [{"value": 2}, {"value": "3"}]}, {"value": 1, "children": [{"value": 2, "children": []}]},
+    5, 9.99, 10, 0.5, "ab", "abcdefghi", "Ab", ["s", 1], ["s", 1, 2], [1, "s"], ["a", "b", "a"], [1, True],
+    [1.0, 1], [[1, 2], [1, 2]], [{"k": True}, {"k": 1}], [1, 2], {"k": True}, {"k": 1}, 4, 3, 2, 6.5, "abc",
+    {"x-a": "s", "b": 2}, {"x-a": 1}, {"toolong": 1}, {"a": 1, "b": 2, "c": 3, "d": 4}, {"b": "s"}
+]
+
+
+def mutate(payload: object, rng: random.Random) -> object:
+    mutated = copy.deepcopy(payload)
+    node = mutated
+    path = []
+    while isinstance(node, (dict, list)) and node and rng.random() < 0.8:
+        key = rng.choice(list(node.keys())) if isinstance(node, dict) else rng.randrange(len(node))
+        path.append((node, key))
+        node = node[key]
+    if not path:
+        return rng.choice(SAMPLE_VALUES)
+    parent, key = path[-1]
+    action = rng.random()
+    if action < 0.6:
+        parent[key] = copy.deepcopy(rng.choice(SAMPLE_VALUES))
+    elif action < 0.8:
+        del parent[key]
+    elif isinstance(parent, dict):
+        parent[rng.choice(["extra", "en", "enabled", "title", key])] = copy.deepcopy(rng.choice(SAMPLE_VALUES))
+    else:
+        parent.append(copy.deepcopy(rng.choice(SAMPLE_VALUES)))
+    return mutated
+
+
+def check(label: str, schema: dict, payloads: list[object]) -> int:
+    try:
+        fast = compile_validator(schema)
+    except UnsupportedSchema as exc:
+        print(f"{label}: schema not supported by the generator ({exc})")
+        return 1
+    reference = Draft7Validator(schema)
+    mismatches = 0
+    accepted = 0
+    for payload in payloads:
+        expected = reference.is_valid(payload)
+        accepted += expected
+        if fast(payload) != expected:
+            mismatches += 1
+            if mismatches <= 5:
+                print(f"{label}: mismatch (draft7 valid={expected}) for {json.dumps(payload)[:200]}")
+    print(f"{label}: {len(payloads)} payloads, {accepted} valid, {len(payloads) - accepted} invalid, {mismatches} mismatches")
+    return mismatches
+
+
+def run_parity(schema_path: Path, mutations: int, seed: int) -> int:
+    # Mismatches between the generated validator and Draft7Validator, over the schema and the keyword coverage schema.
+    rng = random.Random(seed)
+    schema = json.loads(schema_path.read_text(encoding="utf-8"))
+    base = build_package(1)
+    payloads = [base] + [mutate(base, rng) for _ in range(mutations)]
+    mutated_values = [mutate({"tree": {"value": 1}, "tags": ["a"], "extras": {"x-a": "s"}}, rng) for _ in range(mutations)]
+    coverage = [{"tree": {"value": 1}}] + [{key: value} for key in COVERAGE_SCHEMA["properties"] for value in COVERAGE_VALUES]
+
+    failures = check("content package", schema, payloads)
+    failures += check("keyword coverage", COVERAGE_SCHEMA, coverage + mutated_values)
+    return failures
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Check the generated validator against Draft7Validator.")
+    parser.add_argument("--schema", type=Path, default=None, help="Default: the repo schema, else the committed fixture.")
+    parser.add_argument("--mutations", type=int, default=5000)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    schema_path = args.schema or get_repo_schema_path()
+    if not args.schema and not schema_path.exists():
+        schema_path = FIXTURE_SCHEMA
+    if not schema_path.exists():
+        print(f"Schema not found at {schema_path}")
+        return 1
+    return 1 if run_parity(schema_path, args.mutations, args.seed) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
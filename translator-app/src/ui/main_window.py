@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from pathlib import Path
 from datetime import datetime
+from typing import List, Tuple
 
 from PySide6.QtWidgets import (
     QCheckBox,
@@ -11,6 +12,7 @@ from PySide6.QtWidgets import (
     QGridLayout,
     QGroupBox,
     QHBoxLayout,
+    QLabel,
     QLineEdit,
     QMessageBox,
     QPushButton,
@@ -20,6 +22,8 @@ from PySide6.QtWidgets import (
 )
 
 from core.package_builder import build_blog_admin_package, build_translator_package
+from ui.tasks import CancelToken, Progress, TaskRunner
+from utils.blog_index import BlogCorpusIndex, load_blog_corpus_index
 from utils.io import load_json, save_json
 from utils.logger import info, warn
 from utils.paths import (
@@ -28,7 +32,13 @@ from utils.paths import (
     get_outputs_dir,
     get_repo_schema_path
 )
-from utils.validators import detect_accent_warning, validate_blog_url, validate_content_package, validate_slug
+from utils.validators import (
+    detect_accent_warning,
+    validate_blog_url,
+    validate_content_package,
+    validate_slug,
+    warm_validator_cache
+)
 
 
 class MainWindow(QWidget):
@@ -38,12 +48,17 @@ class MainWindow(QWidget):
         self.resize(1200, 860)
 
         self.schema_path = get_repo_schema_path()
+        warm_validator_cache(self.schema_path)
         ensure_app_dirs()
+        self._tasks = TaskRunner(self)
 
         self.import_button = QPushButton("Import Creator JSON")
         self.import_button.clicked.connect(self.handle_import)
 
         self.translation_key = QLineEdit()
+        self.translation_key.editingFinished.connect(self._refresh_blog_locales)
+        self.blog_locales = QLabel("")
+        self._blog_index: BlogCorpusIndex | None = None
         self.author = QLineEdit()
         self.blog_url = QLineEdit()
         self.link_policy = QComboBox()
@@ -75,6 +90,7 @@ class MainWindow(QWidget):
         form = QFormLayout()
         form.addRow("", self.import_button)
         form.addRow("translationKey", self.translation_key)
+        form.addRow("Published on blog", self.blog_locales)
         form.addRow("author", self.author)
         form.addRow("blogUrl", self.blog_url)
         form.addRow("linkPolicy", self.link_policy)
@@ -91,6 +107,14 @@ class MainWindow(QWidget):
         group.setLayout(form)
         return group
 
+    def _show_error(self, title: str, message: str) -> None:
+        QMessageBox.critical(self, title, message)
+
+    def closeEvent(self, event) -> None:
+        self._tasks.cancel()
+        self._tasks.wait()
+        super().closeEvent(event)
+
     def _setup_locale_fields(self) -> None:
         for locale in ["en", "pt", "es", "it"]:
             self.locale_fields[locale] = {
@@ -154,7 +178,7 @@ class MainWindow(QWidget):
         file_name, _ = QFileDialog.getOpenFileName(self, "Import Creator JSON", "", "JSON Files (*.json)")
         if not file_name:
             return
-        data = load_json(file_name)
+        data = load_json(file_name, on_error=self._show_error)
         if not data:
             return
         errors = validate_content_package(data, self.schema_path)
@@ -186,8 +210,37 @@ class MainWindow(QWidget):
             self.locale_fields[locale]["affiliate_disclosure"].setText(affiliate.get("disclosure", ""))
 
         self._apply_read_only_en()
+        self._refresh_blog_locales(reload=True)
         info("Creator JSON imported")
 
+    def _refresh_blog_locales(self, reload: bool = False) -> None:
+        if self._blog_index is not None and not reload:
+            self._show_blog_locales()
+            return
+
+        def work(token: CancelToken, report: Progress) -> BlogCorpusIndex:
+            return load_blog_corpus_index()
+
+        def done(blog_index: BlogCorpusIndex) -> None:
+            if reload or self._blog_index is None:
+                self._blog_index = blog_index
+            self._show_blog_locales()
+
+        # Restarting "blog-index" cancels a load that is still running.
+        self._tasks.start(
+            "blog-index",
+            work,
+            done,
+            on_error=lambda message: warn(f"Blog index not loaded: {message}")
+        )
+
+    def _show_blog_locales(self) -> None:
+        if self._blog_index is None:
+            return
+        translation_key = self.translation_key.text().strip()
+        locales = self._blog_index.locales_for_key(translation_key) if translation_key else []
+        self.blog_locales.setText(", ".join(locale.upper() for locale in locales) or "None")
+
     def _apply_read_only_en(self) -> None:
         for key, field in self.locale_fields["en"].items():
             if hasattr(field, "setReadOnly"):
@@ -246,28 +299,63 @@ class MainWindow(QWidget):
         }
 
         locales_included = [locale for locale in ["en", "pt", "es", "it"] if locales[locale]["content"]]
-        payload = build_translator_package(
-            base,
-            locales,
-            self.publish_all.isChecked(),
-            locales_included
-        )
-        errors = validate_content_package(payload, self.schema_path)
-        if errors:
-            QMessageBox.critical(self, "Schema error", "\n".join(errors))
-            return
+        publish_all = self.publish_all.isChecked()
+        schema_path = self.schema_path
+        path = get_outputs_dir() / "content-packages" / f"{self.translation_key.text().strip()}-translator.json"
 
-        export_dir = get_outputs_dir() / "content-packages"
-        path = export_dir / f"{self.translation_key.text().strip()}-translator.json"
-        if save_json(path, payload):
-            QMessageBox.information(self, "Exported", f"Saved to {path}")
+        def work(token: CancelToken, report: Progress) -> Tuple[bool, List[str], List[Tuple[str, str]]]:
+            save_errors: List[Tuple[str, str]] = []
+            report(0, "Building")
+            payload = build_translator_package(base, locales, publish_all, locales_included)
+            token.check()
+            report(40, "Validating")
+            errors = validate_content_package(payload, schema_path)
+            if errors:
+                return False, errors, save_errors
+            token.check()
+            report(80, "Saving")
+            saved = save_json(path, payload, on_error=lambda title, message: save_errors.append((title, message)))
+            return saved, errors, save_errors
+
+        def done(outcome: Tuple[bool, List[str], List[Tuple[str, str]]]) -> None:
+            saved, errors, save_errors = outcome
+            if errors:
+                QMessageBox.critical(self, "Schema error", "\n".join(errors))
+                return
+            for title, message in save_errors:
+                self._show_error(title, message)
+            if saved:
+                QMessageBox.information(self, "Exported", f"Saved to {path}")
+
+        def finished() -> None:
+            self.export_button.setEnabled(True)
+            self.export_button.setText("Export Translator Package JSON")
+
+        def failed(message: str) -> None:
+            finished()
+            self._show_error("Export error", f"Failed to export package: {message}")
+
+        def cancelled() -> None:
+            finished()
+            info("Export cancelled.")
+
+        # The blog index loads through the same runner, so the button follows the export task only.
+        self.export_button.setEnabled(False)
+        self._tasks.start(
+            "export",
+            work,
+            lambda outcome: (finished(), done(outcome)),
+            on_progress=lambda percent, message: self.export_button.setText(f"{message}... {percent}%"),
+            on_error=failed,
+            on_cancelled=cancelled
+        )
 
     def handle_export_admin(self) -> None:
         locales = self._collect_locales()
         payload = build_blog_admin_package(self.translation_key.text().strip(), locales)
         export_dir = get_outputs_dir() / "blog-admin"
         path = export_dir / f"{self.translation_key.text().strip()}-blog-admin.json"
-        if save_json(path, payload):
+        if save_json(path, payload, on_error=self._show_error):
             QMessageBox.information(self, "Exported", f"Saved to {path}")
 
     def handle_save_draft(self) -> None:
@@ -287,7 +375,7 @@ class MainWindow(QWidget):
             "locales": self._collect_locales()
         }
         draft_path = get_data_dir() / "drafts" / f"{self.translation_key.text().strip()}-translator.json"
-        save_json(draft_path, payload)
+        save_json(draft_path, payload, on_error=self._show_error)
 
     def handle_load_draft(self) -> None:
         draft_dir = get_data_dir() / "drafts"
@@ -296,7 +384,7 @@ class MainWindow(QWidget):
         )
         if not file_name:
             return
-        data = load_json(file_name)
+        data = load_json(file_name, on_error=self._show_error)
         if not data:
             return
         self.translation_key.setText(data.get("meta", {}).get("translationKey", ""))
@@ -320,4 +408,5 @@ class MainWindow(QWidget):
             self.locale_fields[locale]["affiliate_url"].setText(affiliate.get("url", ""))
             self.locale_fields[locale]["affiliate_disclosure"].setText(affiliate.get("disclosure", ""))
         self._apply_read_only_en()
+        self._refresh_blog_locales()
         warn(f"Draft loaded from {file_name}")